@@ -100,6 +100,10 @@ def mock_config(temp_vault: Path, temp_config_dir: Path, monkeypatch):
 
     yield helper
 
+    # Let background retrieval-count writes finish before the DB goes away
+    from tools.query import flush_retrieval_counts
+    flush_retrieval_counts()
+
     # Cleanup: Remove temporary database directory
     try:
         if os.path.exists(temp_db_dir):
@@ -131,6 +135,8 @@ def cleanup_chroma_client():
     from chromadb.api.shared_system_client import SharedSystemClient
 
     memory_module._chroma_client = None
+    memory_module._collection = None
+    memory_module._existing_files_cache = None
     SharedSystemClient.clear_system_cache()
 
 
@@ -11,6 +11,7 @@ from tools.format_support import (
     extract_title,
     find_heading_positions,
     find_code_block_ranges,
+    split_yaml_frontmatter,
     INDEXABLE_EXTENSIONS,
     EXTENSION_MAP,
     VALID_FORMATS,
@@ -139,12 +140,34 @@ class TestMarkdownFrontmatter:
         assert "foo" in fm.get("tags", "")
         assert "bar" in fm.get("tags", "")
 
+    def test_tags_list_unindented_and_quoted(self):
+        content = "---\ntags:\n- foo\n- \"bar baz\"\ntype: note\n---\nBody."
+        fm = parse_frontmatter(content, "markdown")
+        assert fm["tags"] == "foo,bar baz"
+        assert fm["type"] == "note"
+
+    def test_unterminated_frontmatter(self):
+        content = "---\ntitle: Test\n---"
+        assert parse_frontmatter(content, "markdown") == {}
+
     def test_strip_frontmatter(self):
         content = "---\ntitle: Test\n---\n# Title\nBody."
         stripped = strip_frontmatter(content, "markdown")
         assert "---" not in stripped
         assert "# Title" in stripped
 
+    def test_strip_without_frontmatter_returns_content(self):
+        content = "# Title\n---\nnot: frontmatter\n---\nBody."
+        assert strip_frontmatter(content, "markdown") is content
+
+    def test_split_yaml_frontmatter(self):
+        assert split_yaml_frontmatter("---\nname: t\n---\nBody\n---\nMore") == (
+            "name: t", "Body\n---\nMore")
+        assert split_yaml_frontmatter("No block\n---\n") == (None, "No block\n---\n")
+        assert split_yaml_frontmatter("---  \na: 1\n---x\n---  \nB") == ("a: 1\n---x", "B")
+        assert split_yaml_frontmatter("---\n---\nBody") == (None, "---\n---\nBody")
+        assert split_yaml_frontmatter("---\na: 1\n---") == (None, "---\na: 1\n---")
+
 
 class TestMarkdownTitle:
     """Tests for Markdown title extraction."""
@@ -161,6 +184,17 @@ class TestMarkdownTitle:
         content = "Body text."
         assert extract_title(content, "notes/cool-idea.md", "markdown") == "Cool Idea"
 
+    def test_h1_on_first_line(self):
+        assert extract_title("# First  \nBody.", "x.md", "markdown") == "First"
+
+    def test_hash_line_in_frontmatter_matches_first(self):
+        content = "---\n# yaml comment\n---\n# Real Title\nBody."
+        assert extract_title(content, "x.md", "markdown") == "yaml comment"
+
+    def test_blank_h1_falls_through(self):
+        content = "#   \nNot a title line\n# Later"
+        assert extract_title(content, "x.md", "markdown") == "Not a title line"
+
 
 class TestMarkdownHeadings:
     """Tests for Markdown heading detection."""
@@ -181,6 +215,12 @@ class TestMarkdownHeadings:
         assert positions[0][2] == "Real"
         assert positions[1][2] == "Also Real"
 
+    def test_heading_pattern_compiled_once_per_levels(self):
+        from tools.format_support import _md_heading_re
+        assert _md_heading_re((2, 3)) is _md_heading_re((2, 3))
+        positions = find_heading_positions("## A\n\n#### B", [2, 4], "markdown")
+        assert [p[1] for p in positions] == [2, 4]
+
 
 class TestMarkdownCodeBlocks:
     """Tests for Markdown code block range detection."""
@@ -70,6 +70,23 @@ class TestRunGitCommand:
         assert called_with_env is not None
         assert called_with_env.get("GIT_PAGER") == ""
 
+    def test_read_only_skips_optional_locks(self, mock_config, git_repo, monkeypatch):
+        """read_only=True passes --no-optional-locks before the subcommand."""
+        called_with = None
+        original_run = subprocess.run
+
+        def mock_run(*args, **kwargs):
+            nonlocal called_with
+            called_with = args[0]
+            return original_run(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+        success, _ = run_git_command(["status"], read_only=True)
+
+        assert success is True
+        assert called_with == ["git", "--no-optional-locks", "status"]
+
     def test_vault_not_configured_returns_permission_denied(self, no_config):
         """Returns permission denied when vault not configured."""
         success, result = run_git_command(["status"])
@@ -58,8 +58,52 @@ class TestGetStatus:
 
         assert result["success"] is True
         assert len(result["untracked"]) > 0
+
+    def test_untracked_files_also_unstaged(self, mock_config, git_repo):
+        """Untracked files are listed under unstaged too (dirty-tree checks rely on it)."""
+        (git_repo / "untracked.txt").write_text("new file")
+
+        result = get_status()
+
+        assert "untracked.txt" in result["untracked"]
+        assert "untracked.txt" in result["unstaged"]
         assert any("untracked" in f for f in result["untracked"])
 
+    def test_special_characters_in_paths(self, mock_config, git_repo):
+        """Paths with spaces or non-ASCII characters are returned unquoted."""
+        import os
+        (git_repo / "my note.txt").write_text("staged")
+        os.system(f"cd {git_repo} && git add 'my note.txt'")
+        (git_repo / "café.txt").write_text("untracked")
+
+        result = get_status()
+
+        assert result["success"] is True
+        assert result["staged"] == ["my note.txt"]
+        assert result["untracked"] == ["café.txt"]
+
+    def test_only_untracked(self, mock_config, git_repo):
+        """only_untracked reports presence of untracked files without lists."""
+        assert get_status(only_untracked=True) == {"success": True, "has_untracked": False}
+
+        (git_repo / "new.txt").write_text("untracked")
+        result = get_status(only_untracked=True)
+
+        assert result == {"success": True, "has_untracked": True}
+
+    def test_max_entries_truncates(self, mock_config, git_repo):
+        """max_entries stops parsing early and flags the result."""
+        for i in range(3):
+            (git_repo / f"u{i}.txt").write_text("untracked")
+
+        limited = get_status(max_entries=2)
+        assert len(limited["untracked"]) == 2
+        assert limited["truncated"] is True
+
+        full = get_status(max_entries=3)
+        assert len(full["untracked"]) == 3
+        assert "truncated" not in full
+
     def test_mixed_status(self, mock_config, git_repo):
         """Handles mix of staged, unstaged, and untracked."""
         import os
@@ -102,6 +146,19 @@ class TestGetStatus:
         assert "error" in result
 
 
+class TestIterRecords:
+    """Test NUL-terminated record splitting used by get_status."""
+
+    def test_splits_terminated_records(self):
+        from tools.git_ops import _iter_records
+        assert list(_iter_records("a\0b c\0")) == ["a", "b c"]
+
+    def test_unterminated_tail_and_empty(self):
+        from tools.git_ops import _iter_records
+        assert list(_iter_records("a\0tail")) == ["a", "tail"]
+        assert list(_iter_records("")) == []
+
+
 class TestParseLastCommit:
     """Test parse_last_commit function."""
 
@@ -131,6 +188,46 @@ class TestParseLastCommit:
         if result["protocol_tag"]:
             assert result["protocol_tag"].startswith("[JARVIS:")
 
+    def test_parses_all_fields_from_jarvis_commit(self, mock_config, git_repo_with_jarvis_commits):
+        """Hash, subject, tag, and file count come from the same commit."""
+        import subprocess
+        expected_hash = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=git_repo_with_jarvis_commits, capture_output=True, text=True
+        ).stdout.strip()
+
+        result = parse_last_commit()
+
+        assert result["success"] is True
+        assert result["commit_hash"] == expected_hash
+        assert result["subject"] == "Jarvis EDIT: Update test note"
+        assert result["protocol_tag"] == "[JARVIS:Ea]"
+        assert result["files_changed"] == 1
+
+    def test_merge_commit_counts_files_against_first_parent(self, mock_config, git_repo):
+        """Merge commits report files changed relative to the first parent."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=git_repo, check=True, capture_output=True)
+
+        git("checkout", "-q", "-b", "side")
+        (git_repo / "side-a.md").write_text("a")
+        (git_repo / "side-b.md").write_text("b")
+        git("add", "side-a.md", "side-b.md")
+        git("commit", "-q", "-m", "Side work")
+        git("checkout", "-q", "-")
+        (git_repo / "main-only.md").write_text("main")
+        git("add", "main-only.md")
+        git("commit", "-q", "-m", "Main work")
+        git("merge", "-q", "--no-ff", "-m", "Merge side", "side")
+
+        result = parse_last_commit()
+
+        assert result["success"] is True
+        assert result["subject"] == "Merge side"
+        assert result["files_changed"] == 2
+
     def test_no_protocol_tag_returns_none(self, mock_config, git_repo):
         """Returns None for protocol_tag when not present."""
         result = parse_last_commit()
@@ -366,6 +463,19 @@ class TestQueryHistory:
         assert "count" in result
         assert isinstance(result["operations"], list)
 
+    def test_subject_with_pipe_preserved(self, mock_config, git_repo):
+        """Subjects containing '|' are returned whole with the right date."""
+        import os
+        (git_repo / "pipe.txt").write_text("pipe")
+        os.system(f'cd {git_repo} && git add pipe.txt && git commit -q -m "Jarvis EDIT: a | b | c"')
+
+        result = query_history(operation="edit", limit=5)
+
+        assert result["count"] == 1
+        op = result["operations"][0]
+        assert op["subject"] == "Jarvis EDIT: a | b | c"
+        assert op["date"][:4].isdigit()
+
     def test_filter_by_create(self, mock_config, git_repo_with_jarvis_commits):
         """Filter by create operation."""
         result = query_history(operation="create", limit=10)
@@ -459,6 +569,30 @@ class TestRollbackCommit:
 
         assert "revert_hash" in result
 
+    def test_revert_hash_from_summary_line(self, mock_config, git_repo_with_jarvis_commits, monkeypatch):
+        """Real revert: hash is read from git's summary, no rev-parse needed."""
+        import subprocess
+        from tools import git_ops as git_ops_module
+
+        calls = []
+        real_run = git_ops_module.run_git_command
+
+        def spy(args, *other, **kwargs):
+            calls.append(args[0])
+            return real_run(args, *other, **kwargs)
+
+        monkeypatch.setattr(git_ops_module, "run_git_command", spy)
+
+        result = rollback_commit("HEAD")
+
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=git_repo_with_jarvis_commits, capture_output=True, text=True
+        ).stdout.strip()
+        assert result["success"] is True
+        assert head.startswith(result["revert_hash"])
+        assert calls == ["revert"]
+
     def test_invalid_commit_fails(self, mock_config, git_repo):
         """Fails with invalid commit hash."""
         result = rollback_commit("invalid_hash_12345")
@@ -570,6 +704,58 @@ class TestRewriteCommitMessages:
         assert "old_hashes" in result
         assert "new_hashes" in result
 
+    def test_single_commit_amends_message_only(self, mock_config, git_repo):
+        """count=1 strips matching lines by amend and leaves the index alone."""
+        import subprocess
+
+        def git(*args):
+            return subprocess.run(["git", *args], cwd=git_repo,
+                                  capture_output=True, text=True).stdout
+
+        (git_repo / "note.txt").write_text("note")
+        git("add", "note.txt")
+        git("commit", "-q", "-m", "Add note", "-m", "Co-Authored-By: Bot <bot@example.com>")
+        (git_repo / "staged.txt").write_text("staged")
+        git("add", "staged.txt")
+
+        result = rewrite_commit_messages(count=1)
+
+        assert result["success"] is True
+        assert result["old_hashes"] != result["new_hashes"]
+        assert git("log", "-1", "--format=%B").strip() == "Add note"
+        assert "staged.txt" not in git("show", "--name-only", "--format=", "HEAD")
+        assert "staged.txt" in git("diff", "--cached", "--name-only")
+
+    def test_multi_commit_uses_python_regex(self, mock_config, git_repo, monkeypatch):
+        """count > 1 applies the same Python re matching as the amend path."""
+        import subprocess
+        from tools import git_common
+        # Skip filter-branch's warning pause
+        monkeypatch.setitem(git_common.GIT_ENV, "FILTER_BRANCH_SQUELCH_WARNING", "1")
+
+        def git(*args):
+            return subprocess.run(["git", *args], cwd=git_repo,
+                                  capture_output=True, text=True).stdout
+
+        for name in ("one", "two"):
+            (git_repo / f"{name}.txt").write_text(name)
+            git("add", f"{name}.txt")
+            git("commit", "-q", "-m", f"Add {name}",
+                "-m", "co-authored-by: Bot <bot@example.com>\nKeep me")
+
+        result = rewrite_commit_messages(count=2, patterns=[r"(?i)^co-authored-by:\s+\w+"])
+
+        assert result["success"] is True
+        assert git("log", "-1", "--format=%B").strip() == "Add two\n\nKeep me"
+        assert git("log", "-1", "--skip=1", "--format=%B").strip() == "Add one\n\nKeep me"
+
+    def test_invalid_pattern_rejected(self, mock_config, git_repo):
+        """A pattern Python re cannot compile fails before any rewrite."""
+        result = rewrite_commit_messages(count=2, patterns=["("])
+
+        assert result["success"] is False
+        assert "Invalid pattern" in result["error"]
+
     def test_count_exceeds_commits(self, mock_config, git_repo, monkeypatch):
         """Handles count exceeding available commits."""
         from tools import git_ops as git_ops_module
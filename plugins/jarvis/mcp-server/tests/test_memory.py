@@ -3,7 +3,7 @@ import os
 import pytest
 from tools.memory import (
     _parse_frontmatter_for_file, _extract_title_for_file, _build_metadata,
-    _should_skip, index_vault, index_file,
+    _skip_dirs, index_vault, index_file,
 )
 
 
@@ -104,34 +104,120 @@ class TestBuildMetadata:
         assert _build_metadata({}, "docs/readme.md")["vault_type"] == "docs"
         assert _build_metadata({}, ".jarvis/strategic/traj.md")["vault_type"] == "strategic"
 
+    def test_now_iso_used_as_timestamp_fallback(self):
+        """Passed-in now_iso fills created/updated when frontmatter lacks them."""
+        meta = _build_metadata({"created": "2026-01-01"}, "notes/a.md",
+                               now_iso="2026-02-02T00:00:00Z")
+        assert meta["created_at"] == "2026-01-01"
+        assert meta["updated_at"] == "2026-02-02T00:00:00Z"
+
     def test_vault_type_root_level_file(self):
         """Root-level files (no directory) get vault_type 'document'."""
         assert _build_metadata({}, "README.md")["vault_type"] == "document"
 
 
-class TestShouldSkip:
-    """Tests for file skip logic."""
-
-    def test_skip_obsidian(self):
-        assert _should_skip(".obsidian/plugins/foo.md", False) is True
-
-    def test_skip_git(self):
-        assert _should_skip(".git/config", False) is True
+class TestSkipDirs:
+    """Tests for the top-level directories excluded from indexing."""
 
     def test_skip_templates(self):
-        assert _should_skip("templates/daily.md", False) is True
+        assert "templates" in _skip_dirs(include_sensitive=False)
 
     def test_skip_sensitive_by_default(self):
-        assert _should_skip("documents/passport.md", False) is True
-        assert _should_skip("people/john.md", False) is True
+        skip = _skip_dirs(include_sensitive=False)
+        assert "documents" in skip
+        assert "people" in skip
 
     def test_include_sensitive_when_requested(self):
-        assert _should_skip("documents/passport.md", True) is False
-        assert _should_skip("people/john.md", True) is False
+        skip = _skip_dirs(include_sensitive=True)
+        assert "documents" not in skip
+        assert "people" not in skip
 
     def test_allow_normal_dirs(self):
-        assert _should_skip("notes/my-note.md", False) is False
-        assert _should_skip("journal/jarvis/2026/01/entry.md", False) is False
+        skip = _skip_dirs(include_sensitive=False)
+        assert "notes" not in skip
+        assert "journal" not in skip
+
+    def test_root_files_never_skipped(self):
+        # The walker reports root-level files with an empty top_dir
+        assert "" not in _skip_dirs(include_sensitive=False)
+
+
+class TestWalkIndexable:
+    """Tests for the single-pass indexable file walker."""
+
+    def test_finds_nested_files_of_all_formats(self, tmp_path):
+        from tools.memory import _walk_indexable
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.md").write_text("x")
+        (tmp_path / "a" / "b" / "deep.org").write_text("x")
+        (tmp_path / "a" / "image.png").write_text("x")
+
+        found = {rel: top for _, rel, top in _walk_indexable(str(tmp_path))}
+        assert found == {"top.md": "", os.path.join("a", "b", "deep.org"): "a"}
+
+    def test_relative_paths_under_rel_root(self, tmp_path):
+        from tools.memory import _walk_indexable
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "note.md").write_text("x")
+
+        found = list(_walk_indexable(str(tmp_path), "notes"))
+        assert found == [(str(tmp_path / "sub" / "note.md"),
+                          os.path.join("notes", "sub", "note.md"), "notes")]
+
+    def test_skips_hidden_entries(self, tmp_path):
+        from tools.memory import _walk_indexable
+        (tmp_path / ".obsidian").mkdir()
+        (tmp_path / ".obsidian" / "workspace.md").write_text("x")
+        (tmp_path / ".hidden.md").write_text("x")
+        (tmp_path / "visible.md").write_text("x")
+
+        found = [rel for _, rel, _ in _walk_indexable(str(tmp_path))]
+        assert found == ["visible.md"]
+
+
+class TestReadAhead:
+    """Tests for the bounded read-ahead used by index_vault."""
+
+    def test_results_in_order_with_bounded_in_flight(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        import tools.memory as mem
+        monkeypatch.setattr(mem, "_READ_AHEAD", 2)
+        candidates = []
+        for i in range(5):
+            path = tmp_path / f"n{i}.md"
+            path.write_text(f"# Note {i}\n\nBody.")
+            candidates.append((str(path), f"n{i}.md"))
+
+        submitted = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            real_submit = pool.submit
+            monkeypatch.setattr(pool, "submit",
+                                lambda *a: submitted.append(a[2]) or real_submit(*a))
+            results = mem._read_ahead(pool, candidates)
+            first = next(results)
+            assert len(submitted) == 2
+            rest = list(results)
+
+        assert [r[0] for r in [first] + rest] == [f"n{i}.md" for i in range(5)]
+        assert first[4] == "Note 0"
+
+
+class TestEmbedProviders:
+    """Tests for JARVIS_EMBED_DEVICE provider selection."""
+
+    @pytest.mark.parametrize("device,available,expected", [
+        ("auto", ["CUDAExecutionProvider", "CPUExecutionProvider"],
+         ["CUDAExecutionProvider", "CPUExecutionProvider"]),
+        ("auto", ["AzureExecutionProvider", "CPUExecutionProvider"], ["CPUExecutionProvider"]),
+        ("cpu", ["CUDAExecutionProvider", "CPUExecutionProvider"], ["CPUExecutionProvider"]),
+        ("cuda", ["CPUExecutionProvider"], ["CPUExecutionProvider"]),
+    ])
+    def test_provider_selection(self, monkeypatch, device, available, expected):
+        import onnxruntime
+        from tools.memory import _embed_providers
+        monkeypatch.setenv("JARVIS_EMBED_DEVICE", device)
+        monkeypatch.setattr(onnxruntime, "get_available_providers", lambda: available)
+        assert _embed_providers() == expected
 
 
 class TestIndexVault:
@@ -157,7 +243,7 @@ class TestIndexVault:
         result = index_vault()
         assert result["success"] is True
         assert result["files_indexed"] >= 2
-        assert result["collection_total"] >= 2
+        assert "collection_total" not in result
 
         # Verify IDs have vault:: prefix
         collection = mem._get_collection()
@@ -190,6 +276,200 @@ class TestIndexVault:
 
         mem._chroma_client = None
 
+    def test_force_reindex_replaces_stale_chunks(self, mock_config):
+        """Force re-index should drop old chunks of re-indexed files."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_force_db")})
+
+        notes_dir = mock_config.vault_path / "notes"
+        notes_dir.mkdir(exist_ok=True)
+        note = notes_dir / "shrinking.md"
+        note.write_text("\n\n".join([
+            f"## Section {i}\n\n" + f"Content {i}. " * 60
+            for i in range(3)
+        ]))
+        (notes_dir / "stable.md").write_text("# Stable\n\nUnchanged content.")
+
+        first = index_vault()
+        assert first["files_indexed"] == 2
+
+        note.write_text("# Shrinking\n\nShort now.")
+        second = index_vault(force=True)
+        assert second["success"] is True
+        assert second["files_indexed"] == 2
+
+        all_ids = mem._get_collection().get()["ids"]
+        assert [i for i in all_ids if "shrinking.md" in i] == ["vault::notes/shrinking.md"]
+        assert "vault::notes/stable.md" in all_ids
+
+        mem._chroma_client = None
+
+    def test_force_reindex_removes_legacy_doc(self, mock_config):
+        """Force re-index should drop legacy single-doc IDs without parent_file."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_force_legacy_db")})
+
+        (mock_config.vault_path / "notes" / "legacy.md").write_text("\n\n".join([
+            f"## Section {i}\n\n" + f"Content {i}. " * 60
+            for i in range(3)
+        ]))
+        collection = mem._get_collection()
+        collection.upsert(ids=["vault::notes/legacy.md"], documents=["old"],
+                          metadatas=[{"type": "vault"}])
+
+        result = index_vault(force=True)
+        assert result["files_indexed"] == 1
+
+        ids = mem._get_collection().get()["ids"]
+        assert "vault::notes/legacy.md" not in ids
+        assert all(i.startswith("vault::notes/legacy.md#chunk-") for i in ids)
+
+        mem._chroma_client = None
+
+    def test_force_reindex_keeps_chunks_of_unreadable_file(self, mock_config):
+        """Force re-index must not drop chunks of a file it failed to re-read."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_force_keep_db")})
+
+        notes_dir = mock_config.vault_path / "notes"
+        notes_dir.mkdir(exist_ok=True)
+        broken = notes_dir / "broken.md"
+        broken.write_text("# Broken\n\nReadable for now.")
+        (notes_dir / "fine.md").write_text("# Fine\n\nStill readable.")
+
+        first = index_vault()
+        assert first["files_indexed"] == 2
+
+        broken.write_bytes(b"# Broken\n\n\xff\xfe not utf-8")
+        second = index_vault(force=True)
+        assert second["files_indexed"] == 1
+        assert [e["file"] for e in second["errors"]] == ["notes/broken.md"]
+
+        all_ids = mem._get_collection().get()["ids"]
+        assert "vault::notes/broken.md" in all_ids
+        assert "vault::notes/fine.md" in all_ids
+
+        mem._chroma_client = None
+
+    def test_unreadable_file_reported_without_aborting(self, mock_config):
+        """A file that fails to read is reported; the rest still get indexed."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_read_err_db")})
+
+        notes_dir = mock_config.vault_path / "notes"
+        (notes_dir / "good.md").write_text("# Good\n\nReadable content.")
+        (notes_dir / "bad.md").write_bytes(b"# Bad\n\n\xff\xfe not utf-8")
+        (notes_dir / "empty.md").write_text("   \n")
+
+        result = index_vault()
+        assert result["success"] is True
+        assert result["files_indexed"] == 1
+        assert [e["file"] for e in result["errors"]] == ["notes/bad.md"]
+        assert result["error_count"] == 1
+        assert result["files_skipped"] >= 1
+
+        mem._chroma_client = None
+
+    def test_reported_errors_capped(self, mock_config, monkeypatch):
+        """Only the first _MAX_REPORTED_ERRORS errors are listed; all are counted."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_err_cap_db")})
+        monkeypatch.setattr(mem, "_MAX_REPORTED_ERRORS", 2)
+        for i in range(4):
+            (mock_config.vault_path / "notes" / f"bad-{i}.md").write_bytes(b"\xff\xfe bad")
+
+        result = index_vault()
+        assert result["error_count"] == 4
+        assert len(result["errors"]) == 2
+
+        mem._chroma_client = None
+
+    def test_indexed_files_not_opened_on_incremental_run(self, mock_config, monkeypatch):
+        """Non-force runs skip already-indexed files without reading them."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_noread_db")})
+        (mock_config.vault_path / "notes" / "old.md").write_text("# Old\n\nIndexed already.")
+        assert index_vault()["files_indexed"] == 1
+
+        (mock_config.vault_path / "notes" / "new.md").write_text("# New\n\nFresh note.")
+        reads = []
+        real_read = mem._read_for_index
+        monkeypatch.setattr(mem, "_read_for_index",
+                            lambda fp, rel: reads.append(rel) or real_read(fp, rel))
+
+        result = index_vault()
+        assert result["files_indexed"] == 1
+        assert reads == [os.path.join("notes", "new.md")]
+
+        mem._chroma_client = None
+
+    def test_existing_files_scan_is_paginated(self, mock_config, monkeypatch):
+        """The existing-files scan pages through the collection."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_scan_page_db")})
+        for i in range(5):
+            (mock_config.vault_path / "notes" / f"page-{i}.md").write_text(f"# Page {i}\n\nBody.")
+        assert index_vault()["files_indexed"] == 5
+
+        monkeypatch.setattr(mem, "_SCAN_PAGE_SIZE", 2)
+        existing = mem._scan_existing_files(mem._get_collection())
+        assert existing == {f"notes/page-{i}.md" for i in range(5)}
+
+        mem._chroma_client = None
+
+    def test_existing_files_cached_between_runs(self, mock_config, monkeypatch):
+        """Repeat runs reuse the cached existing-files set instead of rescanning."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_cache_db")})
+        (mock_config.vault_path / "notes" / "cached.md").write_text("# Cached\n\nContent.")
+
+        scans = []
+        real_scan = mem._scan_existing_files
+        monkeypatch.setattr(mem, "_scan_existing_files",
+                            lambda c: scans.append(1) or real_scan(c))
+
+        assert index_vault()["files_indexed"] == 1
+        second = index_vault()
+        assert second["files_indexed"] == 0
+        assert len(scans) == 1
+
+        # Unindexing updates the cache so the next run picks the file up again
+        mem.unindex_file("notes/cached.md")
+        assert index_vault()["files_indexed"] == 1
+        assert len(scans) == 1
+
+        mem._chroma_client = None
+
+    def test_batches_embedded_with_shared_embedder(self, mock_config, monkeypatch):
+        """Every flushed batch is embedded by the one shared embedder."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_embed_db")})
+        monkeypatch.setattr(mem, "_BATCH_SIZE", 2)
+        for i in range(5):
+            (mock_config.vault_path / "notes" / f"embed-{i}.md").write_text(f"# Note {i}\n\nBody {i}.")
+
+        real_embedder = mem._get_embedder()
+        embedded = []
+        monkeypatch.setattr(mem, "_get_embedder",
+                            lambda: lambda docs: embedded.append(len(docs)) or real_embedder(docs))
+
+        result = index_vault()
+        assert result["files_indexed"] == 5
+        assert sum(embedded) == 5
+        assert len(embedded) == 3
+        assert mem._get_collection().get(where={"parent_file": "notes/embed-4.md"})["ids"]
+
+        mem._chroma_client = None
+
 
 class TestIndexFile:
     """Tests for single file indexing."""
@@ -231,6 +511,102 @@ class TestCollectionCreation:
 
         collection = mem._get_collection()
         assert collection.name == "jarvis"
+        hnsw = collection.configuration_json["hnsw"]
+        assert hnsw["space"] == "cosine"
+        assert hnsw["max_neighbors"] == 16
+        assert hnsw["ef_construction"] == 400
+
+        mem._chroma_client = None
+
+    def test_opens_collection_persisted_with_default_function(self, mock_config):
+        """A collection stored with Chroma's default embedding function still opens."""
+        import chromadb
+        import tools.memory as mem
+        mem._chroma_client = None
+        db_path = mock_config.vault_path / ".test_legacy_ef_db"
+        legacy = chromadb.PersistentClient(path=str(db_path)).create_collection(
+            name="jarvis", metadata={"hnsw:space": "cosine"}
+        )
+        legacy.add(ids=["vault::notes/old.md"], documents=["legacy document"],
+                   embeddings=[[1.0] + [0.0] * 383])
+        assert legacy.configuration_json["embedding_function"]["name"] == "default"
+        mock_config.set(memory={"db_path": str(db_path)})
+
+        collection = mem._get_collection()
+        assert collection.configuration_json["embedding_function"]["name"] == "default"
+        assert collection.get(ids=["vault::notes/old.md"])["documents"] == ["legacy document"]
+        assert collection.query(query_texts=["legacy"], n_results=1)["ids"] == [["vault::notes/old.md"]]
+
+        mem._chroma_client = None
+
+    def test_collection_embeds_with_shared_function(self, mock_config):
+        """Upserts embed through the collection's shared embedding function."""
+        import tools.memory as mem
+        assert mem._get_collection()._embedding_function is mem._EMBEDDING_FUNCTION
+
+    def test_collection_memoized_per_client(self, mock_config):
+        """Repeat calls reuse one collection handle until the client changes."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_memo_db")})
+
+        first = mem._get_collection()
+        assert mem._get_collection() is first
+
+        mem._chroma_client = None
+        assert mem._get_collection() is not first
+
+        mem._chroma_client = None
+
+    def test_concurrent_first_calls_open_one_client(self, mock_config, monkeypatch):
+        """Racing first calls construct a single PersistentClient and collection."""
+        import threading
+        import time
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_race_db")})
+
+        created = []
+        real_client = mem.chromadb.PersistentClient
+
+        def slow_client(**kwargs):
+            created.append(kwargs["path"])
+            time.sleep(0.05)
+            return real_client(**kwargs)
+
+        monkeypatch.setattr(mem.chromadb, "PersistentClient", slow_client)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(mem._get_collection()))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(created) == 1
+        assert all(c is results[0] for c in results)
+
+        mem._chroma_client = None
+
+    def test_collection_embeds_with_shared_embedder(self, mock_config, monkeypatch):
+        """Collection writes and queries reuse the shared embedder."""
+        import tools.memory as mem
+        mem._chroma_client = None
+        mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_shared_embed_db")})
+
+        real_embedder = mem._get_embedder()
+        calls = []
+        monkeypatch.setattr(mem, "_embedder",
+                            lambda docs: calls.append(list(docs)) or real_embedder(docs))
+
+        collection = mem._get_collection()
+        collection.add(ids=["a"], documents=["hello world"])
+        assert collection.query(query_texts=["hello"], n_results=1)["ids"] == [["a"]]
+        assert calls == [["hello world"], ["hello"]]
+
+        # Reopening the collection keeps the persisted default embedding function
+        mem._chroma_client = None
+        assert mem._get_collection().count() == 1
 
         mem._chroma_client = None
 
@@ -40,6 +40,21 @@ class TestMemoryWrite:
 
         _cleanup_chromadb()
 
+    def test_write_metadata_timestamps_match_file(self, mock_config):
+        _reset_chromadb(mock_config)
+        import re
+        import tools.memory as mem
+        from tools.memory_files import read_memory_file
+
+        result = memory_write(name="stamped", content="Timestamps.")
+        meta = mem._get_collection().get(ids=[result["id"]])["metadatas"][0]
+        fm = read_memory_file(result["path"])["metadata"]
+        assert meta["created_at"] == fm["created"]
+        assert meta["updated_at"] == fm["modified"]
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", meta["updated_at"])
+
+        _cleanup_chromadb()
+
     def test_write_project_scope(self, mock_config):
         _reset_chromadb(mock_config)
 
@@ -237,6 +252,27 @@ class TestMemoryList:
 
         _cleanup_chromadb()
 
+    def test_list_indexed_status_single_lookup(self, mock_config, monkeypatch):
+        _reset_chromadb(mock_config)
+        import tools.memory as mem
+
+        memory_write(name="still-indexed", content="Kept")
+        memory_write(name="gone-stale", content="Dropped")
+        collection = mem._get_collection()
+        collection.delete(ids=["memory::global::gone-stale"])
+
+        calls = []
+        real_get = collection.get
+        monkeypatch.setattr(collection, "get",
+                            lambda **kw: calls.append(kw) or real_get(**kw))
+
+        status = {m["name"]: m["indexed"] for m in memory_list()["memories"]}
+        assert status["still-indexed"] is True
+        assert status["gone-stale"] is False
+        assert len(calls) == 1
+
+        _cleanup_chromadb()
+
     def test_list_empty(self, mock_config):
         _reset_chromadb(mock_config)
 
@@ -40,6 +40,32 @@ class TestValidateName:
     def test_trailing_hyphen_rejected(self):
         assert validate_name("trailing-") is not None
 
+    def test_single_invalid_char_too_short(self):
+        assert "too short" in validate_name("-").lower()
+        assert "too short" in validate_name("A").lower()
+
+    def test_trailing_newline_rejected(self):
+        assert validate_name("name\n") is not None
+
+
+class TestUtcNowIso:
+    """Tests for the cached UTC timestamp helper."""
+
+    def test_matches_strftime(self, monkeypatch):
+        import tools.memory_files as mf
+        from datetime import datetime, timezone
+        monkeypatch.setattr(mf.time, "time", lambda: 1770494400.75)
+        expected = datetime.fromtimestamp(1770494400, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        assert mf._utcnow_iso() == expected == "2026-02-07T20:00:00Z"
+
+    def test_formats_once_per_second(self, monkeypatch):
+        import tools.memory_files as mf
+        monkeypatch.setattr(mf.time, "time", lambda: 1770494401.2)
+        first = mf._utcnow_iso()
+        monkeypatch.setattr(mf.time, "gmtime", lambda s: pytest.fail("reformatted"))
+        monkeypatch.setattr(mf.time, "time", lambda: 1770494401.9)
+        assert mf._utcnow_iso() is first
+
 
 class TestFrontmatter:
     """Tests for frontmatter generation and parsing."""
@@ -69,6 +95,17 @@ class TestFrontmatter:
         assert parsed["project"] == "my-app"
         assert parsed["scope"] == "project"
 
+    def test_format_exact_output(self):
+        assert _format_frontmatter(
+            name="n", scope="project", importance="low", tags=["a", "b"], version=2,
+            created="c", modified="m", project="app",
+        ) == ("---\nname: n\nscope: project\nproject: app\nimportance: low\n"
+              "tags:\n  - a\n  - b\ncreated: c\nmodified: m\nversion: 2\n---\n")
+        assert _format_frontmatter(
+            name="n", scope="global", importance="low", tags=[], version=1,
+            created="c", modified="m", project="ignored",
+        ) == "---\nname: n\nscope: global\nimportance: low\ncreated: c\nmodified: m\nversion: 1\n---\n"
+
     def test_strip_frontmatter(self):
         content = "---\nname: test\n---\n# Body\n\nText here."
         body = _strip_frontmatter(content)
@@ -79,12 +116,56 @@ class TestFrontmatter:
         parsed = _parse_memory_frontmatter("Just plain text.")
         assert parsed == {}
 
+    def test_parse_tag_list_single_pass(self):
+        content = ("---\nsubtags:\ntags:\n  - a\n\n  - 'b c'\n"
+                   "importance: high\nversion: 2\n---\nBody")
+        parsed = _parse_memory_frontmatter(content)
+        assert parsed["tags"] == ["a", "b c"]
+        assert parsed["importance"] == "high"
+        assert parsed["version"] == 2
+
     def test_parse_version_as_int(self):
         content = "---\nname: test\nversion: 3\n---\nBody"
         parsed = _parse_memory_frontmatter(content)
         assert parsed["version"] == 3
         assert isinstance(parsed["version"], int)
 
+    def test_read_frontmatter_from_head(self, tmp_path):
+        from tools.memory_files import _read_memory_frontmatter
+        path = tmp_path / "big.md"
+        path.write_text("---\nname: big\nversion: 2\n---\n" + "body é\n" * 5000, encoding="utf-8")
+        assert _read_memory_frontmatter(str(path)) == {"name": "big", "version": 2}
+
+    def test_read_frontmatter_longer_than_head(self, tmp_path):
+        from tools.memory_files import _read_memory_frontmatter, _HEAD_BYTES
+        path = tmp_path / "long-fm.md"
+        notes = "x" * (_HEAD_BYTES + 100)
+        path.write_text(f"---\nname: long\nnotes: {notes}\n---\nBody", encoding="utf-8")
+        fm = _read_memory_frontmatter(str(path))
+        assert fm["name"] == "long"
+        assert fm["notes"] == notes
+
+    def test_read_frontmatter_skips_body_without_block(self, tmp_path, monkeypatch):
+        import tools.memory_files as mf
+        path = tmp_path / "plain.md"
+        path.write_text("# No frontmatter\n" + "x" * 50000, encoding="utf-8")
+        reads = []
+        real_read = os.read
+        monkeypatch.setattr(mf.os, "read", lambda fd, n: reads.append(n) or real_read(fd, n))
+        assert mf._read_memory_frontmatter(str(path)) == {}
+        assert reads == [mf._HEAD_BYTES]
+
+    @pytest.mark.parametrize("pad", [-5, -4, -3, -1, 0, 1])
+    def test_read_frontmatter_closing_at_head_boundary(self, tmp_path, pad):
+        from tools.memory_files import _read_memory_frontmatter, _HEAD_BYTES
+        prefix = "---\nname: edge\nnotes: "
+        notes = "y" * (_HEAD_BYTES - len(prefix) - 4 + pad)
+        path = tmp_path / "edge.md"
+        path.write_text(f"{prefix}{notes}\n---  \nBody " + "z" * 9000, encoding="utf-8")
+        fm = _read_memory_frontmatter(str(path))
+        assert fm["name"] == "edge"
+        assert fm["notes"] == notes
+
 
 class TestResolveMemoryPath:
     """Tests for path resolution."""
@@ -126,6 +207,64 @@ class TestWriteAndReadMemoryFile:
         assert "Hello world." in read_result["body"]
         assert read_result["metadata"]["name"] == "test-write"
         assert read_result["metadata"]["importance"] == "high"
+        assert result["full_content"] == read_result["content"]
+
+    def test_write_stats_target_once(self, mock_config, monkeypatch):
+        import tools.memory_files as mf
+        path, _ = resolve_memory_path("test-stat", scope="global")
+        write_memory_file(path, "test-stat", "V1", "global", None, "medium", [], False)
+        checks = []
+        real_isfile = os.path.isfile
+        monkeypatch.setattr(mf.os.path, "isfile",
+                            lambda p: checks.append(p) or real_isfile(p))
+        result = write_memory_file(path, "test-stat", "V2", "global", None, "medium", [], True)
+        assert result["version"] == 2
+        assert result["created"] is False
+        assert checks == [path]
+
+    def test_write_is_atomic_replace(self, mock_config, monkeypatch):
+        import tools.memory_files as mf
+        path, _ = resolve_memory_path("test-atomic", scope="global")
+        write_memory_file(path, "test-atomic", "V1", "global", None, "medium", [], False)
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(mf.os, "replace", fail_replace)
+        result = write_memory_file(path, "test-atomic", "V2", "global", None, "medium", [], True)
+        assert result["success"] is False
+        assert "V1" in read_memory_file(path)["body"]
+        assert os.listdir(os.path.dirname(path)) == ["test-atomic.md"]
+
+    def test_write_syncs_unique_temp_file(self, mock_config, monkeypatch):
+        import tools.memory_files as mf
+        path, _ = resolve_memory_path("test-fsync", scope="global")
+        temps, synced = [], []
+        real_mkstemp, real_fsync = mf.tempfile.mkstemp, mf.os.fsync
+
+        def record_mkstemp(**kwargs):
+            fd, tmp = real_mkstemp(**kwargs)
+            temps.append(tmp)
+            return fd, tmp
+
+        monkeypatch.setattr(mf.tempfile, "mkstemp", record_mkstemp)
+        monkeypatch.setattr(mf.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+        write_memory_file(path, "test-fsync", "V1", "global", None, "medium", [], False)
+        write_memory_file(path, "test-fsync", "V2", "global", None, "medium", [], True)
+
+        assert len(set(temps)) == 2
+        assert all(os.path.dirname(t) == os.path.dirname(path) for t in temps)
+        assert len(synced) == 2
+        assert os.listdir(os.path.dirname(path)) == ["test-fsync.md"]
+
+    def test_write_uses_passed_timestamp(self, mock_config):
+        path, _ = resolve_memory_path("test-stamp", scope="global")
+        result = write_memory_file(
+            path=path, name="test-stamp", content="Body",
+            scope="global", project=None, importance="medium",
+            tags=[], overwrite=False, now_iso="2026-02-07T20:00:00Z",
+        )
+        assert result["created_at"] == result["modified_at"] == "2026-02-07T20:00:00Z"
+        assert read_memory_file(path)["metadata"]["modified"] == "2026-02-07T20:00:00Z"
 
     def test_overwrite_bumps_version(self, mock_config):
         path, _ = resolve_memory_path("test-version", scope="global")
@@ -162,6 +301,11 @@ class TestWriteAndReadMemoryFile:
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
+    def test_read_directory_not_found(self, tmp_path):
+        result = read_memory_file(str(tmp_path))
+        assert result["success"] is False
+        assert "not found" in result["error"].lower()
+
     def test_directory_auto_created(self, mock_config):
         path, _ = resolve_memory_path("auto-dir", scope="global")
         result = write_memory_file(
@@ -215,6 +359,64 @@ class TestListMemoryFiles:
         assert "tagged-mem" not in names
 
 
+    def test_list_all_scans_project_dirs(self, mock_config):
+        mock_config.set(memory={
+            "project_memories_path": str(mock_config.vault_path / ".jarvis" / "memories"),
+        })
+        path1, _ = resolve_memory_path("glob-mem", scope="global")
+        write_memory_file(path1, "glob-mem", "G", "global", None, "medium", [], False)
+        path2, _ = resolve_memory_path("proj-mem", scope="project", project="app")
+        write_memory_file(path2, "proj-mem", "P", "project", "app", "medium", [], False)
+        base = os.path.dirname(os.path.dirname(path2))
+        open(os.path.join(base, "stray.md"), "w").close()
+
+        results = {m["name"]: m for m in list_memory_files(scope="all")}
+        assert results["glob-mem"]["scope"] == "global"
+        assert results["proj-mem"]["project"] == "app"
+        assert results["proj-mem"]["path"] == path2
+        assert "stray" not in results
+
+    def test_list_all_without_project_base(self, mock_config):
+        mock_config.set(memory={
+            "project_memories_path": str(mock_config.vault_path / "no-such-dir"),
+        })
+        path, _ = resolve_memory_path("only-global", scope="global")
+        write_memory_file(path, "only-global", "G", "global", None, "medium", [], False)
+        assert [m["name"] for m in list_memory_files(scope="all")] == ["only-global"]
+
+    def test_list_reuses_parsed_frontmatter(self, mock_config, monkeypatch):
+        import tools.memory_files as mf
+        path, _ = resolve_memory_path("cached-mem", scope="global")
+        write_memory_file(path, "cached-mem", "A", "global", None, "high", ["t"], False)
+        list_memory_files(scope="global")
+
+        reads = []
+        real_read = mf._read_memory_frontmatter
+        monkeypatch.setattr(mf, "_read_memory_frontmatter",
+                            lambda p: reads.append(p) or real_read(p))
+        results = list_memory_files(scope="global")
+        assert reads == []
+        assert [m["importance"] for m in results if m["name"] == "cached-mem"] == ["high"]
+
+        write_memory_file(path, "cached-mem", "B", "global", None, "low", ["t"], True)
+        reads.clear()
+        results = list_memory_files(scope="global")
+        assert reads == [path]
+        assert [m["importance"] for m in results if m["name"] == "cached-mem"] == ["low"]
+
+    def test_frontmatter_cache_is_bounded(self, tmp_path, monkeypatch):
+        import tools.memory_files as mf
+        monkeypatch.setattr(mf, "_FM_CACHE", {})
+        monkeypatch.setattr(mf, "_FM_CACHE_MAX", 2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"m{i}.md"
+            path.write_text(f"---\nname: m{i}\n---\n", encoding="utf-8")
+            mf._cached_memory_frontmatter(str(path), os.stat(path))
+            paths.append(str(path))
+        assert list(mf._FM_CACHE) == paths[1:]
+
+
 class TestDeleteMemoryFile:
     """Tests for file deletion."""
 
@@ -33,6 +33,9 @@ class TestSlugify:
     def test_empty_string(self):
         assert _slugify("") == ""
 
+    def test_surrounding_whitespace_and_dashes_collapse(self):
+        assert _slugify("\t  My  -_- Note \n") == "my-note"
+
 
 class TestVaultId:
     """Tests for vault ID generation."""
@@ -193,6 +196,22 @@ class TestParseId:
         assert p.full_prefix == "vault::"
         assert p.content_id == "notes/Containers.md"
 
+    def test_parse_cached_per_id(self):
+        assert parse_id("obs::42") is parse_id("obs::42")
+
+    def test_parsed_id_is_immutable(self):
+        import dataclasses
+        p = parse_id("obs::42")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            p.content_id = "43"
+        assert hash(p) == hash(parse_id("obs::42"))
+
+    def test_parse_unknown_prefix_is_bare_path(self):
+        p = parse_id("notes::Containers.md")
+        assert p.namespace == "vault"
+        assert p.content_id == "notes::Containers.md"
+        assert p.tier == "file"
+
 
 class TestRoundTrip:
     """Test that generate -> parse produces consistent results."""
@@ -403,6 +422,17 @@ class TestGetTier:
         from tools.namespaces import get_tier, TIER_FILE
         assert get_tier("notes/test.md") == TIER_FILE
 
+    def test_matches_prefix_sets(self):
+        from tools.namespaces import (
+            get_tier, TIER_FILE, TIER_CHROMADB, TIER_1_PREFIXES, TIER_2_PREFIXES,
+        )
+        for prefix in TIER_1_PREFIXES:
+            assert get_tier(f"{prefix}x") == TIER_FILE
+        for prefix in TIER_2_PREFIXES:
+            assert get_tier(f"{prefix}x") == TIER_CHROMADB
+        assert get_tier("notes/obs::odd.md") == TIER_FILE
+        assert get_tier("observation::1") == TIER_FILE
+
 
 class TestNewIdGenerators:
     """Tests for new ID generators (relationship, hint, plan)."""
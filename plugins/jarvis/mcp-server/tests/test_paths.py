@@ -1,5 +1,6 @@
 """Tests for configurable path resolution (tools/paths.py)."""
 import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -120,6 +121,19 @@ class TestGetPathTemplateSubstitution:
         assert "2026" in path
         assert "{MM}" in path
 
+    def test_substituted_values_not_rescanned(self, mock_config):
+        mock_config.set(paths={"journal_summaries": "journal/{YYYY}/{MM}"})
+        path = get_path("journal_summaries", {"YYYY": "{MM}", "MM": "02"})
+        assert path.endswith(os.path.join("journal", "{MM}", "02"))
+
+    def test_non_identifier_keys_substituted(self, mock_config):
+        mock_config.set(paths={"notes": "notes/{project-name}/{1}"})
+        path = get_path("notes", {"project-name": "jarvis", "1": "one"})
+        assert path.endswith(os.path.join("notes", "jarvis", "one"))
+
+    def test_substitutions_ignored_without_placeholders(self, mock_config):
+        assert get_path("notes", {"YYYY": "2026"}) == get_path("notes")
+
 
 class TestGetPathEnsureExists:
     """ensure_exists=True creates the directory."""
@@ -136,6 +150,55 @@ class TestGetPathEnsureExists:
         assert path == path2
 
 
+    def test_recreates_directory_on_cache_hit(self, mock_config):
+        import shutil
+        path = get_path("inbox_todoist", ensure_exists=True)
+        shutil.rmtree(path)
+        assert get_path("inbox_todoist", ensure_exists=True) == path
+        assert os.path.isdir(path)
+
+
+class TestGetPathCache:
+    """get_path memoizes template lookups per loaded config."""
+
+    def test_template_lookup_cached(self, mock_config):
+        from tools import paths as paths_module
+        get_path("notes")
+        assert ("notes", None) in paths_module._PATH_CACHE
+
+    def test_deleted_vault_still_rejected(self, mock_config):
+        path = get_path("strategic")
+        shutil.rmtree(mock_config.vault_path)
+        with pytest.raises(ValueError, match="Vault directory not found"):
+            get_path("strategic", ensure_exists=True)
+        assert not os.path.exists(path)
+
+    def test_verified_vault_path_skips_verification(self, mock_config, monkeypatch):
+        import tools.config as config_module
+        monkeypatch.setattr(config_module, "get_verified_vault_path",
+                            lambda: pytest.fail("re-verified"))
+        path = get_path("notes", vault_path=str(mock_config.vault_path))
+        assert path == os.path.join(str(mock_config.vault_path), "notes")
+
+    def test_config_reload_invalidates(self, mock_config):
+        get_path("notes")
+        mock_config.set(paths={"notes": "my-notes"})
+        assert get_path("notes") == os.path.join(str(mock_config.vault_path), "my-notes")
+
+    def test_substitutions_are_part_of_key(self, mock_config):
+        a = get_path("journal_summaries", substitutions={"YYYY": "2025"})
+        b = get_path("journal_summaries", substitutions={"YYYY": "2026"})
+        assert a.endswith("2025/summaries")
+        assert b.endswith("2026/summaries")
+
+    def test_env_is_part_of_key(self, mock_config, monkeypatch, tmp_path):
+        get_path("db_path")
+        mock_config.set(memory={})
+        default = get_path("db_path")
+        monkeypatch.setenv("JARVIS_HOME", str(tmp_path))
+        assert get_path("db_path") == str(tmp_path / "memory_db") != default
+
+
 class TestGetPathErrors:
     """Error cases for get_path()."""
 
@@ -230,6 +293,11 @@ class TestValidatePathsConfig:
         warnings = validate_paths_config()
         assert any("traversal" in w for w in warnings)
 
+    def test_double_dot_in_name_not_traversal(self, mock_config):
+        mock_config.set(paths={"notes": "notes..archive"})
+        warnings = validate_paths_config()
+        assert not any("traversal" in w for w in warnings)
+
     def test_unknown_memory_key(self, mock_config):
         mock_config.set(memory={"unknown_key": "value"})
         warnings = validate_paths_config()
@@ -273,6 +341,17 @@ class TestListAllPaths:
         assert entry["configured"] == "my-notes"
         assert entry["default"] == "notes"
 
+    def test_verifies_vault_once(self, mock_config, monkeypatch):
+        import tools.config as config_module
+        calls = []
+        real = config_module.get_verified_vault_path
+        monkeypatch.setattr(config_module, "get_verified_vault_path",
+                            lambda: calls.append(1) or real())
+        result = list_all_paths()
+        assert len(calls) == 1
+        for name in _VAULT_RELATIVE_DEFAULTS:
+            assert result["vault_relative"][name]["resolved"] == get_path(name)
+
     def test_handles_missing_vault(self, no_config):
         result = list_all_paths()
         entry = result["vault_relative"]["journal_jarvis"]
@@ -10,15 +10,25 @@ from tools.platform_utils import (
     detect_os,
     which,
     which_python,
+    clear_which_cache,
     extract_version,
     get_install_instructions,
     format_error_message,
     check_version_requirement,
     _is_wsl,
     _get_enriched_paths,
+    _invalidate_platform_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_platform_cache():
+    """Platform detection is memoized; tests patch what it reads."""
+    _invalidate_platform_cache()
+    yield
+    _invalidate_platform_cache()
+
+
 class TestVersion:
     """Tests for Version dataclass."""
 
@@ -64,6 +74,15 @@ class TestVersion:
         assert v1 >= v3
         assert not v3 >= v1
 
+    def test_version_hash_consistent_with_equality(self):
+        """Equal versions hash alike and Version is immutable."""
+        v1 = Version(3, 11, 6)
+        v2 = Version(3, 11, 6, build="abc")
+        assert hash(v1) == hash(v2)
+        assert len({v1, v2}) == 1
+        with pytest.raises(AttributeError):
+            v1.major = 4
+
 
 class TestOSDetection:
     """Tests for OS detection."""
@@ -120,6 +139,22 @@ class TestOSDetection:
         assert _is_wsl() == False
 
 
+class TestPlatformCache:
+    """Platform detection runs once per process."""
+
+    @patch('platform.system')
+    def test_detect_os_cached(self, mock_system):
+        mock_system.return_value = "Darwin"
+        assert detect_os() == "macOS"
+        mock_system.return_value = "Windows"
+        assert detect_os() == "macOS"
+        assert mock_system.call_count == 1
+
+    def test_enriched_paths_immutable(self):
+        assert isinstance(_get_enriched_paths(), tuple)
+        assert _get_enriched_paths() is _get_enriched_paths()
+
+
 class TestCommandDetection:
     """Tests for command finding."""
 
@@ -152,6 +187,36 @@ class TestCommandDetection:
             result = which("uv", enriched=True)
             assert result is not None
 
+    @patch('shutil.which')
+    def test_which_result_cached(self, mock_which):
+        """Repeat lookups, hits and misses alike, skip the PATH walk."""
+        mock_which.side_effect = lambda cmd: "/usr/bin/git" if cmd == "git" else None
+        assert which("git", enriched=False) == "/usr/bin/git"
+        assert which("git", enriched=False) == "/usr/bin/git"
+        assert which("uv", enriched=False) is None
+        assert which("uv", enriched=False) is None
+        assert mock_which.call_count == 2
+
+    @patch('shutil.which')
+    def test_which_cache_keyed_by_path(self, mock_which, monkeypatch):
+        """A changed PATH or an explicit clear triggers a fresh lookup."""
+        mock_which.return_value = None
+        which("uv", enriched=False)
+        monkeypatch.setenv("PATH", "/opt/uv/bin")
+        which("uv", enriched=False)
+        clear_which_cache()
+        which("uv", enriched=False)
+        assert mock_which.call_count == 3
+
+    @patch('shutil.which')
+    @patch('platform.system')
+    def test_which_no_enriched_paths_short_circuits(self, mock_system, mock_which):
+        """With no enriched directories the miss returns without probing."""
+        mock_which.return_value = None
+        with patch('tools.platform_utils._get_enriched_paths', return_value=()):
+            assert which("uv", enriched=True) is None
+        mock_system.assert_not_called()
+
     @patch('tools.platform_utils.which')
     def test_which_python_prefers_python3(self, mock_which):
         """Test which_python prefers python3."""
@@ -293,6 +358,10 @@ class TestInstallInstructions:
         assert "macOS" in instructions
         assert "Install unknown-tool" in instructions["macOS"]
 
+    def test_get_install_instructions_known_tool_not_rebuilt(self):
+        """Known tools are served from the module-level table."""
+        assert get_install_instructions("git") is get_install_instructions("git")
+
     @patch('tools.platform_utils.detect_os')
     def test_format_error_message_macos(self, mock_detect_os):
         """Test error message formatting on macOS."""
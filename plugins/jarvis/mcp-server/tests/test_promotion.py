@@ -1,8 +1,9 @@
 """Tests for Tier 2 to Tier 1 promotion."""
 import os
+from datetime import datetime
 import pytest
 from tools.tier2 import tier2_write, tier2_read
-from tools.promotion import check_promotion_criteria, promote
+from tools.promotion import check_promotion_criteria, promote, promote_batch
 from tools.memory import _get_collection
 from tools.paths import get_path
 
@@ -75,6 +76,17 @@ class TestCheckPromotionCriteria:
         result = check_promotion_criteria(metadata)
         assert result["should_promote"]
         assert "age" in result["reason"]
+
+    def test_age_combo_without_native_z(self, mock_config, monkeypatch):
+        """Pre-3.11 parsing path rewrites the Z suffix."""
+        monkeypatch.setattr("tools.promotion._ISO_NATIVE_Z", False)
+        metadata = {
+            "importance_score": "0.75",
+            "retrieval_count": "2",
+            "created_at": "2025-12-01T00:00:00Z"
+        }
+        result = check_promotion_criteria(metadata)
+        assert "age" in result["reason"]
     
     def test_custom_thresholds(self, mock_config):
         """Test with custom promotion thresholds."""
@@ -148,6 +160,21 @@ class TestPromote:
         assert result["success"]
         assert "patterns_promoted" in result["promoted_path"] or "pattern" in result["promoted_path"]
     
+    def test_promote_name_separators_slugged(self, mock_config):
+        """Spaces and path separators in the name become dashes."""
+        write_result = tier2_write(
+            content="Behavioral pattern",
+            content_type="pattern",
+            name="Deploy/Rollback Flow",
+            importance_score=0.9
+        )
+
+        result = promote(write_result["id"])
+        assert result["success"]
+        assert os.path.basename(result["promoted_path"]).startswith(
+            "pattern-deploy-rollback-flow-"
+        )
+
     def test_promote_summary(self, mock_config):
         """Test promoting a summary."""
         write_result = tier2_write(
@@ -161,6 +188,58 @@ class TestPromote:
         assert result["success"]
         assert "summaries_promoted" in result["promoted_path"] or "summar" in result["promoted_path"]
     
+    def test_promote_filename_matches_promoted_at(self, mock_config):
+        """Filename stamp and promoted_at come from the same instant."""
+        write_result = tier2_write(
+            content="Test",
+            content_type="observation",
+            importance_score=0.9
+        )
+
+        result = promote(write_result["id"])
+        assert result["success"]
+        content = (mock_config.vault_path / result["promoted_path"]).read_text()
+        promoted_at = next(
+            line.split(": ", 1)[1] for line in content.splitlines()
+            if line.startswith("promoted_at:")
+        )
+        local = datetime.fromisoformat(promoted_at.replace("Z", "+00:00")).astimezone()
+        stem = os.path.splitext(result["promoted_path"])[0]
+        assert stem.endswith(local.strftime("%Y%m%d-%H%M%S"))
+
+    def test_promote_batch_verifies_vault_once(self, mock_config, monkeypatch):
+        """The batch verifies the vault once and resolves paths inside it."""
+        import tools.config as config_module
+        import tools.promotion as promotion_module
+        ids = [
+            tier2_write(content=f"Obs {i}", content_type="observation",
+                        name=f"verify-{i}", importance_score=0.9)["id"]
+            for i in range(2)
+        ]
+        calls = []
+        real = promotion_module.get_verified_vault_path
+        monkeypatch.setattr(promotion_module, "get_verified_vault_path",
+                            lambda: calls.append(1) or real())
+        monkeypatch.setattr(config_module, "get_verified_vault_path",
+                            lambda: pytest.fail("path resolution re-verified"))
+
+        results = promote_batch(ids)
+        assert all(r["success"] for r in results)
+        assert len(calls) == 1
+
+    def test_promote_unverified_vault_rejected(self, mock_config):
+        """Promotion stops before touching the vault when setup is incomplete."""
+        write_result = tier2_write(
+            content="Test",
+            content_type="observation",
+            importance_score=0.9
+        )
+        mock_config.set(vault_confirmed=False)
+
+        result = promote(write_result["id"])
+        assert not result["success"]
+        assert not (mock_config.vault_path / ".jarvis").exists()
+
     def test_promote_not_found(self, mock_config):
         """Test promoting non-existent document."""
         result = promote("obs::nonexistent")
@@ -408,3 +487,77 @@ class TestPromote:
         assert "project: jarvis-plugin" in content
         assert "- src/main.py" in content
         assert "- tests/test_main.py" in content
+
+
+class TestPromoteBatch:
+    """Test promote_batch function."""
+
+    def test_promote_batch_mixed_results_in_order(self, mock_config):
+        """Each ID gets its own result, in the order requested."""
+        obs = tier2_write(content="First", content_type="observation",
+                          name="first", importance_score=0.9)
+        pat = tier2_write(content="Second", content_type="pattern",
+                          name="second", importance_score=0.9)
+
+        results = promote_batch([obs["id"], "obs::missing", pat["id"]])
+        assert [r["success"] for r in results] == [True, False, True]
+        assert "not found" in results[1]["error"]
+
+        collection = _get_collection()
+        assert not collection.get(ids=[obs["id"], pat["id"]])["ids"]
+        stored = collection.get(ids=[results[0]["vault_id"], results[2]["vault_id"]])
+        assert len(stored["ids"]) == 2
+        assert all(m["tier"] == "file" for m in stored["metadatas"])
+
+    def test_promote_batch_single_round_trips(self, mock_config, monkeypatch):
+        """Reads, deletes and upserts are issued once for the whole batch."""
+        ids = [
+            tier2_write(content=f"Obs {i}", content_type="observation",
+                        name=f"obs-{i}", importance_score=0.9)["id"]
+            for i in range(3)
+        ]
+        collection = _get_collection()
+        calls = []
+        for method in ("get", "delete", "upsert"):
+            real = getattr(collection, method)
+            monkeypatch.setattr(
+                collection, method,
+                lambda *a, _m=method, _real=real, **kw: calls.append(_m) or _real(*a, **kw),
+            )
+        monkeypatch.setattr("tools.memory._get_collection", lambda: collection)
+
+        results = promote_batch(ids)
+        assert all(r["success"] for r in results)
+        assert sorted(calls) == ["delete", "get", "upsert"]
+
+    def test_index_vault_after_promote_adds_no_duplicates(self, mock_config):
+        """A warm existing-files cache already knows the promoted files."""
+        from tools.memory import index_vault
+        # Promote somewhere index_vault walks (the default is under .jarvis/)
+        mock_config.set(paths={"observations_promoted": "notes/observations"})
+        index_vault()  # warms the existing-files cache
+        ids = [
+            tier2_write(content=f"Promoted {i}", content_type="observation",
+                        name=f"dup-{i}", importance_score=0.9)["id"]
+            for i in range(2)
+        ]
+        results = promote_batch(ids)
+        assert all(r["success"] for r in results)
+
+        assert index_vault()["files_indexed"] == 0
+        stored = _get_collection().get(include=[])["ids"]
+        for r in results:
+            assert [i for i in stored if r["promoted_path"] in i] == [r["vault_id"]]
+
+    def test_promote_batch_repeated_id(self, mock_config):
+        """A repeated ID is promoted once; later copies are not found."""
+        doc_id = tier2_write(content="Once", content_type="observation",
+                             importance_score=0.9)["id"]
+
+        first, second = promote_batch([doc_id, doc_id])
+        assert first["success"]
+        assert not second["success"]
+        assert "not found" in second["error"]
+
+    def test_promote_batch_empty(self, mock_config):
+        assert promote_batch([]) == []
@@ -5,8 +5,8 @@ from unittest.mock import patch
 from tools.query import (
     query_vault, doc_read, collection_stats,
     memory_read, memory_stats,  # backward-compatible aliases
-    _compute_relevance, _extract_preview, _translate_filter,
-    _display_path, _increment_retrieval_counts,
+    _compute_relevance, _extract_preview, _cached_preview, _translate_filter,
+    _display_path, _apply_retrieval_increments, flush_retrieval_counts,
     semantic_context,
 )
 
@@ -62,6 +62,13 @@ class TestComputeRelevance:
         boosted = _compute_relevance(0.5, "medium", updated_at=few_days)
         assert boosted == base + 0.05
 
+    def test_recency_measured_from_given_now(self):
+        from datetime import datetime, timezone
+        now = datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
+        base = _compute_relevance(0.5, "medium")
+        boosted = _compute_relevance(0.5, "medium", updated_at="2020-01-01T00:00:00Z", now=now)
+        assert boosted == base + 0.08
+
     def test_no_recency_boost_old(self):
         old = "2020-01-01T00:00:00Z"
         base = _compute_relevance(0.5, "medium")
@@ -112,6 +119,28 @@ class TestExtractPreview:
         assert "  " not in preview
 
 
+class TestCachedPreview:
+    """Tests for the per-document preview cache."""
+
+    def test_repeat_hit_served_from_cache(self, monkeypatch):
+        import tools.query as query_module
+        calls = []
+        real = query_module._extract_preview
+        monkeypatch.setattr(query_module, "_extract_preview",
+                            lambda *a, **kw: calls.append(1) or real(*a, **kw))
+        content = "# Title\n\nCached body."
+        first = _cached_preview("vault::cache-hit.md", content)
+        assert _cached_preview("vault::cache-hit.md", content) == first == "Cached body."
+        assert len(calls) == 1
+
+    def test_changed_content_recomputed(self):
+        assert _cached_preview("vault::cache-edit.md", "Old body.") == "Old body."
+        assert _cached_preview("vault::cache-edit.md", "New body.") == "New body."
+
+    def test_empty_content(self):
+        assert _cached_preview("vault::empty.md", "") == ""
+
+
 class TestTranslateFilter:
     """Tests for filter translation to ChromaDB where syntax."""
 
@@ -461,6 +490,17 @@ class TestCollectionStats:
         import tools.memory as mem
         mem._chroma_client = None
 
+    def test_collection_stats_detailed_pages_metadata(self, mock_config, monkeypatch):
+        import tools.query as query_module
+        self._reset_and_index(mock_config)
+        monkeypatch.setattr(query_module, "_SCAN_PAGE_SIZE", 1)
+
+        result = collection_stats(detailed=True)
+        assert sum(result["type_breakdown"].values()) == result["total_documents"]
+
+        import tools.memory as mem
+        mem._chroma_client = None
+
     def test_collection_stats_empty(self, mock_config):
         import tools.memory as mem
         mem._chroma_client = None
@@ -582,8 +622,9 @@ class TestTierAwareQuery:
         read_result = tier2_read(doc_id)
         assert read_result["metadata"]["retrieval_count"] == "1.0"  # Read increments it
         
-        # Query (should increment)
+        # Query (should increment, in the background)
         query_vault("retrieval count")
+        flush_retrieval_counts()
         
         # Check count increased (read again increments, so should be 3)
         read_result2 = tier2_read(doc_id)
@@ -592,6 +633,100 @@ class TestTierAwareQuery:
         mem._chroma_client = None
 
 
+class TestBackgroundRetrievalIncrement:
+    """query_vault buffers retrieval-count writes and applies them later."""
+
+    @pytest.fixture
+    def applied(self, monkeypatch):
+        import threading
+        import tools.query as query_module
+        calls = []
+        done = threading.Event()
+
+        def record(collection, deltas):
+            calls.append(deltas)
+            done.set()
+
+        monkeypatch.setattr(query_module, "_apply_retrieval_increments", record)
+        return calls, done
+
+    def test_query_buffers_until_flush(self, mock_config):
+        import tools.memory as mem
+        from tools.tier2 import tier2_write
+
+        doc_id = tier2_write(content="Buffered increment observation",
+                             content_type="observation")["id"]
+        query_vault("buffered increment")
+
+        collection = mem._get_collection()
+        assert collection.get(ids=[doc_id])["metadatas"][0]["retrieval_count"] == "0"
+        flush_retrieval_counts()
+        assert collection.get(ids=[doc_id])["metadatas"][0]["retrieval_count"] == "1.0"
+
+    def test_repeated_hits_coalesce(self, mock_config, applied):
+        import tools.query as query_module
+        collection = object()
+        query_module._schedule_retrieval_increment(collection, ["obs::a", "vault::x.md"])
+        query_module._schedule_retrieval_increment(collection, ["obs::a", "obs::b"], 0.5)
+        flush_retrieval_counts()
+        assert applied[0] == [{"obs::a": 1.5, "obs::b": 0.5}]
+
+    def test_threshold_flushes_without_waiting(self, mock_config, applied, monkeypatch):
+        import tools.query as query_module
+        monkeypatch.setattr(query_module, "_FLUSH_THRESHOLD", 2)
+        query_module._schedule_retrieval_increment(object(), ["obs::a", "obs::b"])
+        calls, done = applied
+        assert done.wait(5)
+        assert calls == [{"obs::a": 1.0, "obs::b": 1.0}]
+
+    def test_timer_flushes_small_buffer(self, mock_config, applied, monkeypatch):
+        import tools.query as query_module
+        monkeypatch.setattr(query_module, "_FLUSH_INTERVAL", 0.05)
+        query_module._schedule_retrieval_increment(object(), ["obs::a"])
+        calls, done = applied
+        assert done.wait(5)
+        assert calls == [{"obs::a": 1.0}]
+
+    def test_submit_after_shutdown_applies_inline(self, mock_config, applied, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        import tools.query as query_module
+        stopped = ThreadPoolExecutor(max_workers=1)
+        stopped.shutdown()
+        monkeypatch.setattr(query_module, "_RETRIEVAL_EXECUTOR", stopped)
+        query_module._schedule_retrieval_increment(object(), ["obs::a"])
+        flush_retrieval_counts()
+        assert applied[0] == [{"obs::a": 1.0}]
+
+
+class TestRetrievalCountConcurrency:
+    """Concurrent counter bumps must not lose updates."""
+
+    def test_concurrent_reads_and_increments_all_counted(self, mock_config):
+        import threading
+        import tools.memory as mem
+        from tools.tier2 import tier2_write, tier2_read
+
+        doc_id = tier2_write(content="Contended counter", content_type="observation")["id"]
+        collection = mem._get_collection()
+
+        def reader():
+            for _ in range(5):
+                tier2_read(doc_id)
+
+        def bumper():
+            for _ in range(5):
+                _apply_retrieval_increments(collection, {doc_id: 1.0})
+
+        threads = [threading.Thread(target=f) for f in (reader, bumper) * 4]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stored = collection.get(ids=[doc_id])["metadatas"][0]
+        assert float(stored["retrieval_count"]) == 40.0
+
+
 class TestIncrementRetrievalCountsFractional:
     """Tests for fractional retrieval count increments."""
 
@@ -609,13 +744,38 @@ class TestIncrementRetrievalCountsFractional:
         doc_id = write_result["id"]
 
         collection = mem._get_collection()
-        _increment_retrieval_counts(collection, [doc_id], increment=0.01)
+        _apply_retrieval_increments(collection, {doc_id: 0.01})
 
         result = collection.get(ids=[doc_id])
         assert result["metadatas"][0]["retrieval_count"] == "0.01"
 
         mem._chroma_client = None
 
+    def test_concurrent_metadata_write_not_reverted(self, mock_config):
+        """Only the count keys are written back, so a write between get and update survives."""
+        import tools.memory as mem
+        from tools.tier2 import tier2_write
+
+        doc_id = tier2_write(content="Racing metadata write",
+                             content_type="observation")["id"]
+        collection = mem._get_collection()
+
+        class RacingCollection:
+            def get(self, **kwargs):
+                result = collection.get(**kwargs)
+                # A tier2 write lands after the increment has read metadata
+                collection.update(ids=[doc_id], metadatas=[{"importance_score": "0.9"}])
+                return result
+
+            def update(self, **kwargs):
+                collection.update(**kwargs)
+
+        _apply_retrieval_increments(RacingCollection(), {doc_id: 1.0})
+
+        stored = collection.get(ids=[doc_id])["metadatas"][0]
+        assert stored["importance_score"] == "0.9"
+        assert stored["retrieval_count"] == "1.0"
+
     def test_rounds_to_two_decimals(self, mock_config):
         """0.01 + 0.01 + 0.01 = 0.03 (no float noise)."""
         import tools.memory as mem
@@ -631,15 +791,15 @@ class TestIncrementRetrievalCountsFractional:
 
         collection = mem._get_collection()
         for _ in range(3):
-            _increment_retrieval_counts(collection, [doc_id], increment=0.01)
+            _apply_retrieval_increments(collection, {doc_id: 0.01})
 
         result = collection.get(ids=[doc_id])
         assert result["metadatas"][0]["retrieval_count"] == "0.03"
 
         mem._chroma_client = None
 
-    def test_default_increment_is_one(self, mock_config):
-        """No increment arg → adds 1.0 (backward compat)."""
+    def test_whole_increment(self, mock_config):
+        """A delta of 1.0 adds 1.0 (one direct retrieval)."""
         import tools.memory as mem
         mem._chroma_client = None
         mock_config.set(memory={"db_path": str(mock_config.vault_path / ".test_default_inc_db")})
@@ -652,7 +812,7 @@ class TestIncrementRetrievalCountsFractional:
         doc_id = write_result["id"]
 
         collection = mem._get_collection()
-        _increment_retrieval_counts(collection, [doc_id])
+        _apply_retrieval_increments(collection, {doc_id: 1.0})
 
         result = collection.get(ids=[doc_id])
         assert result["metadatas"][0]["retrieval_count"] == "1.0"
@@ -673,7 +833,7 @@ class TestIncrementRetrievalCountsFractional:
 
         collection = mem._get_collection()
         # Should not crash on vault:: IDs
-        _increment_retrieval_counts(collection, ["vault::notes/skip-test.md"], increment=0.01)
+        _apply_retrieval_increments(collection, {"vault::notes/skip-test.md": 0.01})
 
         # Verify no retrieval_count was added to tier 1 doc
         result = collection.get(ids=["vault::notes/skip-test.md"])
@@ -705,6 +865,7 @@ class TestSemanticContextFractionalBump:
 
         # Call semantic_context (should fractionally increment)
         semantic_context("career goals", threshold=0.0)
+        flush_retrieval_counts()
 
         # Check retrieval count was bumped
         collection = mem._get_collection()
@@ -732,6 +893,7 @@ class TestSemanticContextFractionalBump:
         doc_id = write_result["id"]
 
         semantic_context("career goals zero increment", threshold=0.0)
+        flush_retrieval_counts()
 
         collection = mem._get_collection()
         result = collection.get(ids=[doc_id])
@@ -174,6 +174,38 @@ class TestTier2Read:
             result = tier2_read(doc_id)
             assert result["metadata"]["retrieval_count"] == str(float(i))
     
+    def test_read_persists_count_and_keeps_document(self, mock_config):
+        """The stored count is bumped while the document text is untouched."""
+        doc_id = tier2_write(content="Persisted count", content_type="observation")["id"]
+        tier2_read(doc_id)
+
+        stored = _get_collection().get(ids=[doc_id])
+        assert stored["metadatas"][0]["retrieval_count"] == "1.0"
+        assert stored["documents"][0] == "Persisted count"
+
+    def test_read_does_not_revert_concurrent_write(self, mock_config, monkeypatch):
+        """Only the count keys are written back; a write between get and update survives."""
+        import tools.tier2 as tier2_module
+        doc_id = tier2_write(content="Racing read", content_type="observation")["id"]
+        collection = _get_collection()
+
+        class RacingCollection:
+            def get(self, **kwargs):
+                result = collection.get(**kwargs)
+                # An unlocked tier2 write lands after the read fetched metadata
+                collection.update(ids=[doc_id], metadatas=[{"importance_score": "0.9"}])
+                return result
+
+            def update(self, **kwargs):
+                collection.update(**kwargs)
+
+        monkeypatch.setattr(tier2_module, "_get_collection", RacingCollection)
+        assert tier2_read(doc_id)["metadata"]["retrieval_count"] == "1.0"
+
+        stored = collection.get(ids=[doc_id])["metadatas"][0]
+        assert stored["importance_score"] == "0.9"
+        assert stored["retrieval_count"] == "1.0"
+
     def test_read_float_retrieval_count(self, mock_config):
         """Reads "2.5" → increments to "3.5"."""
         # Write, then manually set retrieval_count to 2.5
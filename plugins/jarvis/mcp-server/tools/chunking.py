@@ -17,6 +17,8 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+from .format_support import strip_frontmatter, find_heading_positions
+
 
 @dataclass
 class Chunk:
@@ -55,8 +57,6 @@ def chunk_document(content: str, config: Optional[dict] = None,
     Returns:
         ChunkResult with list of Chunk objects
     """
-    from .format_support import strip_frontmatter, find_heading_positions
-
     config = config or {}
     min_chars = config.get("min_chunk_chars", _DEFAULT_MIN_CHARS)
     max_chars = config.get("max_chunk_chars", _DEFAULT_MAX_CHARS)
@@ -121,7 +121,7 @@ def get_commit_stats() -> dict:
     Returns:
         {"files_changed": int, "insertions": int, "deletions": int}
     """
-    success, result = run_git_command(["diff", "--stat", "HEAD~1", "HEAD"])
+    success, result = run_git_command(["diff", "--stat", "HEAD~1", "HEAD"], read_only=True)
 
     if not success:
         logger.warning("Could not get commit stats")
@@ -161,7 +161,7 @@ def get_committed_files() -> list[str]:
     Returns:
         List of vault-relative file paths from HEAD~1..HEAD.
     """
-    success, result = run_git_command(["diff", "--name-only", "HEAD~1", "HEAD"])
+    success, result = run_git_command(["diff", "--name-only", "HEAD~1", "HEAD"], read_only=True)
     if not success:
         return []
     return [f for f in result.get("stdout", "").strip().split("\n") if f]
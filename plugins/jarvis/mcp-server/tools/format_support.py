@@ -12,6 +12,7 @@ Adding a new format requires:
 """
 import os
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from . import config as _config_mod
@@ -27,6 +28,33 @@ EXTENSION_MAP = {
 
 INDEXABLE_EXTENSIONS = tuple(EXTENSION_MAP.keys())
 
+# --- Precompiled patterns (shared by every file of a given format) ---
+
+_YAML_FM_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_MD_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_ORG_PROPS_RE = re.compile(r'^\s*:PROPERTIES:\s*\n(.*?):END:\s*\n', re.DOTALL | re.MULTILINE)
+_ORG_PROP_LINE_RE = re.compile(r'^:([^:]+):\s*(.*)$')
+_ORG_TITLE_RE = re.compile(r'^#\+TITLE:\s*(.+)$', re.MULTILINE | re.IGNORECASE)
+_ORG_H1_RE = re.compile(r'^\*\s+(.+)$', re.MULTILINE)
+
+_MD_CODE_BLOCK_RE = re.compile(r'^(`{3,}|~{3,}).*?\n.*?^\1\s*$', re.MULTILINE | re.DOTALL)
+_ORG_HEADING_RE = re.compile(r'^(\*+)\s+(.+)$', re.MULTILINE)
+_ORG_SRC_BLOCK_RE = re.compile(
+    r'^#\+BEGIN_SRC.*?\n.*?^#\+END_SRC\s*$',
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
+_ORG_EXAMPLE_BLOCK_RE = re.compile(
+    r'^#\+BEGIN_(?:EXAMPLE|QUOTE).*?\n.*?^#\+END_(?:EXAMPLE|QUOTE)\s*$',
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=32)
+def _md_heading_re(heading_levels: tuple) -> "re.Pattern":
+    """Compile the Markdown heading pattern for a set of levels (cached)."""
+    levels_pattern = '|'.join(f'{"#" * lvl}' for lvl in sorted(heading_levels))
+    return re.compile(rf'^({levels_pattern})\s+(.+)$', re.MULTILINE)
+
 
 def detect_format(filename: str) -> str:
     """Detect format from file extension.
@@ -133,27 +161,70 @@ def find_code_block_ranges(content: str, fmt: str) -> List[Tuple[int, int]]:
 # Markdown implementations
 # =========================================================================
 
+def split_yaml_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """Split content into (frontmatter block, body) with plain string scans.
+
+    The block is the text between the opening and closing --- lines, or None
+    (with the content returned unchanged) when there is no frontmatter. Same
+    boundaries as _YAML_FM_RE: the delimiter lines may carry trailing
+    whitespace and the closing line must end with a newline.
+    """
+    if not content.startswith('---'):
+        return None, content
+    start = content.find('\n')
+    if start < 0 or content[3:start].strip():
+        return None, content
+    pos = start + 1
+    while True:
+        close = content.find('\n---', pos)
+        if close < 0:
+            return None, content
+        line_end = content.find('\n', close + 4)
+        if line_end >= 0 and not content[close + 4:line_end].strip():
+            return content[start + 1:close], content[line_end + 1:]
+        pos = close + 1
+
+
 def _parse_yaml_frontmatter(content: str) -> dict:
-    """Extract YAML frontmatter from markdown content."""
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
+    """Extract YAML frontmatter from markdown content.
+
+    Single forward pass over the block: ``key: value`` lines, plus a
+    ``tags:`` key with an empty value followed by ``- item`` lines.
+    """
+    block, _ = split_yaml_frontmatter(content)
+    if block is None:
         return {}
     fm = {}
-    for line in match.group(1).split('\n'):
-        if ':' in line and not line.strip().startswith('-'):
-            key, _, value = line.partition(':')
-            fm[key.strip()] = value.strip().strip('"').strip("'")
-    # Extract list-style tags
-    tag_match = re.search(r'tags:\s*\n((?:\s+-\s+.*\n)*)', match.group(1) + '\n')
-    if tag_match:
-        tags = re.findall(r'-\s+(.+)', tag_match.group(1))
-        fm['tags'] = ','.join(t.strip().strip('"').strip("'") for t in tags)
+    tags = None
+    in_tags = False
+    for line in block.split('\n'):
+        stripped = line.strip()
+        if in_tags:
+            if not stripped:
+                continue
+            if stripped[0] == '-' and stripped[1:2].isspace():
+                tags.append(stripped[1:].strip().strip('"').strip("'"))
+                continue
+            in_tags = False
+        if ':' not in line or stripped.startswith('-'):
+            continue
+        key, _, value = line.partition(':')
+        key = key.strip()
+        value = value.strip()
+        fm[key] = value.strip('"').strip("'")
+        if key == 'tags' and not value:
+            tags = []
+            in_tags = True
+    if tags is not None:
+        fm['tags'] = ','.join(tags)
     return fm
 
 
 def _strip_yaml_frontmatter(content: str) -> str:
     """Remove YAML frontmatter from markdown content."""
-    return re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, count=1, flags=re.DOTALL)
+    if not content.startswith('---'):
+        return content
+    return _YAML_FM_RE.sub('', content, count=1)
 
 
 def _generate_yaml_frontmatter(metadata: dict) -> str:
@@ -170,9 +241,27 @@ def _generate_yaml_frontmatter(metadata: dict) -> str:
     return "\n".join(lines) + "\n"
 
 
+def _h1_at(content: str, start: int) -> Optional[str]:
+    """Title of a '# ' heading beginning exactly at start, else None."""
+    if not content.startswith('# ', start):
+        return None
+    end = content.find('\n', start)
+    title = content[start + 2:end if end >= 0 else len(content)].strip()
+    return title or None
+
+
 def _extract_md_title(content: str, filename: str) -> str:
     """Get title from first H1 heading or filename."""
-    match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    # Fast paths: H1 on the first line, or directly after a frontmatter
+    # block that has no '#' lines of its own (those would match first)
+    title = _h1_at(content, 0)
+    if title is None and content.startswith('---'):
+        end = content.find('\n---\n', 3)
+        if end > 0 and '\n#' not in content[:end]:
+            title = _h1_at(content, end + 5)
+    if title:
+        return title
+    match = _MD_H1_RE.search(content)
     if match:
         return match.group(1).strip()
     return os.path.splitext(os.path.basename(filename))[0].replace('-', ' ').title()
@@ -190,11 +279,8 @@ def _find_md_heading_positions(
                 return True
         return False
 
-    levels_pattern = '|'.join(f'{"#" * lvl}' for lvl in sorted(heading_levels))
-    pattern = rf'^({levels_pattern})\s+(.+)$'
-
     positions = []
-    for m in re.finditer(pattern, content, re.MULTILINE):
+    for m in _md_heading_re(tuple(heading_levels)).finditer(content):
         if not in_code_block(m.start()):
             level = len(m.group(1))
             text = m.group(2).strip()
@@ -206,7 +292,7 @@ def _find_md_heading_positions(
 def _find_md_code_block_ranges(content: str) -> List[Tuple[int, int]]:
     """Find fenced code block ranges in Markdown."""
     ranges = []
-    for m in re.finditer(r'^(`{3,}|~{3,}).*?\n.*?^\1\s*$', content, re.MULTILINE | re.DOTALL):
+    for m in _MD_CODE_BLOCK_RE.finditer(content):
         ranges.append((m.start(), m.end()))
     return ranges
 
@@ -223,17 +309,13 @@ def _parse_org_properties(content: str) -> dict:
         :KEY: value
         :END:
     """
-    match = re.match(
-        r'^\s*:PROPERTIES:\s*\n(.*?):END:\s*\n',
-        content,
-        re.DOTALL | re.MULTILINE,
-    )
+    match = _ORG_PROPS_RE.match(content)
     if not match:
         return {}
     props = {}
     for line in match.group(1).split('\n'):
         line = line.strip()
-        prop_match = re.match(r'^:([^:]+):\s*(.*)$', line)
+        prop_match = _ORG_PROP_LINE_RE.match(line)
         if prop_match:
             key = prop_match.group(1).strip().lower()
             value = prop_match.group(2).strip()
@@ -243,10 +325,7 @@ def _parse_org_properties(content: str) -> dict:
 
 def _strip_org_properties(content: str) -> str:
     """Remove :PROPERTIES: drawer from org content."""
-    return re.sub(
-        r'^\s*:PROPERTIES:\s*\n.*?:END:\s*\n',
-        '', content, count=1, flags=re.DOTALL | re.MULTILINE,
-    )
+    return _ORG_PROPS_RE.sub('', content, count=1)
 
 
 def _generate_org_properties(metadata: dict) -> str:
@@ -270,11 +349,11 @@ def _extract_org_title(content: str, filename: str) -> str:
     Org files may use #+TITLE: keyword or * Heading for titles.
     """
     # Try #+TITLE first
-    title_match = re.search(r'^#\+TITLE:\s*(.+)$', content, re.MULTILINE | re.IGNORECASE)
+    title_match = _ORG_TITLE_RE.search(content)
     if title_match:
         return title_match.group(1).strip()
     # Try first top-level heading
-    heading_match = re.search(r'^\*\s+(.+)$', content, re.MULTILINE)
+    heading_match = _ORG_H1_RE.search(content)
     if heading_match:
         return heading_match.group(1).strip()
     return os.path.splitext(os.path.basename(filename))[0].replace('-', ' ').title()
@@ -296,7 +375,7 @@ def _find_org_heading_positions(
         return False
 
     positions = []
-    for m in re.finditer(r'^(\*+)\s+(.+)$', content, re.MULTILINE):
+    for m in _ORG_HEADING_RE.finditer(content):
         level = len(m.group(1))
         if level in heading_levels and not in_code_block(m.start()):
             text = m.group(2).strip()
@@ -308,17 +387,9 @@ def _find_org_heading_positions(
 def _find_org_code_block_ranges(content: str) -> List[Tuple[int, int]]:
     """Find #+BEGIN_SRC...#+END_SRC block ranges in Org."""
     ranges = []
-    for m in re.finditer(
-        r'^#\+BEGIN_SRC.*?\n.*?^#\+END_SRC\s*$',
-        content,
-        re.MULTILINE | re.DOTALL | re.IGNORECASE,
-    ):
+    for m in _ORG_SRC_BLOCK_RE.finditer(content):
         ranges.append((m.start(), m.end()))
     # Also match #+BEGIN_EXAMPLE...#+END_EXAMPLE and #+BEGIN_QUOTE...#+END_QUOTE
-    for m in re.finditer(
-        r'^#\+BEGIN_(?:EXAMPLE|QUOTE).*?\n.*?^#\+END_(?:EXAMPLE|QUOTE)\s*$',
-        content,
-        re.MULTILINE | re.DOTALL | re.IGNORECASE,
-    ):
+    for m in _ORG_EXAMPLE_BLOCK_RE.finditer(content):
         ranges.append((m.start(), m.end()))
     return sorted(ranges, key=lambda r: r[0])
@@ -18,11 +18,17 @@ GIT_ENV = {**os.environ, "GIT_PAGER": ""}
 GIT_TIMEOUT = 30
 GIT_TIMEOUT_LONG = 60  # For filter-branch and other slow operations
 
+# Global options for read-only commands: never take optional locks (e.g. the
+# index refresh in `git status`), so reads don't contend with writers
+GIT_READ_ONLY_OPTIONS = ["--no-optional-locks"]
+
 
 def run_git_command(
     args: list[str],
     timeout: int = GIT_TIMEOUT,
-    check: bool = False
+    check: bool = False,
+    read_only: bool = False,
+    input: Optional[str] = None
 ) -> Tuple[bool, dict]:
     """Run a git command in the vault directory.
 
@@ -35,6 +41,9 @@ def run_git_command(
         args: Git command arguments (e.g., ["status", "--short"])
         timeout: Command timeout in seconds
         check: If True, raise CalledProcessError on non-zero exit
+        read_only: If True, prepend GIT_READ_ONLY_OPTIONS (for commands
+            that never modify the repository)
+        input: Text to send on the command's stdin (e.g. for `-F -`)
 
     Returns:
         Tuple of (success: bool, result: dict)
@@ -53,9 +62,13 @@ def run_git_command(
             "error": f"PERMISSION DENIED: {error}"
         }
 
+    if read_only:
+        args = GIT_READ_ONLY_OPTIONS + args
+
     try:
         result = subprocess.run(
             ["git"] + args,
+            input=input,
             capture_output=True,
             text=True,
             check=check,
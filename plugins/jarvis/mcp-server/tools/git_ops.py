@@ -3,6 +3,8 @@
 All operations run in the configured vault directory.
 """
 import re
+import shlex
+import sys
 import logging
 from typing import Optional
 
@@ -10,20 +12,60 @@ from .git_common import run_git_command, GIT_TIMEOUT_LONG
 
 logger = logging.getLogger("jarvis-core.git_ops")
 
-
-def get_status() -> dict:
+# Subject patterns for query_history operation filters
+_OP_PATTERNS = {
+    "create": re.compile(r"Jarvis CREATE:|^\[JARVIS:C"),
+    "edit": re.compile(r"Jarvis EDIT:|^\[JARVIS:E"),
+    "delete": re.compile(r"Jarvis DELETE:|^\[JARVIS:D"),
+    "move": re.compile(r"Jarvis MOVE:|^\[JARVIS:M"),
+    "user": re.compile(r"User updates:|^\[JARVIS:U"),
+}
+_JARVIS_TAG_RE = re.compile(r'\[JARVIS:[^\]]+\]')
+_FILES_CHANGED_RE = re.compile(r'(\d+) files? changed')
+# Summary line printed by commit/revert: "[main 1a2b3c4] Subject"
+_COMMIT_SUMMARY_RE = re.compile(r'^\[[^\]]* ([0-9a-f]{7,64})\] ', re.MULTILINE)
+
+
+def _iter_records(text: str, sep: str = '\0'):
+    """Yield sep-terminated records from git output without building a list."""
+    find = text.find
+    start = 0
+    while True:
+        end = find(sep, start)
+        if end < 0:
+            if start < len(text):
+                yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def get_status(only_untracked: bool = False,
+               max_entries: Optional[int] = None) -> dict:
     """Get current git status (staged, unstaged, untracked files).
 
+    Args:
+        only_untracked: Only report whether untracked files exist
+            (returns {"success", "has_untracked"}), skipping list building
+        max_entries: Stop after this many status records and flag the
+            result as truncated (default: no limit)
+
     Returns:
         {
             "success": bool,
             "staged": list[str],
             "unstaged": list[str],
             "untracked": list[str],
+            "truncated": bool (only when max_entries cut the listing short),
             "error": str (if failed)
         }
     """
-    success, result = run_git_command(["status", "--porcelain"])
+    # Porcelain v2 with NUL-terminated records: fixed field layout, and
+    # paths are never quoted or split by embedded newlines
+    success, result = run_git_command(
+        ["status", "--porcelain=v2", "-z", "--no-renames", "--no-ahead-behind"],
+        read_only=True
+    )
 
     if not success:
         return {
@@ -31,32 +73,76 @@ def get_status() -> dict:
             "error": result.get("error", "Failed to get git status")
         }
 
+    stdout = result.get("stdout", "")
+
+    if only_untracked:
+        # Untracked records start with "? " right after a NUL terminator.
+        # --no-renames guarantees no origPath records that could mimic one.
+        return {
+            "success": True,
+            "has_untracked": stdout.startswith("? ") or "\0? " in stdout
+        }
+
     staged = []
     unstaged = []
     untracked = []
+    # Local aliases keep attribute lookups out of the per-record loop
+    add_staged = staged.append
+    add_unstaged = unstaged.append
+    add_untracked = untracked.append
+
+    truncated = False
+    seen = 0
+    records = _iter_records(stdout)
+    for record in records:
+        kind = record[:1]
+        if not kind or kind == '!':
+            # Empty trailing record or ignored entry
+            continue
+
+        if max_entries is not None and seen >= max_entries:
+            truncated = True
+            break
+        seen += 1
 
-    for line in result.get("stdout", "").strip().split('\n'):
-        if not line:
+        if kind == '?':
+            # Untracked files also count as unstaged, as they always have
+            path = record[2:]
+            add_untracked(path)
+            add_unstaged(path)
             continue
 
-        status = line[:2]
-        file_path = line[3:]
+        if kind == '1':
+            # 1 XY sub mH mI mW hH hI path
+            fields = record.split(' ', 8)
+        elif kind == '2':
+            # 2 XY sub mH mI mW hH hI Xscore path, then origPath record
+            fields = record.split(' ', 9)
+            next(records, None)
+        elif kind == 'u':
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            fields = record.split(' ', 10)
+        else:
+            continue
 
-        # First character: staged status
-        # Second character: unstaged status
-        if status[0] != ' ' and status[0] != '?':
-            staged.append(file_path)
-        if status[1] != ' ':
-            unstaged.append(file_path)
-        if status[0] == '?' and status[1] == '?':
-            untracked.append(file_path)
+        xy = fields[1]
+        file_path = fields[-1]
 
-    return {
+        # X: staged status, Y: unstaged status ('.' = unmodified)
+        if xy[0] != '.':
+            add_staged(file_path)
+        if xy[1] != '.':
+            add_unstaged(file_path)
+
+    status = {
         "success": True,
         "staged": staged,
         "unstaged": unstaged,
         "untracked": untracked
     }
+    if truncated:
+        status["truncated"] = True
+    return status
 
 
 def parse_last_commit() -> dict:
@@ -72,44 +158,41 @@ def parse_last_commit() -> dict:
             "error": str (if failed)
         }
     """
-    # Get commit hash
-    hash_success, hash_result = run_git_command(["rev-parse", "--short", "HEAD"])
-    if not hash_success:
+    # Hash, subject, and full message (NUL-separated) plus the shortstat
+    # summary, all from a single git process. -m --first-parent makes merge
+    # commits report their diff against the first parent instead of nothing.
+    success, result = run_git_command(
+        ["log", "-1", "--format=%h%x00%s%x00%B%x00", "--shortstat",
+         "-m", "--first-parent", "HEAD"],
+        read_only=True
+    )
+    if not success:
         return {
             "success": False,
-            "error": "Failed to get commit hash"
+            "error": "Failed to read last commit"
         }
-    commit_hash = hash_result.get("stdout", "").strip()
 
-    # Get subject line
-    subject_success, subject_result = run_git_command(["log", "-1", "--format=%s"])
-    if not subject_success:
+    fields = result.get("stdout", "").split('\0', 3)
+    if len(fields) < 4:
         return {
             "success": False,
-            "error": "Failed to get commit subject"
+            "error": "Unexpected git log output"
         }
-    subject = subject_result.get("stdout", "").strip()
+    commit_hash, subject, full_message, stat = fields
+    commit_hash = commit_hash.strip()
+    subject = subject.strip()
 
-    # Get full commit message to extract protocol tag
-    msg_success, msg_result = run_git_command(["log", "-1", "--format=%B"])
+    # Look for [JARVIS:...] tag
     protocol_tag = None
-    if msg_success:
-        full_message = msg_result.get("stdout", "")
-        # Look for [JARVIS:...] tag
-        tag_match = re.search(r'\[JARVIS:[^\]]+\]', full_message)
-        if tag_match:
-            protocol_tag = tag_match.group(0)
-
-    # Get files changed count
-    stat_success, stat_result = run_git_command(["diff", "--stat", "HEAD~1", "HEAD"])
+    tag_match = _JARVIS_TAG_RE.search(full_message)
+    if tag_match:
+        protocol_tag = tag_match.group(0)
+
+    # Shortstat line: " 3 files changed, 10 insertions(+), 2 deletions(-)"
     files_changed = 0
-    if stat_success:
-        lines = stat_result.get("stdout", "").strip().split('\n')
-        if lines:
-            summary = lines[-1]
-            files_match = re.search(r'(\d+) files? changed', summary)
-            if files_match:
-                files_changed = int(files_match.group(1))
+    files_match = _FILES_CHANGED_RE.search(stat)
+    if files_match:
+        files_changed = int(files_match.group(1))
 
     return {
         "success": True,
@@ -221,7 +304,7 @@ def query_history(
         }
     """
     # Build git log command
-    args = ["log", f"--max-count={limit}", "--format=%H|%s|%ai"]
+    args = ["log", "-z", f"--max-count={limit}", "--format=%H%x00%s%x00%ai"]
 
     if since:
         args.append(f"--since={since}")
@@ -229,7 +312,7 @@ def query_history(
     if file_path:
         args.extend(["--", file_path])
 
-    success, result = run_git_command(args)
+    success, result = run_git_command(args, read_only=True)
 
     if not success:
         return {
@@ -237,30 +320,17 @@ def query_history(
             "error": result.get("error", "Failed to query history")
         }
 
-    operations = []
-    for line in result.get("stdout", "").strip().split('\n'):
-        if not line:
-            continue
-
-        parts = line.split('|')
-        if len(parts) < 3:
-            continue
-
-        commit_hash, subject, date = parts[0], parts[1], parts[2]
+    # Resolve the operation filter once ("all" has no pattern -> no filter)
+    op_pattern = _OP_PATTERNS.get(operation)
 
+    # NUL-separated fields, commits also NUL-terminated (-z): consume the
+    # record stream three fields at a time (hash, subject, date)
+    operations = []
+    fields = _iter_records(result.get("stdout", ""))
+    for commit_hash, subject, date in zip(fields, fields, fields):
         # Filter by operation if not "all"
-        if operation != "all":
-            # Check if subject matches operation pattern
-            op_patterns = {
-                "create": r"Jarvis CREATE:|^\[JARVIS:C",
-                "edit": r"Jarvis EDIT:|^\[JARVIS:E",
-                "delete": r"Jarvis DELETE:|^\[JARVIS:D",
-                "move": r"Jarvis MOVE:|^\[JARVIS:M",
-                "user": r"User updates:|^\[JARVIS:U"
-            }
-            pattern = op_patterns.get(operation)
-            if pattern and not re.search(pattern, subject):
-                continue
+        if op_pattern and not op_pattern.search(subject):
+            continue
 
         operations.append({
             "commit_hash": commit_hash[:7],  # Short hash
@@ -298,9 +368,14 @@ def rollback_commit(commit_hash: str) -> dict:
             "stderr": result.get("stderr", "")
         }
 
-    # Get the new revert commit hash
-    hash_success, hash_result = run_git_command(["rev-parse", "--short", "HEAD"])
-    revert_hash = hash_result.get("stdout", "").strip() if hash_success else "unknown"
+    # Get the new revert commit hash from revert's own summary line; only
+    # spawn rev-parse if that output can't be parsed
+    summary_match = _COMMIT_SUMMARY_RE.search(result.get("stdout", ""))
+    if summary_match:
+        revert_hash = summary_match.group(1)
+    else:
+        hash_success, hash_result = run_git_command(["rev-parse", "--short", "HEAD"])
+        revert_hash = hash_result.get("stdout", "").strip() if hash_success else "unknown"
 
     logger.info(f"Reverted commit {commit_hash}, new commit: {revert_hash}")
     return {
@@ -329,6 +404,46 @@ def file_history(file_path: str, limit: int = 10) -> dict:
     return query_history(operation="all", limit=limit, file_path=file_path)
 
 
+# Message filter run by filter-branch for multi-commit rewrites: the same
+# line-by-line re.search as _drop_matching_lines, patterns passed as argv
+_MSG_FILTER_SCRIPT = (
+    "import re, sys\n"
+    "compiled = [re.compile(p) for p in sys.argv[1:]]\n"
+    "sys.stdout.write(''.join(line for line in sys.stdin.read().splitlines(True)\n"
+    "                         if not any(r.search(line) for r in compiled)))\n"
+)
+
+
+def _drop_matching_lines(message: str, compiled: list) -> str:
+    """Return message without the lines any compiled pattern matches."""
+    return "".join(
+        line for line in message.splitlines(keepends=True)
+        if not any(r.search(line) for r in compiled)
+    )
+
+
+def _amend_last_message(compiled: list) -> tuple[bool, dict]:
+    """Drop lines matching any pattern from HEAD's message via amend.
+
+    Only the message changes: --only ignores anything currently staged.
+    An unchanged message leaves HEAD untouched.
+    """
+    msg_success, msg_result = run_git_command(["log", "-1", "--format=%B"])
+    if not msg_success:
+        return False, msg_result
+
+    message = msg_result.get("stdout", "")
+    kept = _drop_matching_lines(message, compiled)
+    if kept == message:
+        return True, {"success": True}
+
+    return run_git_command(
+        ["commit", "--amend", "--only", "--no-verify", "--allow-empty",
+         "--cleanup=whitespace", "-F", "-"],
+        input=kept
+    )
+
+
 def rewrite_commit_messages(
     count: int = 1,
     patterns: Optional[list[str]] = None
@@ -340,7 +455,10 @@ def rewrite_commit_messages(
 
     Args:
         count: Number of recent commits to process
-        patterns: Sed regex patterns to remove (default: ['Co-Authored-By:.*'])
+        patterns: Python regex patterns; message lines they match
+            (re.search) are removed (default: ['Co-Authored-By:.*']).
+            The same matching applies to a single-commit amend and to
+            the filter-branch rewrite used when count > 1.
 
     Returns:
         {
@@ -355,24 +473,32 @@ def rewrite_commit_messages(
     if patterns is None:
         patterns = ['Co-Authored-By:.*']
 
+    try:
+        compiled = [re.compile(pattern) for pattern in patterns]
+    except re.error as e:
+        return {"success": False, "error": f"Invalid pattern: {e}"}
+
     # Get old commit hashes before rewrite
     old_success, old_result = run_git_command([
         "log", f"-{count}", "--format=%H"
     ])
     old_hashes = old_result.get("stdout", "").strip().split('\n') if old_success else []
 
-    # Build sed expression to remove patterns
-    sed_expr = ';'.join([f'/{pattern}/d' for pattern in patterns])
-
-    # Use filter-branch to rewrite commit messages
-    success, result = run_git_command(
-        [
-            "filter-branch", "-f", "--msg-filter",
-            f"sed '{sed_expr}'",
-            f"HEAD~{count}..HEAD"
-        ],
-        timeout=GIT_TIMEOUT_LONG
-    )
+    if count == 1:
+        # A single commit is just an amend: no filter-branch machinery needed
+        success, result = _amend_last_message(compiled)
+    else:
+        # filter-branch runs the message filter through the shell
+        msg_filter = shlex.join([sys.executable, "-c", _MSG_FILTER_SCRIPT, *patterns])
+
+        # Use filter-branch to rewrite commit messages
+        success, result = run_git_command(
+            [
+                "filter-branch", "-f", "--msg-filter", msg_filter,
+                f"HEAD~{count}..HEAD"
+            ],
+            timeout=GIT_TIMEOUT_LONG
+        )
 
     if not success:
         return {
@@ -6,74 +6,190 @@ ChromaDB auto-embeds content using sentence-transformers (all-MiniLM-L6-v2).
 All documents are stored in the unified 'jarvis' collection with namespaced
 IDs (vault:: prefix) and enriched metadata.
 """
-import glob
 import logging
 import os
 import re
+import threading
 import time
-from datetime import datetime, timezone
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import chromadb
+from chromadb.api.types import Documents, EmbeddingFunction
 
 from .config import get_verified_vault_path, get_chunking_config, get_scoring_config
 from .chunking import chunk_document
 from .scoring import compute_importance
 from .namespaces import vault_id, NAMESPACE_VAULT, ContentType
 from .paths import get_path, get_relative_path, is_sensitive_path, SENSITIVE_PATHS
+from .memory_files import _utcnow_iso
 from .format_support import (
     detect_format, is_indexable, parse_frontmatter, extract_title, INDEXABLE_EXTENSIONS,
 )
 
 logger = logging.getLogger("jarvis-core")
 
-# Singleton client
+# Singleton client, and the jarvis collection opened through it
 _chroma_client = None
+_collection = None
+_client_lock = threading.Lock()
 _COLLECTION_NAME = "jarvis"
-_BATCH_SIZE = 50
+# HNSW settings, applied by Chroma only when the collection is created;
+# existing collections keep theirs until recreated. The vault is
+# write-rare and read-often, so favour graph quality over build time.
+_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 400,
+}
+# Chunks per embed+upsert during bulk indexing (override: JARVIS_INDEX_BATCH)
+try:
+    _BATCH_SIZE = max(1, int(os.environ.get("JARVIS_INDEX_BATCH", "256")))
+except ValueError:
+    _BATCH_SIZE = 256
+# Documents per page when scanning the collection for indexed files
+_SCAN_PAGE_SIZE = 5000
+# Files per $in lookup when clearing old chunks on force re-index
+_DELETE_BATCH_SIZE = 256
+# Worker threads for reading and parsing files during bulk indexing
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Parsed files allowed to wait for the (slower) embedding thread
+_READ_AHEAD = _READ_WORKERS * 2
+# Per-file errors listed in an index_vault result (all are counted)
+_MAX_REPORTED_ERRORS = 100
 # Directories to skip during indexing (non-content directories)
 _SKIP_DIRS = {"templates", ".obsidian", ".git", ".trash"}
+# Indexed vault files as (monotonic timestamp, set of relative paths).
+# Scoped to the current client and kept in sync by index/unindex calls.
+_existing_files_cache = None
+_EXISTING_FILES_TTL = 60
+_existing_files_lock = threading.Lock()
+# Shared embedder (same model as Chroma's default embedding function)
+_embedder = None
 
 
 def _get_client() -> chromadb.ClientAPI:
     """Get or create singleton ChromaDB PersistentClient."""
-    global _chroma_client
+    global _chroma_client, _collection, _existing_files_cache
     if _chroma_client is None:
-        db_dir = get_path("db_path", ensure_exists=True)
-        _chroma_client = chromadb.PersistentClient(path=db_dir)
+        # Double-checked so concurrent callers never open two clients on one DB
+        with _client_lock:
+            if _chroma_client is None:
+                db_dir = get_path("db_path", ensure_exists=True)
+                _collection = None
+                with _existing_files_lock:
+                    _existing_files_cache = None
+                _chroma_client = chromadb.PersistentClient(path=db_dir)
     return _chroma_client
 
 
 def _get_collection() -> chromadb.Collection:
-    """Get or create the unified jarvis collection."""
+    """Get or create the unified jarvis collection.
+
+    The handle is memoized per client. If the collection is dropped
+    outside this process, restart the server (or reset _chroma_client).
+    """
+    global _collection
     client = _get_client()
-    return client.get_or_create_collection(
-        name=_COLLECTION_NAME,
-        metadata={"hnsw:space": "cosine"}
-    )
+    if _collection is None:
+        with _client_lock:
+            if _collection is None:
+                _collection = client.get_or_create_collection(
+                    name=_COLLECTION_NAME,
+                    metadata=_COLLECTION_METADATA,
+                    embedding_function=_EMBEDDING_FUNCTION,
+                )
+    return _collection
+
+
+def _embed_providers() -> list:
+    """ONNX Runtime providers for the embedder, chosen by JARVIS_EMBED_DEVICE.
+
+    "auto" (default) uses CUDA when onnxruntime exposes it, else CPU;
+    "cpu" forces CPU; "cuda" falls back to CPU with a warning if unavailable.
+    """
+    import onnxruntime
+
+    device = os.environ.get("JARVIS_EMBED_DEVICE", "auto").strip().lower()
+    has_cuda = "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+    if device == "cuda" and not has_cuda:
+        logger.warning("JARVIS_EMBED_DEVICE=cuda but CUDA is unavailable; embedding on CPU")
+    if device != "cpu" and has_cuda:
+        return ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    return ["CPUExecutionProvider"]
+
+
+def _get_embedder():
+    """Get or create the singleton ONNX MiniLM embedder.
+
+    Chroma's default embedding function builds a fresh model (tokenizer
+    and ONNX session) on every call; everything here reuses this one.
+    """
+    global _embedder
+    if _embedder is None:
+        from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+        _embedder = ONNXMiniLM_L6_V2(preferred_providers=_embed_providers())
+    return _embedder
+
+
+class _SharedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Chroma's default embedding, backed by the shared embedder.
+
+    Reports the "default" name so existing collections open without an
+    embedding-function conflict. It does not subclass
+    DefaultEmbeddingFunction, because Chroma bypasses instances of that
+    class and builds a fresh model instead.
+    """
 
+    def __call__(self, input: Documents):
+        return _get_embedder()(input)
 
-def _parse_frontmatter_for_file(content: str, filename: str) -> dict:
+    @staticmethod
+    def name() -> str:
+        return "default"
+
+    def get_config(self) -> dict:
+        return {}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "_SharedEmbeddingFunction":
+        return _EMBEDDING_FUNCTION
+
+
+# Stateless, so one instance serves every collection handle
+_EMBEDDING_FUNCTION = _SharedEmbeddingFunction()
+
+
+def _parse_frontmatter_for_file(content: str, filename: str,
+                                fmt: Optional[str] = None) -> dict:
     """Extract frontmatter/properties from content, detecting format from filename."""
-    fmt = detect_format(filename)
+    if fmt is None:
+        fmt = detect_format(filename)
     return parse_frontmatter(content, fmt)
 
 
-def _extract_title_for_file(content: str, filename: str) -> str:
+def _extract_title_for_file(content: str, filename: str,
+                            fmt: Optional[str] = None) -> str:
     """Get title from content, detecting format from filename."""
-    fmt = detect_format(filename)
+    if fmt is None:
+        fmt = detect_format(filename)
     return extract_title(content, filename, fmt)
 
 
-def _build_metadata(frontmatter: dict, relative_path: str) -> dict:
+def _build_metadata(frontmatter: dict, relative_path: str,
+                    now_iso: Optional[str] = None) -> dict:
     """Build ChromaDB metadata dict with universal + vault-specific fields.
 
     Universal fields: type, namespace, created_at, updated_at, source
     Vault-specific: directory, vault_type, title, tags, importance, has_frontmatter
+
+    now_iso is the fallback created/updated timestamp; bulk callers pass one
+    value for the whole run.
     """
     directory = relative_path.split('/')[0] if '/' in relative_path else ''
-    now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if now_iso is None:
+        now_iso = _utcnow_iso()
 
     # Universal fields
     meta = {
@@ -112,20 +228,104 @@ def _build_metadata(frontmatter: dict, relative_path: str) -> dict:
     return meta
 
 
-def _should_skip(relative_path: str, include_sensitive: bool) -> bool:
-    """Check if a file should be skipped during indexing."""
-    parts = Path(relative_path).parts
-    if not parts:
-        return True
-    top_dir = parts[0]
-    if top_dir in _SKIP_DIRS:
-        return True
-    if not include_sensitive:
-        # Check against configurable sensitive path names
-        sensitive_dirs = {get_relative_path(name) for name in SENSITIVE_PATHS}
-        if top_dir in sensitive_dirs:
-            return True
-    return False
+def _skip_dirs(include_sensitive: bool) -> frozenset:
+    """Top-level directories excluded from indexing for one indexing run."""
+    if include_sensitive:
+        return frozenset(_SKIP_DIRS)
+    # Configurable sensitive path names
+    sensitive_dirs = {get_relative_path(name) for name in SENSITIVE_PATHS}
+    return frozenset(_SKIP_DIRS | sensitive_dirs)
+
+
+def _walk_indexable(root: str, rel_root: str = ""):
+    """Yield (path, relative_path, top_dir) for indexable files under root.
+
+    relative_path is rel_root joined with the entry names walked, so no
+    per-file relpath call is needed; top_dir is its first component.
+    Like glob's '**' matching, hidden files and directories (leading '.')
+    are never visited.
+    """
+    root_top = rel_root.split(os.sep, 1)[0] if rel_root else None
+    stack = [(root, rel_root, root_top)]
+    while stack:
+        dir_path, rel_dir, top_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    rel = f"{rel_dir}{os.sep}{name}" if rel_dir else name
+                    try:
+                        if entry.is_dir():
+                            stack.append((entry.path, rel, top_dir or name))
+                        elif name.endswith(INDEXABLE_EXTENSIONS):
+                            yield entry.path, rel, top_dir or ""
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _scan_existing_files(collection) -> set:
+    """Collect the relative paths of all indexed vault files.
+
+    Handles both chunked docs (parent_file metadata) and legacy
+    single-doc format (vault::{path} ID). Returns an empty set on failure.
+    """
+    existing = set()
+    offset = 0
+    while True:
+        # Metadata only (no documents), one page at a time
+        try:
+            result = collection.get(include=["metadatas"],
+                                    limit=_SCAN_PAGE_SIZE, offset=offset)
+        except Exception:
+            return set()
+
+        ids = result['ids']
+        metadatas = result.get('metadatas') or []
+        for i, doc_id in enumerate(ids):
+            meta = metadatas[i] if i < len(metadatas) else {}
+            parent = (meta or {}).get('parent_file')
+            if parent:
+                existing.add(parent)
+            elif doc_id.startswith("vault::") and "#chunk-" not in doc_id:
+                # Legacy unchunked: extract path from vault::path ID
+                existing.add(doc_id[7:])
+
+        if len(ids) < _SCAN_PAGE_SIZE:
+            return existing
+        offset += _SCAN_PAGE_SIZE
+
+
+def _get_existing_files(collection) -> set:
+    """Get the set of indexed vault files, rescanning when the cache is stale."""
+    global _existing_files_cache
+    with _existing_files_lock:
+        if _existing_files_cache is not None:
+            cached_at, files = _existing_files_cache
+            if time.monotonic() - cached_at < _EXISTING_FILES_TTL:
+                return set(files)
+        files = _scan_existing_files(collection)
+        _existing_files_cache = (time.monotonic(), files)
+        return set(files)
+
+
+def _update_existing_files(added=(), removed=()) -> None:
+    """Apply index/unindex changes to the cached existing-files set."""
+    with _existing_files_lock:
+        if _existing_files_cache is not None:
+            files = _existing_files_cache[1]
+            files.difference_update(removed)
+            files.update(added)
+
+
+def _invalidate_existing_files() -> None:
+    """Drop the cached existing-files set so the next lookup rescans."""
+    global _existing_files_cache
+    with _existing_files_lock:
+        _existing_files_cache = None
 
 
 def _delete_existing_chunks(collection, relative_path: str) -> int:
@@ -159,22 +359,91 @@ def _delete_existing_chunks(collection, relative_path: str) -> int:
     except Exception:
         pass
 
+    _update_existing_files(removed=(relative_path,))
     return deleted
 
 
+def _delete_chunks_for_files(collection, relative_paths: list) -> None:
+    """Delete existing chunks for many files before a bulk re-index.
+
+    Batched counterpart of _delete_existing_chunks: one $in lookup and one
+    delete per _DELETE_BATCH_SIZE files instead of round-trips per file.
+    """
+    for i in range(0, len(relative_paths), _DELETE_BATCH_SIZE):
+        paths = relative_paths[i:i + _DELETE_BATCH_SIZE]
+
+        # Chunks by parent_file metadata
+        try:
+            result = collection.get(
+                where={"parent_file": {"$in": paths}},
+                include=[]
+            )
+            if result["ids"]:
+                collection.delete(ids=result["ids"])
+        except Exception:
+            pass
+
+        # Legacy single-doc IDs (deleting missing IDs is a no-op)
+        try:
+            collection.delete(ids=[vault_id(p) for p in paths])
+        except Exception:
+            pass
+
+    _update_existing_files(removed=relative_paths)
+
+
+def _read_for_index(filepath: str, relative_path: str) -> tuple:
+    """Read and parse one file for bulk indexing (runs in a worker thread).
+
+    Returns (relative_path, fmt, content, frontmatter, title, error). Content
+    is None for empty files; error is None unless reading or parsing failed.
+    """
+    fmt = detect_format(filepath)
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        if not content.strip():
+            return relative_path, fmt, None, None, None, None
+
+        frontmatter = _parse_frontmatter_for_file(content, filepath, fmt)
+        title = _extract_title_for_file(content, os.path.basename(filepath), fmt)
+        return relative_path, fmt, content, frontmatter, title, None
+    except Exception as e:
+        return relative_path, fmt, None, None, None, str(e)
+
+
+def _read_ahead(pool: ThreadPoolExecutor, candidates: list):
+    """Read candidates in the pool, yielding results in order.
+
+    Unlike pool.map, at most _READ_AHEAD reads are in flight, so file
+    contents never pile up in memory while embedding lags behind.
+    """
+    pending = deque()
+    for filepath, relative in candidates:
+        pending.append(pool.submit(_read_for_index, filepath, relative))
+        if len(pending) >= _READ_AHEAD:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
 def _index_single_file(collection, content: str, frontmatter: dict,
                         relative_path: str, title: str,
-                        chunking_config: dict, scoring_config: dict) -> tuple:
+                        chunking_config: dict, scoring_config: dict,
+                        fmt: Optional[str] = None,
+                        now_iso: Optional[str] = None) -> tuple:
     """Index a single file with chunking and scoring.
 
     Returns (chunk_ids, chunk_docs, chunk_metas, chunk_count).
     """
-    metadata = _build_metadata(frontmatter, relative_path)
+    metadata = _build_metadata(frontmatter, relative_path, now_iso)
     metadata['title'] = title
     metadata['parent_file'] = relative_path
 
     # Chunk the document (format-aware)
-    fmt = detect_format(relative_path)
+    if fmt is None:
+        fmt = detect_format(relative_path)
     chunk_result = chunk_document(content, chunking_config, fmt=fmt)
 
     # Shared scoring inputs (file-level)
@@ -197,7 +466,7 @@ def _index_single_file(collection, content: str, frontmatter: dict,
             config=scoring_cfg,
         )
 
-        chunk_meta = {**metadata}
+        chunk_meta = metadata.copy()
         chunk_meta['importance_score'] = round(importance_score, 4)
         chunk_meta['chunk_index'] = chunk.index
         chunk_meta['chunk_total'] = chunk_result.total
@@ -225,7 +494,8 @@ def index_vault(force: bool = False, directory: Optional[str] = None,
         include_sensitive: Include documents/ and people/ directories
 
     Returns:
-        Summary dict with counts and timing
+        Summary dict with counts and timing. Use collection_stats() for
+        the collection size; counting here costs a full table scan.
     """
     vault_path, error = get_verified_vault_path()
     if error:
@@ -241,87 +511,101 @@ def index_vault(force: bool = False, directory: Optional[str] = None,
 
     chunking_config = get_chunking_config()
     scoring_config = get_scoring_config()
+    now_iso = _utcnow_iso()
 
-    # Get existing parent_files to skip (unless force)
-    existing_files = set()
-    if not force:
-        try:
-            result = collection.get(include=["metadatas"])
-            for i, doc_id in enumerate(result['ids']):
-                meta = result['metadatas'][i] if result.get('metadatas') else {}
-                parent = (meta or {}).get('parent_file')
-                if parent:
-                    existing_files.add(parent)
-                else:
-                    # Legacy unchunked: extract path from vault::path ID
-                    if doc_id.startswith("vault::") and "#chunk-" not in doc_id:
-                        existing_files.add(doc_id[7:])
-        except Exception:
-            pass
+    # Get existing parent_files to skip (unless force); cached across calls
+    existing_files = _get_existing_files(collection) if not force else set()
 
-    # Collect indexable files (all supported formats)
-    indexable_files = []
-    for ext in INDEXABLE_EXTENSIONS:
-        indexable_files.extend(
-            glob.glob(os.path.join(search_path, '**', f'*{ext}'), recursive=True)
-        )
-
-    files_indexed = 0
-    chunks_total = 0
+    # Collect indexable files (all supported formats) in one walk
+    skip_dirs = _skip_dirs(include_sensitive)
     skipped = 0
-    errors = []
-    batch_ids = []
-    batch_docs = []
-    batch_meta = []
-
-    for filepath in indexable_files:
-        relative = os.path.relpath(filepath, vault_path)
-
-        if _should_skip(relative, include_sensitive):
+    candidates = []
+    rel_root = os.path.relpath(search_path, vault_path) if directory else ""
+    if rel_root == os.curdir:
+        rel_root = ""
+    for filepath, relative, top_dir in _walk_indexable(search_path, rel_root):
+        # Root-level files have no top_dir and are never skipped
+        if top_dir in skip_dirs:
             skipped += 1
             continue
 
-        if relative in existing_files and not force:
+        if relative in existing_files:
             skipped += 1
             continue
 
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+        candidates.append((filepath, relative))
 
-            if not content.strip():
-                skipped += 1
+    files_indexed = 0
+    chunks_total = 0
+    indexed_paths = []
+    errors = []
+    error_count = 0
+    batch_ids = []
+    batch_docs = []
+    batch_meta = []
+    batch_files = []
+
+    def flush_batch():
+        # On force re-index, clean up old chunks just before their
+        # replacements land, and only for files that chunked successfully:
+        # a file that fails to read keeps its existing chunks.
+        if force and batch_files:
+            _delete_chunks_for_files(collection, batch_files)
+        if batch_ids:
+            # Embedded by the collection's shared embedding function
+            collection.upsert(ids=batch_ids, documents=batch_docs, metadatas=batch_meta)
+        # Reuse the same lists; upsert has consumed them
+        batch_ids.clear()
+        batch_docs.clear()
+        batch_meta.clear()
+        batch_files.clear()
+
+    # File reads and frontmatter parsing run in worker threads; chunking,
+    # scoring, and ChromaDB writes stay on this thread, in walk order.
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        parsed_files = _read_ahead(pool, candidates)
+
+        for relative, fmt, content, frontmatter, title, read_error in parsed_files:
+            if read_error is not None:
+                error_count += 1
+                if len(errors) < _MAX_REPORTED_ERRORS:
+                    errors.append({"file": relative, "error": read_error})
                 continue
 
-            # On force re-index, clean up old chunks first
-            if force:
-                _delete_existing_chunks(collection, relative)
-
-            frontmatter = _parse_frontmatter_for_file(content, filepath)
-            title = _extract_title_for_file(content, os.path.basename(filepath))
-
-            ids, docs, metas, n_chunks = _index_single_file(
-                collection, content, frontmatter, relative, title,
-                chunking_config, scoring_config
-            )
-
-            batch_ids.extend(ids)
-            batch_docs.extend(docs)
-            batch_meta.extend(metas)
-            files_indexed += 1
-            chunks_total += n_chunks
-
-            # Flush batch
-            if len(batch_ids) >= _BATCH_SIZE:
-                collection.upsert(ids=batch_ids, documents=batch_docs, metadatas=batch_meta)
-                batch_ids, batch_docs, batch_meta = [], [], []
+            if content is None:
+                skipped += 1
+                continue
 
-        except Exception as e:
-            errors.append({"file": relative, "error": str(e)})
+            try:
+                ids, docs, metas, n_chunks = _index_single_file(
+                    collection, content, frontmatter, relative, title,
+                    chunking_config, scoring_config, fmt=fmt, now_iso=now_iso
+                )
+
+                batch_ids.extend(ids)
+                batch_docs.extend(docs)
+                batch_meta.extend(metas)
+                files_indexed += 1
+                chunks_total += n_chunks
+                indexed_paths.append(relative)
+                batch_files.append(relative)
+
+                # Flush batch
+                if len(batch_ids) >= _BATCH_SIZE:
+                    flush_batch()
+
+            except Exception as e:
+                error_count += 1
+                if len(errors) < _MAX_REPORTED_ERRORS:
+                    errors.append({"file": relative, "error": str(e)})
 
     # Flush remaining
-    if batch_ids:
-        collection.upsert(ids=batch_ids, documents=batch_docs, metadatas=batch_meta)
+    flush_batch()
+
+    if force:
+        _invalidate_existing_files()
+    else:
+        _update_existing_files(added=indexed_paths)
 
     duration = round(time.time() - start, 2)
     return {
@@ -330,8 +614,8 @@ def index_vault(force: bool = False, directory: Optional[str] = None,
         "chunks_total": chunks_total,
         "files_skipped": skipped,
         "errors": errors,
+        "error_count": error_count,
         "duration_seconds": duration,
-        "collection_total": collection.count()
     }
 
 
@@ -363,15 +647,17 @@ def index_file(relative_path: str) -> dict:
         # Clean up old chunks/legacy doc before re-indexing
         _delete_existing_chunks(collection, relative_path)
 
-        frontmatter = _parse_frontmatter_for_file(content, relative_path)
-        title = _extract_title_for_file(content, relative_path)
+        fmt = detect_format(relative_path)
+        frontmatter = _parse_frontmatter_for_file(content, relative_path, fmt)
+        title = _extract_title_for_file(content, relative_path, fmt)
 
         ids, docs, metas, n_chunks = _index_single_file(
             collection, content, frontmatter, relative_path, title,
-            chunking_config, scoring_config
+            chunking_config, scoring_config, fmt=fmt
         )
 
         collection.upsert(ids=ids, documents=docs, metadatas=metas)
+        _update_existing_files(added=(relative_path,))
 
         return {
             "success": True,
@@ -8,13 +8,12 @@ Storage locations:
 - Project: <vault>/.jarvis/memories/<project>/<name>.md
 """
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 from .memory import _get_collection
 from .memory_files import (
     resolve_memory_path, write_memory_file, read_memory_file,
-    list_memory_files, delete_memory_file, validate_name,
+    list_memory_files, delete_memory_file, validate_name, _utcnow_iso,
 )
 from .namespaces import (
     ContentType, global_memory_id, project_memory_id, memory_namespace,
@@ -40,8 +39,14 @@ def _build_memory_metadata(name: str, scope: str, importance: str,
                            tags: list, project: Optional[str] = None,
                            created: Optional[str] = None,
                            modified: Optional[str] = None) -> dict:
-    """Build ChromaDB metadata for a memory document."""
-    now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    """Build ChromaDB metadata for a memory document.
+
+    The clock is only read when created or modified is not supplied.
+    """
+    if not (created and modified):
+        now_iso = _utcnow_iso()
+        created = created or now_iso
+        modified = modified or now_iso
     namespace = memory_namespace(project)
 
     meta = {
@@ -52,8 +57,8 @@ def _build_memory_metadata(name: str, scope: str, importance: str,
         "name": name,
         "importance": importance,
         "source": "memory-write",
-        "created_at": created or now_iso,
-        "updated_at": modified or now_iso,
+        "created_at": created,
+        "updated_at": modified,
     }
     if tags:
         meta["tags"] = ",".join(tags)
@@ -133,13 +138,15 @@ def memory_write(name: str, content: str, scope: str = "global",
     doc_id = _build_chromadb_id(name, scope, project)
     try:
         collection = _get_collection()
+        # Reuse the timestamps just written to the file's frontmatter
         metadata = _build_memory_metadata(
             name=name, scope=scope, importance=importance,
             tags=tags, project=project,
+            created=write_result.get("created_at"),
+            modified=write_result.get("modified_at"),
         )
-        # Store full content (with frontmatter) for search
-        file_result = read_memory_file(path)
-        full_content = file_result.get("content", content) if file_result.get("success") else content
+        # Store full content (with frontmatter) for search, as just written
+        full_content = write_result.get("full_content", content)
 
         collection.upsert(
             ids=[doc_id],
@@ -255,18 +262,20 @@ def memory_list(scope: str = "all", project: Optional[str] = None,
         tag=tag, importance=importance,
     )
 
-    # Cross-reference with ChromaDB to detect stale indexes
+    # Cross-reference with ChromaDB to detect stale indexes (one lookup)
     try:
         collection = _get_collection()
-        for mem in memories:
-            doc_id = _build_chromadb_id(
-                mem["name"], mem["scope"], mem.get("project"),
-            )
-            try:
-                result = collection.get(ids=[doc_id])
-                mem["indexed"] = bool(result["ids"])
-            except Exception:
-                mem["indexed"] = False
+        doc_ids = [
+            _build_chromadb_id(mem["name"], mem["scope"], mem.get("project"))
+            for mem in memories
+        ]
+        try:
+            found = set(collection.get(ids=list(dict.fromkeys(doc_ids)),
+                                       include=[])["ids"]) if doc_ids else set()
+        except Exception:
+            found = set()
+        for mem, doc_id in zip(memories, doc_ids):
+            mem["indexed"] = doc_id in found
             # Remove full path from output (internal detail)
             mem.pop("path", None)
     except Exception:
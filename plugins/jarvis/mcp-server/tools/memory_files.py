@@ -9,18 +9,54 @@ and git-auditable. This is the Tier 1 (file SSoT) layer.
 """
 import os
 import re
-from datetime import datetime, timezone
+import tempfile
+import threading
+import time
 from typing import Optional
 
 from .config import get_verified_vault_path
+from .format_support import split_yaml_frontmatter
 from .paths import get_path
 
 # Valid memory name: lowercase alphanumeric with hyphens, no leading/trailing hyphen
 NAME_PATTERN = re.compile(r'^[a-z0-9][a-z0-9-]*[a-z0-9]$')
+# The same rule as character sets, checked by validate_name without the regex engine
+_ALNUM_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789')
+_NAME_CHARS = _ALNUM_CHARS | {'-'}
+
+# Characters stripped from project names before building paths
+_PROJECT_SANITIZE_RE = re.compile(r'[^a-z0-9-]')
 
 # Minimum name length (single chars are allowed via separate check)
 MIN_NAME_LEN = 2
 
+# Bytes read for frontmatter-only parses (blocks are typically < 1 KB)
+_HEAD_BYTES = 4096
+
+# Parsed frontmatter per path, valid while (st_mtime_ns, st_size) match.
+# Insertion-ordered, so the oldest entry is evicted first once full.
+_FM_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+_FM_CACHE_MAX = 4096
+_fm_cache_lock = threading.Lock()
+
+
+# (epoch second, formatted timestamp) of the last _utcnow_iso() call
+_last_now: tuple[int, str] = (-1, "")
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ, formatted once per second."""
+    global _last_now
+    sec = int(time.time())
+    last_sec, last_iso = _last_now
+    if sec == last_sec:
+        return last_iso
+    t = time.gmtime(sec)
+    iso = "%04d-%02d-%02dT%02d:%02d:%02dZ" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
+    _last_now = (sec, iso)
+    return iso
+
 
 def validate_name(name: str) -> Optional[str]:
     """Validate memory name is a valid slug.
@@ -29,17 +65,16 @@ def validate_name(name: str) -> Optional[str]:
     """
     if not name:
         return "Name cannot be empty"
+    # A single alphanumeric char passes: it is both first and last
+    if (name[0] in _ALNUM_CHARS and name[-1] in _ALNUM_CHARS
+            and _NAME_CHARS.issuperset(name)):
+        return None
     if len(name) < MIN_NAME_LEN:
-        # Allow single alphanumeric chars
-        if len(name) == 1 and re.match(r'^[a-z0-9]$', name):
-            return None
         return f"Name too short: '{name}' (minimum {MIN_NAME_LEN} chars)"
-    if not NAME_PATTERN.match(name):
-        return (
-            f"Invalid name: '{name}'. "
-            "Use lowercase alphanumeric with hyphens (e.g., 'jarvis-trajectory')"
-        )
-    return None
+    return (
+        f"Invalid name: '{name}'. "
+        "Use lowercase alphanumeric with hyphens (e.g., 'jarvis-trajectory')"
+    )
 
 
 def get_strategic_dir() -> tuple[str, str]:
@@ -61,7 +96,7 @@ def get_project_dir(project: str) -> tuple[str, str]:
     (default: ~/.jarvis/memories/<project>/).
     """
     # Sanitize project name
-    safe_project = re.sub(r'[^a-z0-9-]', '', project.lower().strip())
+    safe_project = _PROJECT_SANITIZE_RE.sub('', project.lower().strip())
     if not safe_project:
         return "", f"Invalid project name: '{project}'"
     try:
@@ -107,25 +142,14 @@ def _format_frontmatter(name: str, scope: str, importance: str,
                         created: str, modified: str,
                         project: Optional[str] = None) -> str:
     """Generate YAML frontmatter string."""
-    lines = [
-        "---",
-        f"name: {name}",
-        f"scope: {scope}",
-    ]
-    if scope == "project" and project:
-        lines.append(f"project: {project}")
-    lines.append(f"importance: {importance}")
-    if tags:
-        lines.append("tags:")
-        for tag in tags:
-            lines.append(f"  - {tag}")
-    lines.extend([
-        f"created: {created}",
-        f"modified: {modified}",
-        f"version: {version}",
-        "---",
-    ])
-    return "\n".join(lines) + "\n"
+    # One template; the optional project and tags lines are spliced in
+    project_line = f"project: {project}\n" if scope == "project" and project else ""
+    tag_lines = "tags:\n" + "".join(f"  - {tag}\n" for tag in tags) if tags else ""
+    return (
+        f"---\nname: {name}\nscope: {scope}\n{project_line}"
+        f"importance: {importance}\n{tag_lines}"
+        f"created: {created}\nmodified: {modified}\nversion: {version}\n---\n"
+    )
 
 
 def _parse_memory_frontmatter(content: str) -> dict:
@@ -134,21 +158,37 @@ def _parse_memory_frontmatter(content: str) -> dict:
     Handles the specific fields we write (name, scope, importance, etc.).
     Reuses the same regex approach as memory.py._parse_frontmatter.
     """
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
+    return _parse_frontmatter_text(split_yaml_frontmatter(content)[0])
+
+
+def _parse_frontmatter_text(fm_text: Optional[str]) -> dict:
+    """Parse the text between the frontmatter delimiters."""
+    if fm_text is None:
         return {}
 
     fm = {}
-    for line in match.group(1).split('\n'):
-        if ':' in line and not line.strip().startswith('-'):
+    tags = None  # list-style tags, collected in the same pass
+    in_tags = False
+    for line in fm_text.split('\n'):
+        stripped = line.strip()
+        if in_tags:
+            if not stripped:
+                continue
+            if line[0].isspace() and stripped[0] == '-' and stripped[1:2].isspace():
+                tags.append(stripped[1:].strip().strip('"').strip("'"))
+                continue
+            in_tags = False
+        if ':' in line and not stripped.startswith('-'):
             key, _, value = line.partition(':')
-            fm[key.strip()] = value.strip().strip('"').strip("'")
-
-    # Parse list-style tags
-    tag_match = re.search(r'tags:\s*\n((?:\s+-\s+.*\n)*)', match.group(1) + '\n')
-    if tag_match:
-        tags = re.findall(r'-\s+(.+)', tag_match.group(1))
-        fm['tags'] = [t.strip().strip('"').strip("'") for t in tags]
+            key = key.strip()
+            value = value.strip()
+            fm[key] = value.strip('"').strip("'")
+            if key == 'tags' and not value and tags is None:
+                tags = []
+                in_tags = True
+
+    if tags is not None:
+        fm['tags'] = tags
     elif 'tags' in fm:
         # Single-line tags: convert comma-separated to list
         fm['tags'] = [t.strip() for t in fm['tags'].split(',') if t.strip()]
@@ -163,14 +203,70 @@ def _parse_memory_frontmatter(content: str) -> dict:
     return fm
 
 
+def _read_memory_frontmatter(path: str) -> dict:
+    """Parse a memory file's frontmatter, reading only its head when possible.
+
+    Files not starting with '---' stop after the first read; otherwise reads
+    continue in _HEAD_BYTES steps only until the closing delimiter shows up.
+    Raises OSError like open().
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, _HEAD_BYTES)
+        if not data.startswith(b'---'):
+            return {}
+        scanned = 3
+        while True:
+            # Only re-parse once a candidate closing line has arrived
+            if data.find(b'\n---', scanned) >= 0:
+                # A multibyte char may be cut at the boundary; it is past the block
+                fm = _parse_memory_frontmatter(data.decode('utf-8', errors='ignore'))
+                if fm:
+                    return fm
+            # Rescan a trailing '---' line whose newline is still unread
+            last = data.rfind(b'\n---', scanned)
+            if last >= 0 and not data[last + 4:].strip():
+                scanned = last
+            else:
+                scanned = max(3, len(data) - 3)
+            chunk = os.read(fd, _HEAD_BYTES)
+            if not chunk:
+                return {}
+            data += chunk
+    finally:
+        os.close(fd)
+
+
+def _cached_memory_frontmatter(path: str, st: os.stat_result) -> dict:
+    """Frontmatter for path, re-parsed only when its mtime or size changed."""
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _FM_CACHE.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    fm = _read_memory_frontmatter(path)
+    with _fm_cache_lock:
+        _FM_CACHE.pop(path, None)
+        if len(_FM_CACHE) >= _FM_CACHE_MAX:
+            del _FM_CACHE[next(iter(_FM_CACHE))]
+        _FM_CACHE[path] = (sig, fm)
+    return fm
+
+
+def _invalidate_frontmatter_cache(path: str) -> None:
+    """Drop any cached frontmatter for path."""
+    with _fm_cache_lock:
+        _FM_CACHE.pop(path, None)
+
+
 def _strip_frontmatter(content: str) -> str:
     """Remove YAML frontmatter from content."""
-    return re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, count=1, flags=re.DOTALL)
+    return split_yaml_frontmatter(content)[1]
 
 
 def write_memory_file(path: str, name: str, content: str, scope: str,
                       project: Optional[str], importance: str,
-                      tags: list, overwrite: bool) -> dict:
+                      tags: list, overwrite: bool,
+                      now_iso: Optional[str] = None) -> dict:
     """Write markdown file with YAML frontmatter.
 
     Args:
@@ -182,15 +278,19 @@ def write_memory_file(path: str, name: str, content: str, scope: str,
         importance: "low", "medium", "high", "critical"
         tags: List of tag strings
         overwrite: Whether to overwrite existing file
+        now_iso: Timestamp for created/modified (default: current UTC time),
+            so batch writers can format it once
 
     Returns:
-        {success, path, created, version}
+        {success, path, created, version, created_at, modified_at, full_content}
     """
-    now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if now_iso is None:
+        now_iso = _utcnow_iso()
     existing_version = 0
     created_at = now_iso
+    existed = os.path.isfile(path)
 
-    if os.path.isfile(path):
+    if existed:
         if not overwrite:
             return {
                 "success": False,
@@ -199,9 +299,7 @@ def write_memory_file(path: str, name: str, content: str, scope: str,
             }
         # Read existing to preserve created_at and bump version
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                existing = f.read()
-            fm = _parse_memory_frontmatter(existing)
+            fm = _read_memory_frontmatter(path)
             created_at = fm.get("created", now_iso)
             existing_version = fm.get("version", 1)
             if isinstance(existing_version, str):
@@ -209,7 +307,7 @@ def write_memory_file(path: str, name: str, content: str, scope: str,
         except Exception:
             pass
 
-    version = existing_version + 1 if os.path.isfile(path) else 1
+    version = existing_version + 1 if existed else 1
     frontmatter = _format_frontmatter(
         name=name, scope=scope, importance=importance,
         tags=tags, version=version, created=created_at,
@@ -218,17 +316,36 @@ def write_memory_file(path: str, name: str, content: str, scope: str,
 
     full_content = frontmatter + content
 
+    tmp_path = None
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(full_content)
+        _invalidate_frontmatter_cache(path)
+        # Write to a unique temp file, sync it, and rename it over the target,
+        # so concurrent writers never share bytes and a crash mid-write never
+        # leaves a truncated memory file behind
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix="." + os.path.basename(path)
+        )
+        with os.fdopen(fd, 'wb') as f:
+            f.write(full_content.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
         return {
             "success": True,
             "path": path,
-            "created": not os.path.isfile(path) or version == 1,
+            "created": not existed or version == 1,
             "version": version,
+            "created_at": created_at,
+            "modified_at": now_iso,
+            "full_content": full_content,
         }
     except Exception as e:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
         return {"success": False, "error": str(e)}
 
 
@@ -241,15 +358,12 @@ def read_memory_file(path: str) -> dict:
     Returns:
         {success, content, body, metadata} or {success: false, error}
     """
-    if not os.path.isfile(path):
-        return {"success": False, "error": f"File not found: {path}"}
-
     try:
         with open(path, 'r', encoding='utf-8') as f:
             full_content = f.read()
 
-        metadata = _parse_memory_frontmatter(full_content)
-        body = _strip_frontmatter(full_content)
+        fm_text, body = split_yaml_frontmatter(full_content)
+        metadata = _parse_frontmatter_text(fm_text)
 
         return {
             "success": True,
@@ -257,6 +371,9 @@ def read_memory_file(path: str) -> dict:
             "body": body.strip(),
             "metadata": metadata,
         }
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        # open() doubles as the existence check, saving a stat per read
+        return {"success": False, "error": f"File not found: {path}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -291,55 +408,64 @@ def list_memory_files(scope: str = "global", project: Optional[str] = None,
             # Scan all project directories
             try:
                 memories_base = get_path("project_memories_path")
-                if os.path.isdir(memories_base):
-                    for proj_name in os.listdir(memories_base):
-                        proj_dir = os.path.join(memories_base, proj_name)
-                        if os.path.isdir(proj_dir):
-                            dirs_to_scan.append(("project", proj_dir, proj_name))
+                with os.scandir(memories_base) as entries:
+                    for de in entries:
+                        if de.is_dir():
+                            dirs_to_scan.append(("project", de.path, de.name))
             except (ValueError, Exception):
-                pass  # project_memories_path not configured or inaccessible
+                pass  # project_memories_path not configured, missing or inaccessible
 
     results = []
-    for entry_scope, directory, proj_name in dirs_to_scan:
-        if not os.path.isdir(directory):
+    for entry_scope, proj_name, de in _iter_memory_files(dirs_to_scan):
+        filepath = de.path
+        try:
+            fm = _cached_memory_frontmatter(filepath, de.stat())
+        except Exception:
+            fm = {}
+
+        entry_importance = fm.get("importance", "medium")
+        entry_tags = fm.get("tags", [])
+        if isinstance(entry_tags, str):
+            entry_tags = [t.strip() for t in entry_tags.split(",")]
+        else:
+            entry_tags = list(entry_tags)  # don't hand out the cached list
+
+        # Apply filters
+        if importance and entry_importance != importance:
+            continue
+        if tag and tag not in entry_tags:
             continue
-        for filename in os.listdir(directory):
-            if not filename.endswith(".md"):
-                continue
-            filepath = os.path.join(directory, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                fm = _parse_memory_frontmatter(content)
-            except Exception:
-                fm = {}
-
-            entry_importance = fm.get("importance", "medium")
-            entry_tags = fm.get("tags", [])
-            if isinstance(entry_tags, str):
-                entry_tags = [t.strip() for t in entry_tags.split(",")]
-
-            # Apply filters
-            if importance and entry_importance != importance:
-                continue
-            if tag and tag not in entry_tags:
-                continue
 
-            name = filename[:-3]  # strip .md
-            results.append({
-                "name": name,
-                "scope": entry_scope,
-                "project": proj_name,
-                "importance": entry_importance,
-                "tags": entry_tags,
-                "modified": fm.get("modified", ""),
-                "version": fm.get("version", 1),
-                "path": filepath,
-            })
+        name = de.name[:-3]  # strip .md
+        results.append({
+            "name": name,
+            "scope": entry_scope,
+            "project": proj_name,
+            "importance": entry_importance,
+            "tags": entry_tags,
+            "modified": fm.get("modified", ""),
+            "version": fm.get("version", 1),
+            "path": filepath,
+        })
 
     return results
 
 
+def _iter_memory_files(dirs_to_scan: list):
+    """Yield (scope, project, DirEntry) for each .md file in the given dirs.
+
+    One scandir per directory; missing or unreadable directories are skipped.
+    """
+    for entry_scope, directory, proj_name in dirs_to_scan:
+        try:
+            with os.scandir(directory) as it:
+                entries = [de for de in it if de.name.endswith(".md")]
+        except OSError:
+            continue
+        for de in entries:
+            yield entry_scope, proj_name, de
+
+
 def delete_memory_file(path: str) -> dict:
     """Delete a memory file.
 
@@ -353,6 +479,7 @@ def delete_memory_file(path: str) -> dict:
         return {"success": False, "error": f"File not found: {path}"}
 
     try:
+        _invalidate_frontmatter_cache(path)
         os.remove(path)
         return {"success": True}
     except Exception as e:
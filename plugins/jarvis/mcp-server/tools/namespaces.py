@@ -11,7 +11,7 @@ This module provides:
 import re
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from enum import Enum
 from typing import Optional
 
@@ -30,6 +30,10 @@ NAMESPACE_LEARNING = "learning::"
 NAMESPACE_DECISION = "decision::"
 NAMESPACE_WORKLOG = "worklog::"
 
+# Prefix lengths for slicing in parse_id
+_VAULT_LEN = len(NAMESPACE_VAULT)
+_MEMORY_GLOBAL_LEN = len(NAMESPACE_MEMORY_GLOBAL)
+
 # Content type enum (for metadata 'type' field)
 # Using (str, Enum) so values work as plain strings in ChromaDB metadata,
 # JSON serialization, and == comparisons with raw strings.
@@ -60,6 +64,13 @@ TIER_CHROMADB = "chromadb"
 TIER_1_PREFIXES = frozenset({"vault::", "memory::"})
 TIER_2_PREFIXES = frozenset({"obs::", "pattern::", "summary::", "code::", "rel::", "hint::", "plan::", "learning::", "decision::", "worklog::"})
 
+# First ID segment (before "::") -> tier, for get_tier's single lookup
+_TIER_BY_HEAD = {
+    **{p[:-2]: TIER_FILE for p in TIER_1_PREFIXES},
+    **{p[:-2]: TIER_CHROMADB for p in TIER_2_PREFIXES},
+}
+_TIER2_PREFIX_BY_HEAD = {p[:-2]: p for p in TIER_2_PREFIXES}
+
 
 # --- ID Generators ---
 
@@ -101,7 +112,7 @@ def pattern_id(name: str) -> str:
 def summary_id(session_id: Optional[str] = None) -> str:
     """Generate a session summary ID."""
     if session_id is None:
-        ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+        ts = time.strftime("%Y%m%d-%H%M%S")
         session_id = f"session-{ts}"
     return f"summary::{session_id}"
 
@@ -116,7 +127,10 @@ def relationship_id(entity_a: str, entity_b: str) -> str:
     
     Entities are sorted alphabetically to ensure consistency regardless of order.
     """
-    a, b = sorted([_slugify(entity_a), _slugify(entity_b)])
+    a = _slugify(entity_a)
+    b = _slugify(entity_b)
+    if a > b:
+        a, b = b, a
     return f"rel::{a}::{b}"
 
 
@@ -151,6 +165,7 @@ def worklog_id(timestamp_ms: Optional[int] = None) -> str:
 
 # --- Tier Detection ---
 
+@lru_cache(maxsize=4096)
 def get_tier(doc_id: str) -> str:
     """Determine document tier from ID prefix (O(1) operation).
     
@@ -159,25 +174,18 @@ def get_tier(doc_id: str) -> str:
         TIER_CHROMADB for Tier 2 (obs::, pattern::, summary::, code::, rel::, hint::, plan::)
         TIER_FILE for bare paths (legacy vault documents)
     """
-    # Check Tier 2 prefixes first (most specific)
-    for prefix in TIER_2_PREFIXES:
-        if doc_id.startswith(prefix):
-            return TIER_CHROMADB
-    
-    # Check Tier 1 prefixes
-    for prefix in TIER_1_PREFIXES:
-        if doc_id.startswith(prefix):
-            return TIER_FILE
-    
-    # Bare path defaults to Tier 1 (file-backed vault document)
-    return TIER_FILE
+    idx = doc_id.find("::")
+    if idx < 0:
+        # Bare path defaults to Tier 1 (file-backed vault document)
+        return TIER_FILE
+    return _TIER_BY_HEAD.get(doc_id[:idx], TIER_FILE)
 
 
 # --- ID Parser ---
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedId:
-    """Decomposed document ID."""
+    """Decomposed document ID (immutable, since parse_id shares cached results)."""
     namespace: str       # "vault", "memory", "obs", "pattern", "summary", "code", "rel", "hint", "plan", "learning", "decision", "worklog"
     full_prefix: str     # "vault::", "memory::global::", "obs::", etc.
     content_id: str      # The part after the prefix
@@ -185,70 +193,57 @@ class ParsedId:
     chunk: Optional[int] = None  # For vault chunks only
 
 
+@lru_cache(maxsize=4096)
 def parse_id(doc_id: str) -> ParsedId:
     """Parse a namespaced document ID into its components.
 
     Handles all known namespace prefixes. Legacy IDs (no prefix)
     are treated as vault documents for backward compatibility.
+    Results are cached per ID and shared between callers.
     """
-    tier = get_tier(doc_id)
-    
-    if doc_id.startswith("vault::"):
-        content = doc_id[7:]
+    idx = doc_id.find("::")
+    if idx < 0:
+        # Bare path without namespace prefix — default to vault
+        return ParsedId("vault", "vault::", doc_id, TIER_FILE)
+    head = doc_id[:idx]
+    tier = _TIER_BY_HEAD.get(head, TIER_FILE)
+
+    if head == "vault":
+        content = doc_id[_VAULT_LEN:]
         chunk = None
         if "#chunk-" in content:
             content, chunk_str = content.rsplit("#chunk-", 1)
             chunk = int(chunk_str)
-        return ParsedId("vault", "vault::", content, tier, chunk)
+        return ParsedId("vault", NAMESPACE_VAULT, content, tier, chunk)
 
-    if doc_id.startswith("memory::global::"):
-        return ParsedId("memory", "memory::global::", doc_id[16:], tier)
-
-    if doc_id.startswith("memory::"):
+    if head == "memory":
+        if doc_id.startswith(NAMESPACE_MEMORY_GLOBAL):
+            return ParsedId("memory", NAMESPACE_MEMORY_GLOBAL,
+                            doc_id[_MEMORY_GLOBAL_LEN:], tier)
         parts = doc_id.split("::", 2)
         project = parts[1] if len(parts) > 1 else ""
         name = parts[2] if len(parts) > 2 else ""
         return ParsedId("memory", f"memory::{project}::", name, tier)
 
-    if doc_id.startswith("obs::"):
-        return ParsedId("obs", "obs::", doc_id[5:], tier)
-
-    if doc_id.startswith("pattern::"):
-        return ParsedId("pattern", "pattern::", doc_id[9:], tier)
-
-    if doc_id.startswith("summary::"):
-        return ParsedId("summary", "summary::", doc_id[9:], tier)
-
-    if doc_id.startswith("code::"):
-        return ParsedId("code", "code::", doc_id[6:], tier)
+    prefix = _TIER2_PREFIX_BY_HEAD.get(head)
+    if prefix is not None:
+        return ParsedId(head, prefix, doc_id[idx + 2:], tier)
 
-    if doc_id.startswith("rel::"):
-        return ParsedId("rel", "rel::", doc_id[5:], tier)
-
-    if doc_id.startswith("hint::"):
-        return ParsedId("hint", "hint::", doc_id[6:], tier)
-
-    if doc_id.startswith("plan::"):
-        return ParsedId("plan", "plan::", doc_id[6:], tier)
-
-    if doc_id.startswith("learning::"):
-        return ParsedId("learning", "learning::", doc_id[10:], tier)
-
-    if doc_id.startswith("decision::"):
-        return ParsedId("decision", "decision::", doc_id[10:], tier)
-
-    if doc_id.startswith("worklog::"):
-        return ParsedId("worklog", "worklog::", doc_id[9:], tier)
-
-    # Bare path without namespace prefix — default to vault
+    # Unknown prefix: the whole ID is a bare vault path
     return ParsedId("vault", "vault::", doc_id, tier)
 
 
 # --- Helpers ---
 
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9-]+')
+_DASH_RUN_RE = re.compile(r'-{2,}')
+
+
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
-    slug = text.lower().strip().replace(" ", "-")
-    slug = re.sub(r'[^a-z0-9-]', '', slug)
-    slug = re.sub(r'-+', '-', slug).strip('-')
-    return slug
+    # Outer whitespace needs no strip(): spaces become dashes, which are
+    # stripped below, and any other whitespace is dropped as invalid
+    slug = _SLUG_INVALID_RE.sub('', text.lower().replace(" ", "-"))
+    if "--" in slug:
+        slug = _DASH_RUN_RE.sub('-', slug)
+    return slug.strip('-')
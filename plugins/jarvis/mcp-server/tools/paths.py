@@ -8,6 +8,7 @@ All vault paths are resolved through this module to ensure:
 5. Template variables ({YYYY}, {MM}, {WW}) are supported
 """
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -42,10 +43,26 @@ _ABSOLUTE_DEFAULTS = {
 }
 
 # Set of path names that are absolute (not vault-relative)
-_ABSOLUTE_PATHS = set(_ABSOLUTE_DEFAULTS.keys())
+_ABSOLUTE_PATHS = frozenset(_ABSOLUTE_DEFAULTS)
+
+# Keys accepted in the config "memory" section
+_KNOWN_MEMORY_KEYS = _ABSOLUTE_PATHS | frozenset({
+    "secret_detection", "importance_scoring",
+    "recency_boost_days", "default_importance",
+})
 
 # Set of path names considered sensitive (ask-first access)
-SENSITIVE_PATHS = {"people", "documents"}
+SENSITIVE_PATHS = frozenset({"people", "documents"})
+
+# Template variable in a raw path, e.g. {YYYY}
+_TEMPLATE_RE = re.compile(r"\{([^{}]+)\}")
+
+
+# Config lookup + template substitution results (steps 1-2 of get_path),
+# valid for the config object they were built from; keyed by
+# (name, substitutions). Vault verification is never cached.
+_PATH_CACHE: dict = {}
+_path_cache_config = None
 
 
 class PathNotConfiguredError(Exception):
@@ -57,6 +74,7 @@ def get_path(
     name: str,
     substitutions: Optional[dict] = None,
     ensure_exists: bool = False,
+    vault_path: Optional[str] = None,
 ) -> str:
     """Resolve a named path to an absolute filesystem path.
 
@@ -64,6 +82,8 @@ def get_path(
         name: Path identifier (e.g., "journal_jarvis", "inbox", "db_path")
         substitutions: Template variable replacements (e.g., {"YYYY": "2026"})
         ensure_exists: If True, create the directory if it does not exist
+        vault_path: Vault path the caller already got from
+            get_verified_vault_path(); skips verifying it again
 
     Returns:
         Absolute path string
@@ -73,10 +93,40 @@ def get_path(
         ValueError: If vault_path is not configured (for vault-relative paths)
     """
     config = _config.get_config()
-    is_absolute = name in _ABSOLUTE_PATHS
+    resolved = _resolve_path(config, name, substitutions, vault_path)
+
+    # 4. Optionally ensure directory exists
+    if ensure_exists:
+        os.makedirs(resolved, exist_ok=True)
+
+    return resolved
+
+
+def clear_path_cache() -> None:
+    """Drop all cached path template lookups."""
+    global _path_cache_config
+    _PATH_CACHE.clear()
+    _path_cache_config = None
+
+
+def _template_path(config: dict, name: str, substitutions: Optional[dict]) -> str:
+    """Raw configured path with substitutions applied (steps 1-2, cached)."""
+    global _path_cache_config
+    if config is not _path_cache_config:
+        # Config was (re)loaded: every cached lookup may be stale
+        _PATH_CACHE.clear()
+        _path_cache_config = config
+
+    key = (
+        name,
+        tuple(sorted((k, str(v)) for k, v in substitutions.items())) if substitutions else None,
+    )
+    raw = _PATH_CACHE.get(key)
+    if raw is not None:
+        return raw
 
     # 1. Look up in config, fall back to defaults
-    if is_absolute:
+    if name in _ABSOLUTE_PATHS:
         raw = config.get("memory", {}).get(name, _ABSOLUTE_DEFAULTS.get(name))
     else:
         raw = config.get("paths", {}).get(name, _VAULT_RELATIVE_DEFAULTS.get(name))
@@ -87,29 +137,44 @@ def get_path(
             f"Valid names: {sorted(list(_VAULT_RELATIVE_DEFAULTS) + list(_ABSOLUTE_DEFAULTS))}"
         )
 
-    # 2. Apply template substitutions
-    if substitutions:
-        for key, value in substitutions.items():
-            raw = raw.replace(f"{{{key}}}", str(value))
+    # 2. Apply template substitutions (most paths have no {VAR} at all)
+    # Single pass over the variables actually present; unknown ones stay literal
+    if substitutions and "{" in raw:
+        raw = _TEMPLATE_RE.sub(
+            lambda m: str(substitutions.get(m.group(1), m.group(0))), raw
+        )
+
+    _PATH_CACHE[key] = raw
+    return raw
+
+
+def _resolve_path(
+    config: dict,
+    name: str,
+    substitutions: Optional[dict],
+    vault_path: Optional[str] = None,
+) -> str:
+    """Resolve a named path against config (steps 1-3 of get_path).
+
+    A vault_path already obtained from get_verified_vault_path() skips
+    re-verifying the vault for vault-relative names; otherwise the vault
+    is verified on every call.
+    """
+    raw = _template_path(config, name, substitutions)
 
     # 3. Resolve to absolute path
-    if is_absolute:
+    if name in _ABSOLUTE_PATHS:
         # In Docker mode, replace ~/.jarvis prefix with JARVIS_HOME
         jarvis_home = os.environ.get("JARVIS_HOME")
         if jarvis_home and raw.startswith("~/.jarvis"):
             raw = raw.replace("~/.jarvis", jarvis_home, 1)
-        resolved = os.path.expanduser(os.path.expandvars(raw))
-    else:
+        return os.path.expanduser(os.path.expandvars(raw))
+
+    if vault_path is None:
         vault_path, error = _config.get_verified_vault_path()
         if error:
             raise ValueError(f"Cannot resolve vault-relative path '{name}': {error}")
-        resolved = os.path.normpath(os.path.join(vault_path, raw))
-
-    # 4. Optionally ensure directory exists
-    if ensure_exists:
-        os.makedirs(resolved, exist_ok=True)
-
-    return resolved
+    return os.path.normpath(os.path.join(vault_path, raw))
 
 
 def get_relative_path(name: str) -> str:
@@ -162,15 +227,12 @@ def validate_paths_config() -> list:
             warnings.append(f"Unknown path key: '{name}' (will be ignored)")
         if os.path.isabs(value):
             warnings.append(f"Path '{name}' should be relative, got absolute: '{value}'")
-        if ".." in Path(value).parts:
+        if ".." in value and ".." in Path(value).parts:
             warnings.append(f"Path '{name}' contains traversal: '{value}'")
 
     memory = config.get("memory", {})
     for name, value in memory.items():
-        if name not in _ABSOLUTE_DEFAULTS and name not in (
-            "secret_detection", "importance_scoring",
-            "recency_boost_days", "default_importance",
-        ):
+        if name not in _KNOWN_MEMORY_KEYS:
             warnings.append(f"Unknown memory key: '{name}' (will be ignored)")
 
     return warnings
@@ -182,28 +244,29 @@ def list_all_paths() -> dict:
     Used by diagnostic tools (jarvis_list_paths).
     """
     config = _config.get_config()
+    paths_cfg = config.get("paths", {})
+    memory_cfg = config.get("memory", {})
+    # Verify the vault once for the whole listing rather than per name
+    vault_path, vault_error = _config.get_verified_vault_path()
     result = {"vault_relative": {}, "absolute": {}}
 
     for name in _VAULT_RELATIVE_DEFAULTS:
-        try:
-            result["vault_relative"][name] = {
-                "configured": config.get("paths", {}).get(name),
-                "default": _VAULT_RELATIVE_DEFAULTS[name],
-                "resolved": get_path(name),
-            }
-        except (ValueError, PathNotConfiguredError):
-            result["vault_relative"][name] = {
-                "configured": config.get("paths", {}).get(name),
-                "default": _VAULT_RELATIVE_DEFAULTS[name],
-                "resolved": None,
-                "error": "vault_path not configured",
-            }
+        entry = {
+            "configured": paths_cfg.get(name),
+            "default": _VAULT_RELATIVE_DEFAULTS[name],
+        }
+        if vault_error:
+            entry["resolved"] = None
+            entry["error"] = "vault_path not configured"
+        else:
+            entry["resolved"] = _resolve_path(config, name, None, vault_path)
+        result["vault_relative"][name] = entry
 
     for name in _ABSOLUTE_DEFAULTS:
         result["absolute"][name] = {
-            "configured": config.get("memory", {}).get(name),
+            "configured": memory_cfg.get(name),
             "default": _ABSOLUTE_DEFAULTS[name],
-            "resolved": get_path(name),
+            "resolved": _resolve_path(config, name, None),
         }
 
     return result
@@ -8,11 +8,18 @@ import re
 import shutil
 import platform
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Dict, Literal, Optional, Tuple
 
+# Semantic version with optional prerelease and build metadata
+# Matches: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]
+_VERSION_RE = re.compile(
+    r"(\d+)\.(\d+)(?:\.(\d+))?(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?"
+)
 
-@dataclass
+
+@dataclass(frozen=True)
 class Version:
     """Semantic version with prerelease and build metadata support."""
     major: int
@@ -44,7 +51,12 @@ class Version:
             return NotImplemented
         return (self.major, self.minor, self.patch) == (other.major, other.minor, other.patch)
 
+    def __hash__(self) -> int:
+        """Hash consistent with __eq__ (prerelease/build ignored)."""
+        return hash((self.major, self.minor, self.patch))
+
 
+@lru_cache(maxsize=None)
 def detect_os() -> Literal["Linux", "macOS", "Windows", "WSL", "Unknown"]:
     """Detect the operating system with WSL support.
 
@@ -54,6 +66,8 @@ def detect_os() -> Literal["Linux", "macOS", "Windows", "WSL", "Unknown"]:
     Detection logic:
         - platform.system() for base OS (Darwin/Linux/Windows)
         - /proc/version or WSL_DISTRO_NAME env var for WSL detection
+
+    Cached for the process lifetime (see _invalidate_platform_cache).
     """
     system = platform.system()
 
@@ -70,6 +84,7 @@ def detect_os() -> Literal["Linux", "macOS", "Windows", "WSL", "Unknown"]:
         return "Unknown"
 
 
+@lru_cache(maxsize=None)
 def _is_wsl() -> bool:
     """Detect if running under Windows Subsystem for Linux."""
     # Check environment variable
@@ -98,7 +113,16 @@ def which(cmd: str, enriched: bool = True) -> Optional[str]:
     Enriched PATH includes:
         Unix: ~/.local/bin, ~/.cargo/bin
         Windows: %LOCALAPPDATA%\\Programs\\Python, %PROGRAMFILES%\\Git\\cmd
+
+    Results (including misses) are cached per PATH value; call
+    clear_which_cache() after installing a tool mid-process.
     """
+    return _which_cached(cmd, enriched, os.environ.get("PATH"))
+
+
+@lru_cache(maxsize=64)
+def _which_cached(cmd: str, enriched: bool, path_env: Optional[str]) -> Optional[str]:
+    """Uncached which() body; path_env only keys the cache."""
     # Try standard PATH first
     result = shutil.which(cmd)
     if result:
@@ -109,10 +133,14 @@ def which(cmd: str, enriched: bool = True) -> Optional[str]:
 
     # Try enriched locations
     enriched_paths = _get_enriched_paths()
+    if not enriched_paths:
+        return None
+
+    # Windows needs .exe extension
+    needs_exe = platform.system() == "Windows"
     for path in enriched_paths:
         candidate = path / cmd
-        # Windows needs .exe extension
-        if platform.system() == "Windows" and not candidate.suffix:
+        if needs_exe and not candidate.suffix:
             candidate = candidate.with_suffix(".exe")
 
         if candidate.exists() and candidate.is_file():
@@ -121,6 +149,11 @@ def which(cmd: str, enriched: bool = True) -> Optional[str]:
     return None
 
 
+def clear_which_cache() -> None:
+    """Forget cached which() results (e.g. after installing a tool)."""
+    _which_cached.cache_clear()
+
+
 def which_python() -> Optional[str]:
     """Find Python executable (prefers python3, falls back to python).
 
@@ -136,8 +169,9 @@ def which_python() -> Optional[str]:
     return which("python", enriched=True)
 
 
-def _get_enriched_paths() -> List[Path]:
-    """Get list of common tool installation paths for current platform."""
+@lru_cache(maxsize=None)
+def _get_enriched_paths() -> Tuple[Path, ...]:
+    """Get common tool installation paths for current platform (cached)."""
     paths = []
     system = platform.system()
     home = Path.home()
@@ -166,7 +200,15 @@ def _get_enriched_paths() -> List[Path]:
             ])
 
     # Filter to only existing directories
-    return [p for p in paths if p.exists() and p.is_dir()]
+    return tuple(p for p in paths if p.exists() and p.is_dir())
+
+
+def _invalidate_platform_cache() -> None:
+    """Forget cached platform detection (for tests simulating another OS)."""
+    detect_os.cache_clear()
+    _is_wsl.cache_clear()
+    _get_enriched_paths.cache_clear()
+    clear_which_cache()
 
 
 def extract_version(version_string: str) -> Optional[Version]:
@@ -184,11 +226,7 @@ def extract_version(version_string: str) -> Optional[Version]:
     Returns:
         Version object, or None if no version found
     """
-    # Regex for semantic version with optional prerelease and build metadata
-    # Matches: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]
-    pattern = r"(\d+)\.(\d+)(?:\.(\d+))?(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?"
-
-    match = re.search(pattern, version_string)
+    match = _VERSION_RE.search(version_string)
     if not match:
         return None
 
@@ -207,6 +245,35 @@ def extract_version(version_string: str) -> Optional[Version]:
     )
 
 
+# Per-platform install commands for known tools (see get_install_instructions)
+_INSTALL_INSTRUCTIONS = {
+    "python": {
+        "macOS": "brew install python@3.12 (Homebrew) or download from python.org",
+        "Linux": "sudo apt install python3 (Debian/Ubuntu) or sudo yum install python3 (RedHat/CentOS)",
+        "Windows": "Download from python.org or install from Microsoft Store (search 'Python 3.11')",
+        "WSL": "sudo apt install python3 (inside WSL)",
+    },
+    "uv": {
+        "macOS": "curl -LsSf https://astral.sh/uv/install.sh | sh",
+        "Linux": "curl -LsSf https://astral.sh/uv/install.sh | sh",
+        "Windows": "Download installer from https://docs.astral.sh/uv/getting-started/installation/",
+        "WSL": "curl -LsSf https://astral.sh/uv/install.sh | sh (inside WSL)",
+    },
+    "git": {
+        "macOS": "xcode-select --install (Command Line Tools) or brew install git",
+        "Linux": "sudo apt install git (Debian/Ubuntu) or sudo yum install git (RedHat/CentOS)",
+        "Windows": "Download Git for Windows from https://git-scm.com/download/win",
+        "WSL": "sudo apt install git (inside WSL)",
+    },
+    "claude": {
+        "macOS": "npm install -g @anthropic-ai/claude-cli or download from claude.ai",
+        "Linux": "npm install -g @anthropic-ai/claude-cli",
+        "Windows": "npm install -g @anthropic-ai/claude-cli (requires Node.js)",
+        "WSL": "npm install -g @anthropic-ai/claude-cli (inside WSL)",
+    },
+}
+
+
 def get_install_instructions(tool: str) -> Dict[str, str]:
     """Get platform-specific installation instructions for a tool.
 
@@ -214,41 +281,18 @@ def get_install_instructions(tool: str) -> Dict[str, str]:
         tool: Tool name ("python", "uv", "git", "claude")
 
     Returns:
-        Dict mapping platform names to installation commands
+        Dict mapping platform names to installation commands (shared for
+        known tools; treat as read-only)
     """
-    instructions = {
-        "python": {
-            "macOS": "brew install python@3.12 (Homebrew) or download from python.org",
-            "Linux": "sudo apt install python3 (Debian/Ubuntu) or sudo yum install python3 (RedHat/CentOS)",
-            "Windows": "Download from python.org or install from Microsoft Store (search 'Python 3.11')",
-            "WSL": "sudo apt install python3 (inside WSL)",
-        },
-        "uv": {
-            "macOS": "curl -LsSf https://astral.sh/uv/install.sh | sh",
-            "Linux": "curl -LsSf https://astral.sh/uv/install.sh | sh",
-            "Windows": "Download installer from https://docs.astral.sh/uv/getting-started/installation/",
-            "WSL": "curl -LsSf https://astral.sh/uv/install.sh | sh (inside WSL)",
-        },
-        "git": {
-            "macOS": "xcode-select --install (Command Line Tools) or brew install git",
-            "Linux": "sudo apt install git (Debian/Ubuntu) or sudo yum install git (RedHat/CentOS)",
-            "Windows": "Download Git for Windows from https://git-scm.com/download/win",
-            "WSL": "sudo apt install git (inside WSL)",
-        },
-        "claude": {
-            "macOS": "npm install -g @anthropic-ai/claude-cli or download from claude.ai",
-            "Linux": "npm install -g @anthropic-ai/claude-cli",
-            "Windows": "npm install -g @anthropic-ai/claude-cli (requires Node.js)",
-            "WSL": "npm install -g @anthropic-ai/claude-cli (inside WSL)",
-        },
-    }
-
-    return instructions.get(tool, {
+    instructions = _INSTALL_INSTRUCTIONS.get(tool)
+    if instructions is not None:
+        return instructions
+    return {
         "macOS": f"Install {tool} for macOS",
         "Linux": f"Install {tool} for Linux",
         "Windows": f"Install {tool} for Windows",
         "WSL": f"Install {tool} for WSL",
-    })
+    }
 
 
 def format_error_message(tool: str, issue: str) -> str:
@@ -269,6 +313,11 @@ def format_error_message(tool: str, issue: str) -> str:
     return f"✗ {tool}: {issue}\n   Install: {install_msg}"
 
 
+def _required_version(required: Tuple[int, int]) -> Version:
+    """Minimum Version for a (major, minor) requirement."""
+    return Version(required[0], required[1], 0)
+
+
 def check_version_requirement(
     actual: Version,
     required: Tuple[int, int],
@@ -284,7 +333,7 @@ def check_version_requirement(
     Returns:
         (is_valid, message) tuple
     """
-    required_version = Version(required[0], required[1], 0)
+    required_version = _required_version(required)
 
     if actual >= required_version:
         return True, f"✓ {tool_name} {actual}"
@@ -5,18 +5,33 @@ when it meets importance/retrieval thresholds.
 """
 import logging
 import os
+import sys
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from .config import get_promotion_config
-from .file_ops import write_vault_file
+from .config import get_promotion_config, get_verified_vault_path
 from .format_support import get_write_extension, generate_frontmatter, get_write_format
-from .memory import _get_collection
 from .namespaces import vault_id, parse_id, get_tier, TIER_CHROMADB, TIER_FILE
 from .paths import get_path
 
 logger = logging.getLogger("jarvis-core")
 
+# fromisoformat accepts a trailing "Z" natively from Python 3.11
+_ISO_NATIVE_Z = sys.version_info >= (3, 11)
+
+# Separators that must not survive into a promoted filename
+_SLUG_TABLE = str.maketrans({" ": "-", "\t": "-", "/": "-", "\\": "-"})
+
+# Promotable content type -> (promotion path name, filename prefix)
+_PROMOTION_MAP = {
+    "observation": ("observations_promoted", "observation"),
+    "pattern": ("patterns_promoted", "pattern"),
+    "summary": ("summaries_promoted", "summary"),
+    "learning": ("learnings_promoted", "learning"),
+    "decision": ("decisions_promoted", "decision"),
+    "worklog": ("worklogs_promoted", "worklog"),
+}
+
 
 def check_promotion_criteria(metadata: dict) -> dict:
     """Check if Tier 2 content meets promotion criteria.
@@ -47,7 +62,9 @@ def check_promotion_criteria(metadata: dict) -> dict:
     # Criterion 3: Age + importance combo
     if created_at:
         try:
-            created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+            created = datetime.fromisoformat(
+                created_at if _ISO_NATIVE_Z else created_at.replace("Z", "+00:00")
+            )
             now = datetime.now(timezone.utc)
             days_old = (now - created).total_seconds() / 86400
             
@@ -72,192 +89,236 @@ def check_promotion_criteria(metadata: dict) -> dict:
 
 def promote(doc_id: str) -> dict:
     """Promote Tier 2 content to Tier 1 (file-backed).
-    
-    Process:
-    1. Read content + metadata from ChromaDB
-    2. Verify it's Tier 2 and not already promoted
-    3. Resolve promotion path based on content type
-    4. Generate markdown with YAML frontmatter
-    5. Write file via write_vault_file (vault boundary safety)
-    6. Delete old ChromaDB entry
-    7. Upsert new entry with vault:: ID and tier="file"
-    
+
+    Single-document form of promote_batch; see there for the process.
+
     Args:
         doc_id: Tier 2 document ID to promote
-    
+
     Returns:
         Result dict with success, original_id, promoted_path, vault_id,
         file_written, chromadb_updated, needs_git_commit
     """
+    return promote_batch([doc_id])[0]
+
+
+def promote_batch(doc_ids: List[str]) -> List[dict]:
+    """Promote several Tier 2 documents to Tier 1 (file-backed).
+
+    Process:
+    1. Read content + metadata for all IDs from ChromaDB in one get
+    2. Verify each is Tier 2 and not already promoted
+    3. Resolve promotion path based on content type
+    4. Generate markdown with YAML frontmatter
+    5. Write each file via write_vault_file (vault boundary safety)
+    6. Delete all promoted Tier 2 entries in one call
+    7. Upsert all new vault:: entries with tier="file" in one call
+    8. Record the promoted files in index_vault's existing-files cache
+
+    Args:
+        doc_ids: Tier 2 document IDs to promote
+
+    Returns:
+        One result dict per doc_id, in order (same shape as promote)
+    """
+    if not doc_ids:
+        return []
+
+    # Deferred: .memory pulls in ChromaDB, not needed unless promoting
+    from .memory import _get_collection, _update_existing_files
+
     try:
         collection = _get_collection()
-        
-        # Read existing content
-        result = collection.get(ids=[doc_id])
-        if not result["ids"]:
-            return {
+        fetched = collection.get(ids=list(dict.fromkeys(doc_ids)))
+    except Exception as e:
+        logger.error(f"promote failed: {e}")
+        return [{"success": False, "error": str(e)} for _ in doc_ids]
+
+    records = dict(zip(fetched["ids"], zip(fetched["documents"], fetched["metadatas"])))
+    vault_path, vault_error = get_verified_vault_path()
+
+    results: List[dict] = []
+    pending = []  # (result index, old id, new id, file content, new metadata)
+    for doc_id in doc_ids:
+        # A repeated ID was consumed by its first occurrence
+        record = records.pop(doc_id, None)
+        if record is None:
+            results.append({
                 "success": False,
                 "error": f"Document not found: {doc_id}"
-            }
-        
-        content = result["documents"][0]
-        metadata = result["metadatas"][0]
-        
-        # Verify Tier 2
-        tier = get_tier(doc_id)
-        if tier != TIER_CHROMADB:
-            return {
-                "success": False,
-                "error": f"Document {doc_id} is not Tier 2 (tier={tier})"
-            }
-        
-        # Check if already promoted
-        if metadata.get("promoted") == "true":
-            return {
-                "success": False,
-                "error": f"Document {doc_id} is already promoted",
-                "already_promoted": True,
-            }
-        
-        # Parse ID to get content type
-        parsed = parse_id(doc_id)
-        content_type = metadata.get("type")
-        
-        # Resolve promotion path based on content type
-        if content_type == "observation":
-            path_name = "observations_promoted"
-            filename_prefix = "observation"
-        elif content_type == "pattern":
-            path_name = "patterns_promoted"
-            filename_prefix = "pattern"
-        elif content_type == "summary":
-            path_name = "summaries_promoted"
-            filename_prefix = "summary"
-        elif content_type == "learning":
-            path_name = "learnings_promoted"
-            filename_prefix = "learning"
-        elif content_type == "decision":
-            path_name = "decisions_promoted"
-            filename_prefix = "decision"
-        elif content_type == "worklog":
-            path_name = "worklogs_promoted"
-            filename_prefix = "worklog"
-        else:
-            return {
-                "success": False,
-                "error": f"Content type '{content_type}' does not support promotion"
-            }
-        
-        # Get promotion directory
-        promotion_dir = get_path(path_name, ensure_exists=True)
-
-        # Project-aware nesting: derive project name from project_path
-        project_path_meta = metadata.get("project_path", "")
-        project_name = os.path.basename(project_path_meta) if project_path_meta else ""
-        if project_name:
-            promotion_dir = os.path.join(promotion_dir, project_name)
-            os.makedirs(promotion_dir, exist_ok=True)
-
-        # Generate filename with configured extension
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        name_slug = metadata.get("name", "unnamed").lower().replace(" ", "-")
-        ext = get_write_extension()
-        filename = f"{filename_prefix}-{name_slug}-{timestamp}{ext}"
-
-        # Build full path (relative to vault)
-        from .config import get_verified_vault_path
-        vault_path, error = get_verified_vault_path()
-        if error:
-            return {"success": False, "error": error}
-
-        relative_path = os.path.relpath(os.path.join(promotion_dir, filename), vault_path)
-        
-        # Check if file already exists (idempotency)
-        full_path = os.path.join(promotion_dir, filename)
-        if os.path.exists(full_path):
-            return {
-                "success": True,
-                "already_promoted": True,
-                "promoted_path": relative_path,
-                "reason": "File already exists",
-            }
-        
-        # Build frontmatter/properties in configured format
-        now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        tags = [tag.strip() for tag in metadata.get("tags", "").split(",") if tag.strip()]
-        write_fmt = get_write_format()
-
-        fm_dict = {
-            "type": content_type,
-            "importance": metadata.get('importance_score', '0.5'),
-            "original_id": doc_id,
-            "promoted_at": now_iso,
-            "source": metadata.get('source', 'unknown'),
-            "created_at": metadata.get('created_at', now_iso),
-            "retrieval_count": metadata.get('retrieval_count', '0'),
-        }
-
-        # Add optional fields
-        scope_meta = metadata.get("scope", "")
-        if scope_meta:
-            fm_dict["scope"] = scope_meta
-        if project_name:
-            fm_dict["project"] = project_name
-
-        files_meta = metadata.get("relevant_files", "")
-        if files_meta:
-            files_list = [f.strip() for f in files_meta.split(",") if f.strip()]
-            if files_list:
-                fm_dict["files"] = files_list
-
-        if tags:
-            fm_dict["tags"] = tags
-
-        frontmatter = generate_frontmatter(fm_dict, write_fmt)
-
-        # Combine frontmatter + content
-        file_content = frontmatter + "\n" + content
-        
-        # Write file via write_vault_file (reuse existing vault boundary safety)
-        write_result = write_vault_file(relative_path, file_content)
-        if not write_result["success"]:
-            return {
-                "success": False,
-                "error": f"Failed to write file: {write_result.get('error')}"
-            }
-        
-        # Delete old ChromaDB entry
-        collection.delete(ids=[doc_id])
-        
-        # Create new vault:: ID
-        new_vault_id = vault_id(relative_path)
-        
-        # Upsert with new ID and tier="file"
-        new_metadata = {**metadata}
-        new_metadata["tier"] = "file"
-        new_metadata["promoted"] = "true"
-        new_metadata["promoted_at"] = now_iso
-        new_metadata["original_tier2_id"] = doc_id
-        new_metadata["type"] = "vault"  # Universal type is now vault
-        new_metadata["vault_type"] = content_type  # Vault-specific type
-        new_metadata["namespace"] = "vault::"
-        
-        collection.upsert(
-            ids=[new_vault_id],
-            documents=[file_content],
-            metadatas=[new_metadata]
-        )
-        
+            })
+            continue
+        try:
+            result, upsert = _promote_one(doc_id, *record, vault_path, vault_error)
+        except Exception as e:
+            logger.error(f"promote failed: {e}")
+            result, upsert = {"success": False, "error": str(e)}, None
+        if upsert is not None:
+            pending.append((len(results), doc_id, *upsert))
+        results.append(result)
+
+    if pending:
+        try:
+            collection.delete(ids=[p[1] for p in pending])
+            collection.upsert(
+                ids=[p[2] for p in pending],
+                documents=[p[3] for p in pending],
+                metadatas=[p[4] for p in pending]
+            )
+            # The promoted files are indexed now; keep index_vault from
+            # re-chunking them while the existing-files cache is warm
+            _update_existing_files(added=[results[p[0]]["promoted_path"] for p in pending])
+        except Exception as e:
+            logger.error(f"promote failed: {e}")
+            for p in pending:
+                results[p[0]] = {"success": False, "error": str(e)}
+
+    return results
+
+
+def _promote_one(
+    doc_id: str,
+    content: str,
+    metadata: dict,
+    vault_path: str,
+    vault_error: str,
+) -> Tuple[dict, Optional[tuple]]:
+    """Validate one fetched document and write its promoted file.
+
+    Returns:
+        (result dict, upsert) where upsert is (new_id, file_content,
+        new_metadata) for the batched ChromaDB update, or None when
+        nothing needs to change in ChromaDB
+    """
+    from .file_ops import write_vault_file
+
+    # Verify Tier 2
+    tier = get_tier(doc_id)
+    if tier != TIER_CHROMADB:
+        return {
+            "success": False,
+            "error": f"Document {doc_id} is not Tier 2 (tier={tier})"
+        }, None
+    
+    # Check if already promoted
+    if metadata.get("promoted") == "true":
+        return {
+            "success": False,
+            "error": f"Document {doc_id} is already promoted",
+            "already_promoted": True,
+        }, None
+    
+    # Parse ID to get content type
+    parsed = parse_id(doc_id)
+    content_type = metadata.get("type")
+    
+    # Resolve promotion path based on content type
+    mapping = _PROMOTION_MAP.get(content_type)
+    if mapping is None:
+        return {
+            "success": False,
+            "error": f"Content type '{content_type}' does not support promotion"
+        }, None
+    path_name, filename_prefix = mapping
+
+    # Vault was verified once for the batch
+    if vault_error:
+        return {"success": False, "error": vault_error}, None
+
+    # Get promotion directory inside that verified vault
+    promotion_dir = get_path(path_name, ensure_exists=True, vault_path=vault_path)
+
+    # Project-aware nesting: derive project name from project_path
+    project_path_meta = metadata.get("project_path", "")
+    project_name = os.path.basename(project_path_meta) if project_path_meta else ""
+    if project_name:
+        promotion_dir = os.path.join(promotion_dir, project_name)
+        os.makedirs(promotion_dir, exist_ok=True)
+
+    # Generate filename with configured extension; one instant serves both
+    # the local-time filename stamp and the UTC frontmatter timestamps
+    now = datetime.now(timezone.utc)
+    now_iso = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    timestamp = now.astimezone().strftime("%Y%m%d-%H%M%S")
+    name_slug = metadata.get("name", "unnamed").translate(_SLUG_TABLE).lower()
+    ext = get_write_extension()
+    filename = f"{filename_prefix}-{name_slug}-{timestamp}{ext}"
+
+    # Build full path (relative to vault)
+    full_path = os.path.join(promotion_dir, filename)
+    relative_path = os.path.relpath(full_path, vault_path)
+    
+    # Check if file already exists (idempotency)
+    if os.path.exists(full_path):
         return {
             "success": True,
-            "original_id": doc_id,
+            "already_promoted": True,
             "promoted_path": relative_path,
-            "vault_id": new_vault_id,
-            "file_written": True,
-            "chromadb_updated": True,
-            "needs_git_commit": True,
-        }
-        
-    except Exception as e:
-        logger.error(f"promote failed: {e}")
-        return {"success": False, "error": str(e)}
+            "reason": "File already exists",
+        }, None
+    
+    # Build frontmatter/properties in configured format
+    tags = [tag for tag in map(str.strip, metadata.get("tags", "").split(",")) if tag]
+    write_fmt = get_write_format()
+
+    fm_dict = {
+        "type": content_type,
+        "importance": metadata.get('importance_score', '0.5'),
+        "original_id": doc_id,
+        "promoted_at": now_iso,
+        "source": metadata.get('source', 'unknown'),
+        "created_at": metadata.get('created_at', now_iso),
+        "retrieval_count": metadata.get('retrieval_count', '0'),
+    }
+
+    # Add optional fields
+    scope_meta = metadata.get("scope", "")
+    if scope_meta:
+        fm_dict["scope"] = scope_meta
+    if project_name:
+        fm_dict["project"] = project_name
+
+    files_meta = metadata.get("relevant_files", "")
+    if files_meta:
+        files_list = [f for f in map(str.strip, files_meta.split(",")) if f]
+        if files_list:
+            fm_dict["files"] = files_list
+
+    if tags:
+        fm_dict["tags"] = tags
+
+    frontmatter = generate_frontmatter(fm_dict, write_fmt)
+
+    # Combine frontmatter + content
+    file_content = f"{frontmatter}\n{content}"
+    
+    # Write file via write_vault_file (reuse existing vault boundary safety)
+    write_result = write_vault_file(relative_path, file_content)
+    if not write_result["success"]:
+        return {
+            "success": False,
+            "error": f"Failed to write file: {write_result.get('error')}"
+        }, None
+
+    # Create new vault:: ID
+    new_vault_id = vault_id(relative_path)
+    
+    # Metadata for the new ID with tier="file" (upserted by the caller)
+    new_metadata = {**metadata}
+    new_metadata["tier"] = "file"
+    new_metadata["promoted"] = "true"
+    new_metadata["promoted_at"] = now_iso
+    new_metadata["original_tier2_id"] = doc_id
+    new_metadata["type"] = "vault"  # Universal type is now vault
+    new_metadata["vault_type"] = content_type  # Vault-specific type
+    new_metadata["namespace"] = "vault::"
+
+    return {
+        "success": True,
+        "original_id": doc_id,
+        "promoted_path": relative_path,
+        "vault_id": new_vault_id,
+        "file_written": True,
+        "chromadb_updated": True,
+        "needs_git_commit": True,
+    }, (new_vault_id, file_content, new_metadata)
@@ -5,18 +5,49 @@ Uses the shared ChromaDB client from tools.memory.
 
 All document IDs use namespaced format (vault:: prefix) for type-safe identification.
 """
+import atexit
 import os
 import re
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
-from .memory import _get_collection
+from .memory import _get_collection, _SCAN_PAGE_SIZE
 from .paths import get_path, SENSITIVE_PATHS
 from .namespaces import parse_id, ALL_TYPES, get_tier, TIER_FILE, TIER_CHROMADB
 from .expansion import expand_query as _expand_query
 from .config import get_expansion_config, get_per_prompt_config
-from .format_support import detect_format
+from .format_support import detect_format, strip_frontmatter
+from .tier2 import retrieval_count_lock
+
+# Leading-heading and whitespace patterns for _extract_preview
+_MD_HEADING_RE = re.compile(r'^#+\s+.*$', re.MULTILINE)
+_ORG_HEADING_RE = re.compile(r'^\*+\s+.*$', re.MULTILINE)
+_ORG_TITLE_LINE_RE = re.compile(r'^#\+TITLE:.*$', re.MULTILINE)
+_WS_RE = re.compile(r'\s+')
+
+# Retrieval-count bumps run off the query path, one batch at a time in
+# submission order (the executor drains its queue at interpreter exit)
+_RETRIEVAL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis-retrieval")
+
+# Write-behind buffer for those bumps: doc_id -> pending delta, all for
+# _pending_collection. Flushed by size, by timer, or explicitly.
+_PENDING_COUNTS: dict[str, float] = {}
+_FLUSH_THRESHOLD = 50
+_FLUSH_INTERVAL = 5.0
+_pending_collection = None
+_pending_timer: Optional[threading.Timer] = None
+_pending_lock = threading.Lock()
+
+# Previews of recently surfaced documents: (doc_id, max_len, fmt) ->
+# (hash(content), preview). The content hash catches re-indexed documents.
+_PREVIEW_CACHE: dict[tuple[str, int, str], tuple[int, str]] = {}
+_PREVIEW_CACHE_MAX = 4096
+_preview_cache_lock = threading.Lock()
 
 
 def _detect_format_from_entry(entry: dict) -> str:
@@ -25,9 +56,20 @@ def _detect_format_from_entry(entry: dict) -> str:
     return detect_format(parent_file) if parent_file else "markdown"
 
 
+# Relevance boost per string importance level (when no importance_score)
+_IMPORTANCE_BOOST = {"high": 0.10, "critical": 0.12, "medium": 0.0, "low": -0.05}
+
+
+@lru_cache(maxsize=2048)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (trailing Z allowed); bulk indexing repeats them."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def _compute_relevance(distance: float, importance: str = "medium",
                        updated_at: Optional[str] = None,
-                       importance_score: Optional[float] = None) -> float:
+                       importance_score: Optional[float] = None,
+                       now: Optional[datetime] = None) -> float:
     """Convert ChromaDB cosine distance to relevance score with boosts.
 
     ChromaDB cosine distance ranges from 0 (identical) to 2 (opposite).
@@ -35,6 +77,8 @@ def _compute_relevance(distance: float, importance: str = "medium",
 
     When importance_score (float 0-1 from scoring module) is available, it
     provides a more nuanced boost than the string importance field.
+
+    Callers scoring many results pass a single UTC `now` for the batch.
     """
     base = 1.0 - (distance / 2.0)
 
@@ -43,14 +87,15 @@ def _compute_relevance(distance: float, importance: str = "medium",
         # Map 0.0-1.0 score to -0.12..+0.12 boost (centered at 0.5)
         boost = (importance_score - 0.5) * 0.24
     else:
-        boost = {"high": 0.10, "critical": 0.12, "medium": 0.0, "low": -0.05}.get(importance, 0.0)
+        boost = _IMPORTANCE_BOOST.get(importance, 0.0)
 
     # Recency boost: recent updates get a small relevance bump
     recency_boost = 0.0
     if updated_at:
         try:
-            updated = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-            now = datetime.now(timezone.utc)
+            updated = _parse_iso(updated_at)
+            if now is None:
+                now = datetime.now(timezone.utc)
             days_ago = (now - updated).total_seconds() / 86400
             if days_ago <= 1:
                 recency_boost = 0.08
@@ -67,18 +112,16 @@ def _extract_preview(content: str, max_len: int = 150, fmt: str = "markdown") ->
 
     Strips frontmatter/properties and leading headings, format-aware.
     """
-    from .format_support import strip_frontmatter
-
     stripped = strip_frontmatter(content, fmt)
     # Strip leading headings (both # and * styles)
     if fmt == "org":
-        stripped = re.sub(r'^\*+\s+.*$', '', stripped, count=1, flags=re.MULTILINE).strip()
+        stripped = _ORG_HEADING_RE.sub('', stripped, count=1).strip()
         # Strip #+TITLE lines
-        stripped = re.sub(r'^#\+TITLE:.*$', '', stripped, count=1, flags=re.MULTILINE).strip()
+        stripped = _ORG_TITLE_LINE_RE.sub('', stripped, count=1).strip()
     else:
-        stripped = re.sub(r'^#+\s+.*$', '', stripped, count=1, flags=re.MULTILINE).strip()
+        stripped = _MD_HEADING_RE.sub('', stripped, count=1).strip()
     # Collapse whitespace
-    stripped = re.sub(r'\s+', ' ', stripped).strip()
+    stripped = _WS_RE.sub(' ', stripped).strip()
 
     if len(stripped) <= max_len:
         return stripped
@@ -91,6 +134,26 @@ def _extract_preview(content: str, max_len: int = 150, fmt: str = "markdown") ->
     return truncated + "..."
 
 
+def _cached_preview(doc_id: str, content: str, max_len: int = 150,
+                    fmt: str = "markdown") -> str:
+    """_extract_preview, memoized per document ID and content."""
+    if not content:
+        return ""
+    key = (doc_id, max_len, fmt)
+    content_hash = hash(content)
+    cached = _PREVIEW_CACHE.get(key)
+    if cached is not None and cached[0] == content_hash:
+        return cached[1]
+
+    preview = _extract_preview(content, max_len=max_len, fmt=fmt)
+    with _preview_cache_lock:
+        _PREVIEW_CACHE.pop(key, None)
+        if len(_PREVIEW_CACHE) >= _PREVIEW_CACHE_MAX:
+            del _PREVIEW_CACHE[next(iter(_PREVIEW_CACHE))]
+        _PREVIEW_CACHE[key] = (content_hash, preview)
+    return preview
+
+
 def _translate_filter(filter_dict: Optional[dict]) -> Optional[dict]:
     """Translate clean filter dict to ChromaDB where syntax.
 
@@ -143,53 +206,44 @@ def _display_path(doc_id: str) -> str:
     return parsed.content_id
 
 
-def _increment_retrieval_counts(collection, doc_ids: list, increment: float = 1.0) -> None:
-    """Batch increment retrieval counts for Tier 2 documents.
-
-    Best-effort operation: errors are logged but don't block query response.
-    Only updates Tier 2 documents (Tier 1 doesn't track retrieval counts).
+def _apply_retrieval_increments(collection, deltas: dict) -> None:
+    """Add per-document deltas to retrieval_count in one get + update.
 
-    Args:
-        collection: ChromaDB collection
-        doc_ids: List of document IDs to increment
-        increment: Amount to add to retrieval_count (default 1.0).
-                   Use fractional values (e.g. 0.01) for passive surfacing.
+    Only the retrieval_count and updated_at keys are written; update merges
+    them into the stored metadata, so a concurrent tier2_write's fields are
+    never reverted. Documents (and their embeddings) are untouched.
     """
-    if not doc_ids:
-        return
-
     try:
         # Filter to only Tier 2 IDs
-        tier2_ids = [doc_id for doc_id in doc_ids if get_tier(doc_id) == TIER_CHROMADB]
+        tier2_ids = [doc_id for doc_id in deltas if get_tier(doc_id) == TIER_CHROMADB]
         if not tier2_ids:
             return
 
-        # Batch get current data
-        result = collection.get(ids=tier2_ids, include=["documents", "metadatas"])
-
-        # Increment counts
-        updated_ids = []
-        updated_docs = []
-        updated_metas = []
-
         now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        for i, doc_id in enumerate(result["ids"]):
-            metadata = result["metadatas"][i]
-            retrieval_count = float(metadata.get("retrieval_count", "0"))
-            retrieval_count = round(retrieval_count + increment, 2)
+        # Read-modify-write under the shared lock so concurrent bumps
+        # (e.g. tier2_read) cannot overwrite each other
+        with retrieval_count_lock:
+            # Batch get current metadata
+            result = collection.get(ids=tier2_ids, include=["metadatas"])
+
+            # Increment counts
+            updated_ids = []
+            updated_metas = []
 
-            updated_metadata = {**metadata}
-            updated_metadata["retrieval_count"] = str(retrieval_count)
-            updated_metadata["updated_at"] = now_iso
+            for doc_id, metadata in zip(result["ids"], result["metadatas"]):
+                retrieval_count = float(metadata.get("retrieval_count", "0"))
+                retrieval_count = round(retrieval_count + deltas[doc_id], 2)
 
-            updated_ids.append(doc_id)
-            updated_docs.append(result["documents"][i])
-            updated_metas.append(updated_metadata)
+                updated_ids.append(doc_id)
+                updated_metas.append({
+                    "retrieval_count": str(retrieval_count),
+                    "updated_at": now_iso,
+                })
 
-        # Batch upsert
-        if updated_ids:
-            collection.upsert(ids=updated_ids, documents=updated_docs, metadatas=updated_metas)
+            # Batch metadata update
+            if updated_ids:
+                collection.update(ids=updated_ids, metadatas=updated_metas)
 
     except Exception as e:
         # Log but don't fail query
@@ -198,6 +252,82 @@ def _increment_retrieval_counts(collection, doc_ids: list, increment: float = 1.
         logger.warning(f"Failed to increment retrieval counts: {e}")
 
 
+def _schedule_retrieval_increment(collection, doc_ids: list, increment: float = 1.0) -> None:
+    """Buffer retrieval-count increments for Tier 2 IDs (write-behind).
+
+    Repeated hits on a document coalesce into a single delta. The buffer is
+    written out once _FLUSH_THRESHOLD documents are pending, or at most
+    _FLUSH_INTERVAL seconds after the first buffered increment.
+    """
+    global _pending_collection, _pending_timer
+    tier2_ids = [doc_id for doc_id in doc_ids if get_tier(doc_id) == TIER_CHROMADB]
+    if not tier2_ids:
+        return
+
+    with _pending_lock:
+        if _pending_collection is not None and collection is not _pending_collection:
+            # Collection changed (e.g. new db_path): write out the old buffer
+            _submit_pending_locked()
+        _pending_collection = collection
+        for doc_id in dict.fromkeys(tier2_ids):
+            _PENDING_COUNTS[doc_id] = _PENDING_COUNTS.get(doc_id, 0.0) + increment
+
+        if len(_PENDING_COUNTS) >= _FLUSH_THRESHOLD:
+            _submit_pending_locked()
+        elif _pending_timer is None:
+            _pending_timer = threading.Timer(_FLUSH_INTERVAL, _flush_on_timer)
+            _pending_timer.daemon = True
+            _pending_timer.start()
+
+
+def _submit_pending_locked() -> None:
+    """Hand the buffered deltas to the worker. Caller holds _pending_lock."""
+    global _pending_collection, _pending_timer
+    if _pending_timer is not None:
+        _pending_timer.cancel()
+        _pending_timer = None
+    if _PENDING_COUNTS:
+        collection, deltas = _pending_collection, dict(_PENDING_COUNTS)
+        _PENDING_COUNTS.clear()
+        try:
+            _RETRIEVAL_EXECUTOR.submit(_apply_retrieval_increments, collection, deltas)
+        except RuntimeError:
+            # Executor already shut down (interpreter exit): apply inline
+            _apply_retrieval_increments(collection, deltas)
+    _pending_collection = None
+
+
+def _flush_on_timer() -> None:
+    """Timer callback: write out whatever is buffered."""
+    with _pending_lock:
+        _submit_pending_locked()
+
+
+def flush_retrieval_counts() -> None:
+    """Write out buffered increments and block until they have been applied."""
+    with _pending_lock:
+        _submit_pending_locked()
+    try:
+        _RETRIEVAL_EXECUTOR.submit(lambda: None).result()
+    except RuntimeError:
+        # Executor shut down: submissions were applied inline, nothing to wait on
+        pass
+
+
+def _flush_pending_at_exit() -> None:
+    """Apply buffered increments synchronously; the worker is gone by now."""
+    global _pending_collection
+    with _pending_lock:
+        collection, deltas = _pending_collection, dict(_PENDING_COUNTS)
+        _PENDING_COUNTS.clear()
+        _pending_collection = None
+    if deltas:
+        _apply_retrieval_increments(collection, deltas)
+
+
+atexit.register(_flush_pending_at_exit)
+
+
 def query_vault(query: str, n_results: int = 5,
                 filter: Optional[dict] = None) -> dict:
     """Semantic search across vault memory.
@@ -255,6 +385,7 @@ def query_vault(query: str, n_results: int = 5,
     documents = raw.get("documents", [[]])[0]
     metadatas = raw.get("metadatas", [[]])[0]
 
+    now = datetime.now(timezone.utc)
     for doc_id, distance, document, metadata in zip(ids, distances, documents, metadatas):
         meta = metadata or {}
         importance = meta.get("importance", "medium")
@@ -268,7 +399,7 @@ def query_vault(query: str, n_results: int = 5,
             except (ValueError, TypeError):
                 pass
 
-        relevance = _compute_relevance(distance, importance, updated_at, imp_score)
+        relevance = _compute_relevance(distance, importance, updated_at, imp_score, now)
 
         # Determine parent file for chunk dedup
         parent_file = meta.get("parent_file")
@@ -301,7 +432,7 @@ def query_vault(query: str, n_results: int = 5,
         meta = entry["metadata"]
         doc_id = entry["doc_id"]
         entry_fmt = _detect_format_from_entry(entry)
-        preview = _extract_preview(entry["document"], fmt=entry_fmt) if entry["document"] else ""
+        preview = _cached_preview(doc_id, entry["document"], fmt=entry_fmt)
         title = meta.get("title", doc_id)
         doc_type = meta.get("vault_type") or meta.get("type", "unknown")
         doc_importance = meta.get("importance", "medium")
@@ -332,7 +463,7 @@ def query_vault(query: str, n_results: int = 5,
         all_ids.append(doc_id)
 
     # Increment retrieval counts for Tier 2 results (best-effort, non-blocking)
-    _increment_retrieval_counts(collection, all_ids)
+    _schedule_retrieval_increment(collection, all_ids)
 
     response = {
         "success": True,
@@ -414,6 +545,7 @@ def semantic_context(query: str, threshold: float = 0.5,
 
     skipped_sensitive = 0
 
+    now = datetime.now(timezone.utc)
     for doc_id, distance, document, metadata in zip(ids, distances, documents, metadatas):
         meta = metadata or {}
 
@@ -433,7 +565,7 @@ def semantic_context(query: str, threshold: float = 0.5,
             except (ValueError, TypeError):
                 pass
 
-        relevance = _compute_relevance(distance, importance, updated_at, imp_score)
+        relevance = _compute_relevance(distance, importance, updated_at, imp_score, now)
 
         # Apply threshold
         if relevance < threshold:
@@ -503,7 +635,7 @@ def semantic_context(query: str, threshold: float = 0.5,
         passive_increment = per_prompt_config.get("passive_retrieval_increment", 0.01)
         if passive_increment > 0:
             surfaced_ids = [entry["doc_id"] for entry in selected]
-            _increment_retrieval_counts(collection, surfaced_ids, increment=passive_increment)
+            _schedule_retrieval_increment(collection, surfaced_ids, increment=passive_increment)
 
     matches = []
     for entry in selected:
@@ -520,7 +652,7 @@ def semantic_context(query: str, threshold: float = 0.5,
         else:
             # Tier 2: full content, no truncation
             entry_fmt = _detect_format_from_entry(entry)
-            content = _extract_preview(entry["document"], max_len=10000, fmt=entry_fmt) if entry["document"] else ""
+            content = _cached_preview(entry["doc_id"], entry["document"], max_len=10000, fmt=entry_fmt)
 
         match = {
             "source": entry["parent_file"],
@@ -666,22 +798,25 @@ def collection_stats(sample_size: int = 5, detailed: bool = False) -> dict:
     # Detailed breakdown
     if detailed:
         try:
-            all_meta = collection.get(include=["metadatas"])
-            type_counts = {}
-            namespace_counts = {}
-
-            for meta in all_meta.get("metadatas", []):
-                if not meta:
-                    continue
-                # Count by type
-                content_type = meta.get("type", "unknown")
-                type_counts[content_type] = type_counts.get(content_type, 0) + 1
-                # Count by namespace
-                ns = meta.get("namespace", "unknown")
-                namespace_counts[ns] = namespace_counts.get(ns, 0) + 1
-
-            result["type_breakdown"] = type_counts
-            result["namespace_breakdown"] = namespace_counts
+            type_counts = Counter()
+            namespace_counts = Counter()
+
+            # Metadata only, one page at a time (as memory._scan_existing_files)
+            offset = 0
+            while True:
+                page = collection.get(include=["metadatas"],
+                                      limit=_SCAN_PAGE_SIZE, offset=offset)
+                metas = [meta for meta in page.get("metadatas") or [] if meta]
+                # Count by type and by namespace
+                type_counts.update(meta.get("type", "unknown") for meta in metas)
+                namespace_counts.update(meta.get("namespace", "unknown") for meta in metas)
+
+                if len(page["ids"]) < _SCAN_PAGE_SIZE:
+                    break
+                offset += _SCAN_PAGE_SIZE
+
+            result["type_breakdown"] = dict(type_counts)
+            result["namespace_breakdown"] = dict(namespace_counts)
 
             # Storage size
             storage_bytes = 0
@@ -6,6 +6,7 @@ Content types: observation, pattern, summary, relationship, hint, plan.
 Tier 2 content can be promoted to Tier 1 (file-backed) via the promotion module.
 """
 import logging
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Optional
@@ -23,6 +24,10 @@ from .secret_scan import scan_for_secrets
 
 logger = logging.getLogger("jarvis-core")
 
+# Serializes retrieval_count read-modify-writes (query flushes run on a
+# background worker, tier2_read on the caller's thread)
+retrieval_count_lock = threading.Lock()
+
 VALID_CONTENT_TYPES = (
     "observation", "pattern", "summary", "code",
     "relationship", "hint", "plan", "learning", "decision", "worklog"
@@ -199,32 +204,32 @@ def tier2_read(doc_id: str) -> dict:
     """
     try:
         collection = _get_collection()
-        result = collection.get(ids=[doc_id])
-        
-        if not result["ids"]:
-            return {
-                "success": True,
-                "found": False,
-                "id": doc_id,
+        with retrieval_count_lock:
+            result = collection.get(ids=[doc_id])
+
+            if not result["ids"]:
+                return {
+                    "success": True,
+                    "found": False,
+                    "id": doc_id,
+                }
+
+            # Get current retrieval count and increment
+            metadata = result["metadatas"][0]
+            retrieval_count = float(metadata.get("retrieval_count", "0"))
+            retrieval_count += 1
+
+            # Update retrieval count and updated_at
+            now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            count_fields = {
+                "retrieval_count": str(retrieval_count),
+                "updated_at": now_iso,
             }
-        
-        # Get current retrieval count and increment
-        metadata = result["metadatas"][0]
-        retrieval_count = float(metadata.get("retrieval_count", "0"))
-        retrieval_count += 1
-        
-        # Update retrieval count and updated_at
-        now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        updated_metadata = {**metadata}
-        updated_metadata["retrieval_count"] = str(retrieval_count)
-        updated_metadata["updated_at"] = now_iso
-        
-        # Write back
-        collection.upsert(
-            ids=[doc_id],
-            documents=[result["documents"][0]],
-            metadatas=[updated_metadata]
-        )
+
+            # Write back only the changed keys: update merges them into the
+            # stored metadata, so a concurrent tier2_write is never reverted
+            collection.update(ids=[doc_id], metadatas=[count_fields])
+        updated_metadata = {**metadata, **count_fields}
         
         return {
             "success": True,